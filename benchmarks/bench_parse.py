@@ -0,0 +1,90 @@
+"""Time listing-page parsing: old full-tree html.parser path vs lxml + SoupStrainer
+
+Usage: python benchmarks/bench_parse.py [--cards 20 500 5000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scrape_unstop import CARD_SELECTORS, PARSER_BACKENDS, UnstopScraper
+from card_features import analyze_card
+from corpus import build_listing_html
+
+
+def parse_baseline(scraper, content):
+    """Pre-optimisation path: full html.parser tree, each helper analyses the card itself"""
+    soup = BeautifulSoup(content, 'html.parser')
+    cards = []
+    for selector in CARD_SELECTORS:
+        cards = soup.select(selector)
+        if cards:
+            break
+    for card in cards:
+        scraper.extract_dates(card)
+        scraper.extract_location(card)
+        scraper.extract_prizes(card)
+    return len(cards)
+
+
+def parse_optimised(scraper, content):
+    """Current path: strained parse, one analyze_card pass shared by every helper"""
+    soup, cards = scraper.parse_listing(content)
+    for card in cards:
+        features = analyze_card(card.get_text())
+        scraper.extract_dates(card, features)
+        scraper.extract_location(card, features)
+        scraper.extract_prizes(card, features)
+    return len(cards)
+
+
+def best_of(repeat, fn, *args):
+    """Fastest wall time over repeat runs, plus the last result"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Unstop listing parsing')
+    parser.add_argument('--cards', type=int, nargs='+', default=[20, 500, 5000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=None,
+                        help='Parser for the optimised path (default: scraper default)')
+    args = parser.parse_args()
+
+    scraper = UnstopScraper(parser=args.parser) if args.parser else UnstopScraper()
+    # The benchmark measures parsing, not the selector chatter
+    devnull = open(os.devnull, 'w')
+    results = []
+    for count in args.cards:
+        content = build_listing_html(count)
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            baseline, baseline_cards = best_of(args.repeat, parse_baseline, scraper, content)
+            optimised, optimised_cards = best_of(args.repeat, parse_optimised, scraper, content)
+        finally:
+            sys.stdout = stdout
+        results.append({
+            'cards': count,
+            'bytes': len(content),
+            'parser': scraper.parser,
+            'baseline_s': round(baseline, 4),
+            'optimised_s': round(optimised, 4),
+            'speedup': round(baseline / optimised, 2) if optimised else None,
+            'cards_found': [baseline_cards, optimised_cards],
+        })
+    devnull.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
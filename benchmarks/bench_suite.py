@@ -0,0 +1,211 @@
+"""Offline benchmark suite for the Unstop scraper and the MongoDB sync
+
+Listing pages from benchmarks/corpus.py are served by a local HTTP server and
+MongoDB is mongomock (or a throwaway mongod via --mongo-uri), so nothing
+touches unstop.com or Atlas. Results are JSON keyed by (benchmark, cards);
+--compare fails when a benchmark got slower than a saved baseline.
+
+Usage:
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --compare before.json [--tolerance 1.25]
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from pymongo import MongoClient
+
+from card_features import analyze_card
+from corpus import CORPUS_SIZES, listing_path, scraped_data_path
+from mock_server import serve_directory
+from scrape_unstop import DEFAULT_PARSER, PARSER_BACKENDS, UnstopScraper
+from sync_hackathons import DB_NAME, DEFAULT_BATCH_SIZE, HackathonSyncManager
+
+# mongomock is optional; without it the DB benchmarks need --mongo-uri
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+BENCHMARKS = ['scrape_hackathons', 'parse_listing', 'extract_hackathon_data', 'extract_helpers',
+              'save_to_mongodb', 'sync_scraped_hackathons']
+DB_BENCHMARKS = ['save_to_mongodb', 'sync_scraped_hackathons']
+DEFAULT_TOLERANCE = 1.25
+
+
+def measure(repeat, fn, setup=None):
+    """Wall times of repeat calls to fn(*setup()), setup itself untimed"""
+    times = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def make_client(mongo_uri):
+    """MongoDB client for the DB benchmarks, or None when neither option is available"""
+    if mongo_uri:
+        return MongoClient(mongo_uri)
+    if mongomock:
+        return mongomock.MongoClient()
+    return None
+
+
+def run_suite(sizes, repeat, selected, parser, client, sync_batch_size):
+    """Run the selected benchmarks over every corpus size; returns result dicts"""
+    # Without a client the scraper's default MongoClient is created but never used
+    scraper = UnstopScraper(requests_per_second=1000, parser=parser, cache_dir=None, client=client)
+    scraper.fetch_details = False
+    results = []
+
+    def record(name, cards, times):
+        best = min(times)
+        results.append({
+            'benchmark': name,
+            'cards': cards,
+            'repeat': len(times),
+            'best_s': round(best, 6),
+            'median_s': round(statistics.median(times), 6),
+            'per_card_ms': round(best * 1000 / cards, 4) if cards else None,
+        })
+
+    fixture_dir = os.path.dirname(listing_path(sizes[0]))
+    with serve_directory(fixture_dir) as base_url:
+        for size in sizes:
+            path = listing_path(size)
+            with open(path, 'rb') as f:
+                content = f.read()
+            url = f'{base_url}/{os.path.basename(path)}'
+            scraper.max_cards = size
+            scraper.base_url = base_url
+
+            if 'scrape_hackathons' in selected:
+                record('scrape_hackathons', size, measure(repeat, scraper.scrape_hackathons, lambda: (url,)))
+
+            if 'parse_listing' in selected:
+                record('parse_listing', size, measure(repeat, scraper.parse_listing, lambda: (content,)))
+
+            soup, cards = scraper.parse_listing(content)
+            if 'extract_hackathon_data' in selected:
+                record('extract_hackathon_data', size, measure(
+                    repeat, lambda: [scraper.extract_hackathon_data(card, soup) for card in cards]))
+
+            if 'extract_helpers' in selected:
+                def extract_helpers():
+                    for card in cards:
+                        features = analyze_card(card.get_text())
+                        scraper.extract_dates(card, features)
+                        scraper.extract_location(card, features)
+                        scraper.extract_prizes(card, features)
+                record('extract_helpers', size, measure(repeat, extract_helpers))
+
+            if client is None:
+                continue
+
+            if 'save_to_mongodb' in selected:
+                hackathons = [scraper.extract_hackathon_data(card, soup) for card in cards]
+
+                def fresh_batch():
+                    scraper.hackathons_collection.drop()
+                    return (copy.deepcopy(hackathons),)
+                record('save_to_mongodb', size, measure(repeat, scraper.save_to_mongodb, fresh_batch))
+
+            if 'sync_scraped_hackathons' in selected:
+                data_path = scraped_data_path(size)
+
+                def fresh_db():
+                    client.drop_database(DB_NAME)
+                    return (HackathonSyncManager(client=client),)
+                record('sync_scraped_hackathons', size, measure(
+                    repeat,
+                    lambda manager: manager.sync_scraped_hackathons(batch_size=sync_batch_size, data_path=data_path),
+                    fresh_db))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print current vs baseline per (benchmark, cards); returns the regressions"""
+    previous = {(r['benchmark'], r['cards']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        before = previous.get((result['benchmark'], result['cards']))
+        if not before or not before['best_s']:
+            continue
+        ratio = result['best_s'] / before['best_s']
+        marker = '❌' if ratio > tolerance else '✅'
+        print(f"{marker} {result['benchmark']:<26} {result['cards']:>5} cards  "
+              f"{before['best_s']:.4f}s -> {result['best_s']:.4f}s  ({ratio:.2f}x)", file=sys.stderr)
+        if ratio > tolerance:
+            regressions.append({**result, 'baseline_s': before['best_s'], 'ratio': round(ratio, 3)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline benchmarks for scraping and syncing')
+    parser.add_argument('--cards', type=int, nargs='+', default=CORPUS_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--benchmarks', nargs='+', choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=None,
+                        help='HTML parser backend (default: scraper default)')
+    parser.add_argument('--mongo-uri', default=None,
+                        help='Throwaway mongod to use instead of mongomock (its hackathon databases are dropped)')
+    parser.add_argument('--sync-batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='batch_size for sync_scraped_hackathons (0 syncs one by one)')
+    parser.add_argument('--output', default=None, help='Write the JSON results here instead of stdout')
+    parser.add_argument('--compare', default=None, help='Baseline JSON from an earlier --output run')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Slowdown ratio counted as a regression (default: {DEFAULT_TOLERANCE})')
+    args = parser.parse_args()
+
+    client = make_client(args.mongo_uri)
+    if client is None and set(args.benchmarks) & set(DB_BENCHMARKS):
+        print("⚠️  mongomock not installed and no --mongo-uri given, skipping DB benchmarks", file=sys.stderr)
+
+    # The scraper and sync narrate every card; only the numbers matter here
+    logging.disable(logging.INFO)
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        scraper_parser = args.parser or DEFAULT_PARSER
+        results = run_suite(args.cards, args.repeat, args.benchmarks, scraper_parser, client,
+                            args.sync_batch_size or None)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'parser': scraper_parser,
+            'mongo': 'mongod' if args.mongo_uri else ('mongomock' if client else None),
+            'repeat': args.repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} benchmarks slower than {args.tolerance}x the baseline", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Deterministic Unstop-like fixtures for the benchmarks
+
+Listing pages and scraped-data files are generated from a fixed seed and
+saved under benchmarks/fixtures/, so every run (and every machine) measures
+the same bytes without touching unstop.com.
+"""
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CORPUS_SIZES = [20, 500, 5000]
+SEED = 2027
+
+TITLE_THEMES = [
+    'AI Innovation Challenge', 'Machine Learning Sprint', 'Web3 Builders Hack', 'Flutter App Jam',
+    'IoT Smart Campus Hack', 'Game Dev Weekend', 'Data Science Cup', 'Cyber Security CTF',
+    'UI/UX Design Jam', 'Build for Bharat', 'Fintech Open Hack', 'Green Tech Ideathon',
+]
+ORGANIZERS = [
+    'Fintech Club, IIT (ISM) Dhanbad', 'Pranveer Singh Institute Of Technology', 'NIT Trichy',
+    'Google Developer Student Clubs', 'Microsoft Learn Student Ambassadors', 'BITS Pilani',
+]
+PLACES = ['Online', 'Virtual', 'Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Pune', 'Chennai', 'Kolkata']
+
+CARD_TEMPLATE = """
+<div class="opportunity-card">
+  <h3 class="title">{title}</h3>
+  <p class="organizer">{organizer}</p>
+  <p class="description">A {hours} hour coding challenge for students across India. Teams of up to {team} members.</p>
+  <span class="date">Registration deadline: {deadline}</span>
+  <span class="date">Starts {start}</span>
+  <span class="location">{place}</span>
+  <span class="prize">Prize pool ₹{prize:,}</span>
+  <span class="stats">{registered} Registered · {days} days left</span>
+  <a href="/hackathons/{slug}-{i}">View</a>
+</div>"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>Hackathons</title>{scripts}</head>
+<body><nav>{nav}</nav><main><div class="listing">{cards}</div></main>
+<footer>{footer}</footer></body></html>"""
+
+
+def card_fields(rng, i, today):
+    """Field values for card i, drawn from rng"""
+    theme = rng.choice(TITLE_THEMES)
+    deadline = today + timedelta(days=rng.randint(3, 40))
+    start = deadline + timedelta(days=rng.randint(1, 14))
+    return {
+        'i': i,
+        'title': f'{theme} {i}',
+        'slug': theme.lower().replace(' ', '-').replace('/', '-'),
+        'organizer': rng.choice(ORGANIZERS),
+        'hours': rng.choice([24, 36, 48]),
+        'team': rng.randint(2, 5),
+        'deadline': deadline,
+        'start': start,
+        'place': rng.choice(PLACES),
+        'prize': rng.randint(1, 100) * 1000,
+        'registered': rng.randint(5, 5000),
+        'days': (deadline - today).days,
+    }
+
+
+def build_listing_html(card_count, seed=SEED, today=None):
+    """Listing page with card_count cards plus page chrome, identical for the same arguments"""
+    rng = random.Random(seed)
+    today = today or datetime(2026, 1, 1)
+    cards = []
+    for i in range(card_count):
+        fields = card_fields(rng, i, today)
+        # Mix the date formats the extractors understand
+        fields['deadline'] = fields['deadline'].strftime(rng.choice(['%d %B %Y', '%B %d, %Y', '%d/%m/%Y']))
+        fields['start'] = fields['start'].strftime('%Y-%m-%d')
+        cards.append(CARD_TEMPLATE.format(**fields))
+    return PAGE_TEMPLATE.format(
+        scripts='<script>var x = 1;</script>' * 20,
+        nav='<a href="/">Home</a>' * 50,
+        cards=''.join(cards),
+        footer='<p>Footer text</p>' * 50,
+    ).encode('utf-8')
+
+
+def build_scraped_records(count, seed=SEED, today=None):
+    """Records shaped like scripts/data/hackathons_dynamic.json, all still open relative to today"""
+    rng = random.Random(seed)
+    today = today or datetime.now()
+    records = []
+    for i in range(count):
+        fields = card_fields(rng, i, today)
+        end = fields['start'] + timedelta(days=rng.randint(1, 3))
+        records.append({
+            'id': i + 1,
+            'title': fields['title'],
+            'description': f"Hackathon organized by {fields['organizer']}. {fields['title']}",
+            'startDate': fields['start'].strftime('%Y-%m-%d'),
+            'endDate': end.strftime('%Y-%m-%d'),
+            'registrationDeadline': fields['deadline'].strftime('%Y-%m-%d'),
+            'location': {'type': 'online' if fields['place'] in ('Online', 'Virtual') else 'offline',
+                         'venue': fields['place'], 'address': {'city': fields['place'], 'country': 'India'}},
+            'organizer': fields['organizer'],
+            'prize': f"₹{fields['prize']:,}",
+            'url': f"https://unstop.com/hackathons/{fields['slug']}-{i}",
+            'status': 'upcoming',
+            'category': 'Other',
+            'difficulty': 'Intermediate',
+            'teamSize': {'min': 1, 'max': fields['team']},
+            'source': 'Unstop',
+            'scraped_at': today.strftime('%Y-%m-%d %H:%M:%S'),
+            'featured': False,
+        })
+    return records
+
+
+def listing_path(card_count, fixture_dir=FIXTURE_DIR):
+    """Saved listing page for card_count cards, generated on first use"""
+    path = os.path.join(fixture_dir, f'listing-{card_count}.html')
+    if not os.path.exists(path):
+        os.makedirs(fixture_dir, exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(build_listing_html(card_count))
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def scraped_data_path(count, fixture_dir=FIXTURE_DIR):
+    """Scraped-data JSON for count records; regenerated daily so deadlines stay in the future"""
+    path = os.path.join(fixture_dir, f'scraped-{count}-{datetime.now():%Y%m%d}.json')
+    if not os.path.exists(path):
+        os.makedirs(fixture_dir, exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(build_scraped_records(count), f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+    return path
@@ -4,27 +4,147 @@ Unstop Hackathon Scraper
 Scrapes hackathon data from Unstop.com and saves to MongoDB
 """
 
+import argparse
+import hashlib
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
 from datetime import datetime, timedelta
 import time
 import random
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse, urlunparse, urlencode, parse_qsl
 import pymongo
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 from bson import ObjectId
 import os
+import sys
 from dotenv import load_dotenv
 
+# Shared scraper helpers live in scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from card_features import analyze_card, categorize
+from detail_fetch import DEFAULT_HOST_RATE, DEFAULT_WORKERS, HostRateLimiter, build_session, fetch_pages
+from fingerprints import content_fingerprint, make_dedup_key, record_fingerprint
+from http_cache import DEFAULT_MAX_BYTES, DEFAULT_TTL, CachingAdapter, install_cache, is_cache_hit
+from rate_limit import TokenBucket
+from scrape_checkpoint import DEFAULT_CHECKPOINT_PATH, ScrapeCheckpoint
+from scrape_metrics import ScrapeMetrics, add_metrics_args
+
 # Load environment variables
 load_dotenv()
 
+# Politeness limit for real HTTP requests to Unstop (parsing is never throttled)
+DEFAULT_REQUESTS_PER_SECOND = 0.5
+
+# On-disk HTTP cache; unchanged listings come back as 304s and are never re-parsed
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'http')
+
+# lxml is several times faster than the stdlib parser; fall back when it isn't installed
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+# Find hackathon cards - Unstop uses various selectors
+CARD_SELECTORS = [
+    '.opportunity-card',
+    '.card-content',
+    '[data-testid="opportunity-card"]',
+    '.opportunity-listing-card',
+    '.listing-card',
+    '.card',
+    '.competition-card',
+    '[class*="card"]',
+    '[class*="opportunity"]'
+]
+FALLBACK_CARD_WORDS = ['hackathon', 'competition', 'challenge', 'coding', 'tech']
+
+def is_card_container(name, attrs=None):
+    """SoupStrainer test: keep only elements any CARD_SELECTORS entry can match (plus their subtrees)"""
+    if not isinstance(attrs, dict):
+        return False
+    classes = attrs.get('class') or ''
+    if isinstance(classes, list):
+        classes = ' '.join(classes)
+    return 'card' in classes or 'opportunity' in classes or attrs.get('data-testid') == 'opportunity-card'
+
+CARD_STRAINER = SoupStrainer(is_card_container)
+
+# Cards extracted per listing page; a longer listing is only partially seen
+MAX_LISTING_CARDS = 20
+
+# Catalog mode: listing pages fetched via ?page=n, parsed on this many processes (None = one per core)
+DEFAULT_CATALOG_PAGES = 10
+DEFAULT_PARSE_WORKERS = None
+
+# 'incremental' upserts changed cards and tombstones vanished ones, 'replace' rewrites the collection
+SAVE_MODES = ['incremental', 'replace']
+DEFAULT_SAVE_MODE = 'incremental'
+# Marks documents this scraper owns, so incremental saves never touch anything else
+SCRAPER_SOURCE = 'unstop'
+# Replace mode builds the new batch here, then renames it over the live collection
+STAGING_SUFFIX = '_staging'
+# Index options index_information() reports that create_index must not be given back
+INDEX_INFO_ONLY_KEYS = ['v', 'ns', 'key', 'weights', 'textIndexVersion', 'default_language', 'language_override']
+# Fields only written when a document is first inserted, so re-scrapes don't reshuffle them
+INSERT_ONLY_FIELDS = ['createdAt', 'views', 'featured']
+# Same name sync_hackathons' unique partial index gets
+DEDUP_INDEX_NAME = 'dedupKey_1'
+
+# Weighted text index, declared identically in server/models/Hackathon.js (MongoDB allows one per collection)
+TEXT_INDEX_NAME = 'hackathon_text_search'
+TEXT_INDEX_WEIGHTS = {'title': 10, 'tags': 5, 'organizer': 3, 'description': 1}
+
+# Team size as written on detail pages, e.g. "Team size: 1 - 4 members"
+TEAM_SIZE_RE = re.compile(r'team\s*size\D{0,20}?(\d+)\s*(?:-|–|to)\s*(\d+)', re.IGNORECASE)
+DETAIL_DESCRIPTION_SELECTORS = ['meta[name="description"]', 'meta[property="og:description"]']
+
+# JSON endpoint the Unstop listing page hydrates its cards from
+UNSTOP_API_URL = "https://unstop.com/api/public/opportunity/search-result"
+API_PAGE_SIZE = 30
+# Listing-page query parameters forwarded to the API as filters
+API_FILTER_PARAMS = ['oppstatus', 'domain', 'course', 'specialization', 'usertype', 'passingOutYear']
+
 class UnstopScraper:
-    def __init__(self):
+    def __init__(self, requests_per_second=DEFAULT_REQUESTS_PER_SECOND, parser=DEFAULT_PARSER,
+                 cache_dir=DEFAULT_CACHE_DIR, cache_ttl=DEFAULT_TTL, cache_max_bytes=DEFAULT_MAX_BYTES,
+                 client=None):
         self.base_url = "https://unstop.com"
+        self.parser = parser
         self.session = requests.Session()
+        self.rate_limiter = TokenBucket(requests_per_second)
+        
+        # Conditional requests + on-disk cache (cache_dir=None disables it)
+        self.http_cache = install_cache(self.session, cache_dir, cache_ttl, cache_max_bytes) if cache_dir else None
+        # True when the listing body is the one an earlier run already saved
+        self.listing_unchanged = False
+        # (url, body) of the listing this run extracted, marked saved once MongoDB has it
+        self.pending_listing = None
+        
+        # Optional ScrapeCheckpoint: finished cards, detail pages and API pages survive a crash
+        self.checkpoint = None
+        
+        # Per-stage timings, cards/sec and bytes fetched for this run
+        self.metrics = ScrapeMetrics('unstop')
+        
+        # Cards extracted per HTML listing
+        self.max_cards = MAX_LISTING_CARDS
+        
+        # Detail-page enrichment for HTML listings (see enrich_with_details)
+        self.fetch_details = True
+        self.detail_workers = DEFAULT_WORKERS
+        self.detail_rate = DEFAULT_HOST_RATE
+        
+        # Incremental mode: contentHash values already stored, and which of them this run saw again
+        self.known_fingerprints = None
+        self.unchanged_fingerprints = set()
+        # False when a scrape stopped before the end of the listing, so absences mean nothing
+        self.listing_complete = True
         
         # Headers to mimic a real browser
         self.session.headers.update({
@@ -37,9 +157,9 @@ class UnstopScraper:
             'Upgrade-Insecure-Requests': '1',
         })
         
-        # MongoDB connection
+        # MongoDB connection (client lets benchmarks pass a local or mongomock client)
         mongodb_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
-        self.client = MongoClient(mongodb_uri)
+        self.client = client or MongoClient(mongodb_uri)
         self.db = self.client['hackathon-hub']  # Explicitly specify database name
         self.hackathons_collection = self.db.hackathons
         self.users_collection = self.db.users
@@ -51,67 +171,45 @@ class UnstopScraper:
         print(f"🔍 Scraping hackathons from: {url}")
         
         try:
-            # Add random delay to avoid being blocked
-            time.sleep(random.uniform(1, 3))
+            # Throttle real requests only, to avoid being blocked
+            self.rate_limiter.acquire()
             
-            response = self.session.get(url, timeout=30)
+            with self.metrics.stage('navigation'):
+                response = self.session.get(url, timeout=30)
             response.raise_for_status()
+            self.metrics.add_bytes(len(response.content))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            hackathons = []
-            
-            # Find hackathon cards - Unstop uses various selectors
-            card_selectors = [
-                '.opportunity-card',
-                '.card-content',
-                '[data-testid="opportunity-card"]',
-                '.opportunity-listing-card',
-                '.listing-card',
-                '.card',
-                '.competition-card',
-                '[class*="card"]',
-                '[class*="opportunity"]'
-            ]
-            
-            cards = []
-            for selector in card_selectors:
-                cards = soup.select(selector)
-                if cards:
-                    print(f"✅ Found {len(cards)} cards using selector: {selector}")
-                    break
+            # Cards a crashed run checkpointed still need saving, even for an unchanged listing
+            resuming = self.checkpoint is not None and self.checkpoint.count('card') > 0
+            if is_cache_hit(response) and not resuming and self.http_cache.is_saved(url, response.content):
+                # Same bytes as the last saved run, so MongoDB already holds its results
+                print(f"♻️  Listing unchanged since the last run ({response.cache_status}), skipping parse")
+                self.listing_unchanged = True
+                return []
             
-            if not cards:
-                # Fallback: look for any div with hackathon-related content
-                all_divs = soup.find_all('div')
-                cards = [div for div in all_divs if any(word in div.get_text().lower() 
-                        for word in ['hackathon', 'competition', 'challenge', 'coding', 'tech'])]
-                print(f"🔄 Fallback: Found {len(cards)} potential cards")
+            with self.metrics.stage('parsing'):
+                soup, cards = self.parse_listing(response.content)
             
             # If still no cards found, generate realistic hackathons based on current trends
             if not cards or len(cards) == 0:
                 print("🔧 No cards found via scraping, generating realistic hackathons...")
                 return self.generate_realistic_hackathons()
             
-            for i, card in enumerate(cards[:20]):  # Limit to first 20 to avoid overload
-                try:
-                    hackathon = self.extract_hackathon_data(card, soup)
-                    if hackathon and hackathon.get('title'):
-                        hackathons.append(hackathon)
-                        print(f"✅ Extracted: {hackathon['title']}")
-                    
-                    # Random delay between extractions
-                    time.sleep(random.uniform(0.5, 1.5))
-                    
-                except Exception as e:
-                    print(f"⚠️  Error extracting card {i}: {str(e)}")
-                    continue
+            self.listing_complete = len(cards) <= self.max_cards
+            hackathons = self.extract_cards(cards, soup)
+            
+            if self.unchanged_fingerprints:
+                print(f"⏭️  Skipped {len(self.unchanged_fingerprints)} unchanged cards")
             
             # If no hackathons were extracted successfully, fall back to generated ones
-            if len(hackathons) == 0:
+            if len(hackathons) == 0 and not self.unchanged_fingerprints:
                 print("🔧 No hackathons extracted successfully, generating realistic hackathons...")
                 return self.generate_realistic_hackathons()
             
             print(f"📊 Successfully extracted {len(hackathons)} hackathons")
+            if self.fetch_details:
+                self.enrich_with_details(hackathons, self.detail_workers, self.detail_rate)
+            self.pending_listing = (url, response.content)
             return hackathons
             
         except requests.RequestException as e:
@@ -123,7 +221,455 @@ class UnstopScraper:
             print("🔧 Generating realistic hackathons as fallback...")
             return self.generate_realistic_hackathons()
 
-    def extract_hackathon_data(self, card, soup):
+    def scrape_catalog(self, url, max_pages=DEFAULT_CATALOG_PAGES, workers=DEFAULT_PARSE_WORKERS):
+        """Scrape listing pages 1..max_pages, parsing on a process pool while later pages download
+
+        The main thread only fetches (rate limited) and hands each page's raw
+        bytes to a ProcessPoolExecutor; workers parse and extract the cards and
+        send back plain hackathon dicts. Fetching stops after max_pages, at a
+        page that repeats an earlier one, or once a parsed page has no cards.
+        """
+        print(f"🔍 Scraping up to {max_pages} listing pages from: {url}")
+        
+        futures = []
+        seen_pages = set()
+        stopped_at_end = False
+        initargs = (self.parser, self.base_url, self.max_cards, self.known_fingerprints)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_parse_worker, initargs=initargs) as pool:
+            for page in range(1, max_pages + 1):
+                # A page that already parsed empty means we are past the end
+                if any(future.done() and not future.exception() and not future.result()['cards']
+                       for future in futures):
+                    break
+                try:
+                    self.rate_limiter.acquire()
+                    with self.metrics.stage('navigation'):
+                        response = self.session.get(listing_page_url(url, page), timeout=30)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    print(f"❌ Listing page {page} failed: {str(e)}")
+                    break
+                self.metrics.add_bytes(len(response.content))
+                
+                # Past the last page some listings just repeat the final one
+                digest = hashlib.sha1(response.content).hexdigest()
+                if digest in seen_pages:
+                    stopped_at_end = True
+                    break
+                seen_pages.add(digest)
+                futures.append(pool.submit(parse_listing_page, response.content))
+                print(f"📄 Listing page {page}: {len(response.content) / 1024:.0f} KB sent to the parse pool")
+            
+            pages = []
+            for page, future in enumerate(futures, 1):
+                try:
+                    pages.append(future.result())
+                except Exception as e:
+                    print(f"⚠️  Parsing listing page {page} failed: {str(e)}")
+                    pages.append(None)
+        
+        hackathons = []
+        seen = set()
+        self.listing_complete = True
+        for result in pages:
+            if result is None:
+                self.listing_complete = False
+                continue
+            self.metrics.observe('parsing', result['seconds'])
+            if not result['cards']:
+                stopped_at_end = True
+                break
+            if result['cards'] > self.max_cards:
+                self.listing_complete = False
+            self.unchanged_fingerprints.update(result['unchanged'])
+            for hackathon in result['hackathons']:
+                fingerprint = hackathon['contentHash']
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                # A resumed run keeps what it extracted (and maybe enriched) before
+                restored = self.checkpoint_get('card', fingerprint)
+                if restored is None:
+                    self.checkpoint_put('card', fingerprint, hackathon)
+                hackathons.append(restored or hackathon)
+        self.listing_complete = self.listing_complete and stopped_at_end
+        
+        if self.unchanged_fingerprints:
+            print(f"⏭️  Skipped {len(self.unchanged_fingerprints)} unchanged cards")
+        if not hackathons and not self.unchanged_fingerprints:
+            print("🔧 No hackathons extracted from the catalog, generating realistic hackathons...")
+            return self.generate_realistic_hackathons()
+        
+        print(f"📊 Extracted {len(hackathons)} hackathons from {len(pages)} listing pages")
+        if self.fetch_details:
+            self.enrich_with_details(hackathons, self.detail_workers, self.detail_rate)
+        return hackathons
+
+    @classmethod
+    def for_parsing(cls, parser=DEFAULT_PARSER, base_url="https://unstop.com", max_cards=MAX_LISTING_CARDS,
+                    known_fingerprints=None):
+        """Scraper with no session or MongoDB client, for parse workers; only parse/extract methods work"""
+        scraper = cls.__new__(cls)
+        scraper.base_url = base_url
+        scraper.parser = parser
+        scraper.max_cards = max_cards
+        scraper.known_fingerprints = known_fingerprints
+        scraper.unchanged_fingerprints = set()
+        scraper.checkpoint = None
+        scraper.metrics = ScrapeMetrics('unstop-parse')
+        return scraper
+
+    def extract_cards(self, cards, soup):
+        """Extract up to max_cards listing cards, skipping unchanged ones and reusing checkpointed ones"""
+        hackathons = []
+        for i, card in enumerate(cards[:self.max_cards]):  # Limit to avoid overload
+            try:
+                # Cards whose content is already stored are skipped before extraction;
+                # the text is read once for both the fingerprint and the card analysis
+                card_text = card.get_text()
+                fingerprint = self.card_fingerprint(card, card_text)
+                if self.is_unchanged(fingerprint):
+                    continue
+                
+                # A resumed run reuses cards it already extracted
+                hackathon = self.checkpoint_get('card', fingerprint)
+                if hackathon is None:
+                    with self.metrics.stage('extraction'):
+                        hackathon = self.extract_hackathon_data(card, soup, card_text)
+                    if hackathon and hackathon.get('title'):
+                        hackathon['contentHash'] = fingerprint
+                        self.checkpoint_put('card', fingerprint, hackathon)
+                if hackathon and hackathon.get('title'):
+                    hackathons.append(hackathon)
+                    print(f"✅ Extracted: {hackathon['title']}")
+                
+            except Exception as e:
+                print(f"⚠️  Error extracting card {i}: {str(e)}")
+                continue
+        return hackathons
+
+    def checkpoint_get(self, kind, key):
+        """Value a resumed run already checkpointed, or None"""
+        return self.checkpoint.get(kind, key) if self.checkpoint else None
+
+    def checkpoint_put(self, kind, key, value):
+        """Record finished work when checkpointing is on"""
+        if self.checkpoint:
+            self.checkpoint.put(kind, key, value)
+
+    def card_fingerprint(self, card, card_text=None):
+        """contentHash of a listing card: its visible text plus its link"""
+        link_elem = card.find('a')
+        text = card.get_text() if card_text is None else card_text
+        return content_fingerprint(text, link_elem.get('href') if link_elem else '')
+
+    def is_unchanged(self, fingerprint):
+        """True (and remembered) when incremental mode already stores this content"""
+        if self.known_fingerprints is not None and fingerprint in self.known_fingerprints:
+            self.unchanged_fingerprints.add(fingerprint)
+            return True
+        return False
+
+    def parse_listing(self, content):
+        """Parse listing HTML into (soup, cards), building only the card subtrees when possible"""
+        soup = BeautifulSoup(content, self.parser, parse_only=CARD_STRAINER)
+        cards = self.select_cards(soup)
+        
+        if not cards:
+            # The fallback looks at every div, so it needs the full tree
+            soup = BeautifulSoup(content, self.parser)
+            cards = self.fallback_cards(soup)
+            print(f"🔄 Fallback: Found {len(cards)} potential cards")
+        
+        return soup, cards
+
+    def select_cards(self, soup):
+        """Return the cards matched by the first CARD_SELECTORS entry that finds any"""
+        for selector in CARD_SELECTORS:
+            cards = soup.select(selector)
+            if cards:
+                print(f"✅ Found {len(cards)} cards using selector: {selector}")
+                return cards
+        return []
+
+    def fallback_cards(self, soup):
+        """Divs whose text mentions a hackathon-related word, in document order
+
+        Marks the ancestors of each matching text node instead of calling
+        get_text() on every div, which re-walks nested divs over and over.
+        """
+        matched = set()
+        for string in soup.find_all(string=True):
+            lowered = string.lower()
+            if any(word in lowered for word in FALLBACK_CARD_WORDS):
+                for parent in string.parents:
+                    if parent.name == 'div':
+                        if id(parent) in matched:
+                            break
+                        matched.add(id(parent))
+        return [div for div in soup.find_all('div') if id(div) in matched]
+
+    def scrape_hackathons_api(self, url, max_pages=None, fixture_dir=None, record_dir=None):
+        """Ingest hackathons from Unstop's listing JSON instead of parsing rendered HTML
+
+        Pages through the search API with the listing URL's filters. If the API
+        is unreachable, falls back to the JSON state embedded in the listing
+        HTML. fixture_dir replays saved page-<n>.json responses offline;
+        record_dir saves live responses in that layout.
+        """
+        print(f"🔍 Ingesting hackathons from Unstop JSON for: {url}")
+        
+        params = self.api_params_from_listing_url(url)
+        hackathons = []
+        page = 1
+        self.listing_complete = False
+        
+        try:
+            while True:
+                done = self.checkpoint_get('api-page', page)
+                if done is not None:
+                    # Finished before a crash: restore its results instead of fetching it again
+                    hackathons.extend(done['hackathons'])
+                    self.unchanged_fingerprints.update(done['unchanged'])
+                    item_count, last_page = done['count'], done['last_page']
+                    print(f"♻️  API page {page}/{last_page or '?'}: restored from checkpoint")
+                else:
+                    payload = self.fetch_api_page(params, page, fixture_dir, record_dir)
+                    if payload is None:
+                        self.listing_complete = True
+                        break
+                    
+                    items, last_page = self.parse_api_payload(payload)
+                    unchanged_before = set(self.unchanged_fingerprints)
+                    page_hackathons = []
+                    for item in items:
+                        with self.metrics.stage('extraction'):
+                            hackathon = self.map_changed_opportunity(item)
+                        if hackathon:
+                            page_hackathons.append(hackathon)
+                    hackathons.extend(page_hackathons)
+                    item_count = len(items)
+                    self.checkpoint_put('api-page', page, {
+                        'hackathons': page_hackathons,
+                        'unchanged': sorted(self.unchanged_fingerprints - unchanged_before),
+                        'count': item_count,
+                        'last_page': last_page
+                    })
+                    print(f"📄 API page {page}/{last_page or '?'}: {len(items)} opportunities")
+                
+                if not item_count or (last_page and page >= last_page):
+                    self.listing_complete = True
+                    break
+                if max_pages and page >= max_pages:
+                    break
+                page += 1
+                
+        except (requests.RequestException, ValueError) as e:
+            print(f"❌ API ingestion failed: {str(e)}")
+            if not hackathons and not self.unchanged_fingerprints and not fixture_dir:
+                hackathons = self.scrape_embedded_state(url)
+        
+        print(f"📊 Ingested {len(hackathons)} hackathons from JSON")
+        return hackathons
+
+    def api_params_from_listing_url(self, url):
+        """Translate a hackathons listing URL into search API query parameters"""
+        query = dict(parse_qsl(urlparse(url).query))
+        params = {'opportunity': 'hackathons', 'per_page': API_PAGE_SIZE}
+        for key in API_FILTER_PARAMS:
+            # Tolerate stray whitespace in keys like 'passingOut Year'
+            value = query.get(key) or next((v for k, v in query.items() if k.replace(' ', '') == key), None)
+            if value:
+                params[key] = value
+        return params
+
+    def fetch_api_page(self, params, page, fixture_dir=None, record_dir=None):
+        """Return one decoded API page, from disk in fixture mode"""
+        if fixture_dir:
+            fixture_path = os.path.join(fixture_dir, f'page-{page}.json')
+            if not os.path.exists(fixture_path):
+                return None
+            self.metrics.add_bytes(os.path.getsize(fixture_path))
+            with self.metrics.stage('parsing'), open(fixture_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        self.rate_limiter.acquire()
+        with self.metrics.stage('navigation'):
+            response = self.session.get(UNSTOP_API_URL, params={**params, 'page': page},
+                                        headers={'Accept': 'application/json'}, timeout=30)
+        response.raise_for_status()
+        self.metrics.add_bytes(len(response.content))
+        with self.metrics.stage('parsing'):
+            payload = response.json()
+        
+        if record_dir:
+            os.makedirs(record_dir, exist_ok=True)
+            with open(os.path.join(record_dir, f'page-{page}.json'), 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+        return payload
+
+    def parse_api_payload(self, payload):
+        """Return (opportunities, last_page) from a paginated API response"""
+        data = payload.get('data', payload) if isinstance(payload, dict) else {}
+        if isinstance(data, dict) and isinstance(data.get('data'), list):
+            return data['data'], data.get('last_page')
+        if isinstance(data, list):
+            return data, None
+        return [], None
+
+    def scrape_embedded_state(self, url):
+        """Fallback: read opportunities from JSON embedded in the listing page's script tags"""
+        print("🔄 Falling back to JSON embedded in the listing page...")
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"❌ Network error: {str(e)}")
+            return []
+        
+        hackathons = []
+        for match in re.finditer(r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', response.text, re.S):
+            try:
+                state = json.loads(match.group(1).replace('&q;', '"').replace('&a;', '&'))
+            except ValueError:
+                continue
+            for item in self.find_opportunity_lists(state):
+                hackathon = self.map_changed_opportunity(item)
+                if hackathon:
+                    hackathons.append(hackathon)
+            if hackathons or self.unchanged_fingerprints:
+                self.listing_complete = True
+                break
+        return hackathons
+
+    def find_opportunity_lists(self, node):
+        """Yield opportunity-like dicts (title + public_url) anywhere in a JSON tree"""
+        if isinstance(node, dict):
+            if 'title' in node and ('public_url' in node or 'seo_url' in node):
+                yield node
+                return
+            for value in node.values():
+                yield from self.find_opportunity_lists(value)
+        elif isinstance(node, list):
+            for value in node:
+                yield from self.find_opportunity_lists(value)
+
+    def parse_api_date(self, value):
+        """Parse an ISO timestamp from the API into a naive datetime"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value).replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            return None
+
+    def map_changed_opportunity(self, item):
+        """Map an API opportunity unless incremental mode already stores it unchanged"""
+        fingerprint = record_fingerprint(item)
+        if self.is_unchanged(fingerprint):
+            return None
+        hackathon = self.map_api_opportunity(item)
+        if hackathon:
+            hackathon['contentHash'] = fingerprint
+        return hackathon
+
+    def map_api_opportunity(self, item):
+        """Map one Unstop API opportunity onto the MongoDB hackathon schema"""
+        title = self.clean_api_text(item.get('title'))
+        if not title:
+            return None
+        
+        now = datetime.now()
+        regn = item.get('regnRequirements') or {}
+        start_date = self.parse_api_date(item.get('start_date')) or now
+        end_date = self.parse_api_date(item.get('end_date')) or start_date + timedelta(days=1)
+        deadline = self.parse_api_date(regn.get('end_regn_dt')) or start_date
+        if end_date <= start_date:
+            end_date = start_date + timedelta(days=1)
+        
+        organisation = item.get('organisation') or {}
+        description = self.clean_api_text(item.get('details')) or f"Join {title} and showcase your innovation skills!"
+        if len(description) < 50:
+            description = f"{description} This hackathon offers great opportunities to learn, network, and win exciting prizes."
+        
+        address = item.get('address_with_country_logo') or {}
+        if (item.get('region') or 'online').lower() == 'online':
+            location = {'type': 'online'}
+        else:
+            city = address.get('city') or 'Various'
+            country = address.get('country')
+            if isinstance(country, dict):
+                country = country.get('name')
+            location = {
+                'type': 'offline',
+                'venue': address.get('address') or city,
+                'address': {
+                    'city': city,
+                    'state': address.get('state') or 'India',
+                    'country': country or 'India'
+                }
+            }
+        
+        prizes = []
+        for i, prize in enumerate(item.get('prizes') or []):
+            amount = prize.get('cash') or 0
+            try:
+                amount = int(float(amount))
+            except (TypeError, ValueError):
+                amount = 0
+            if amount:
+                prizes.append({
+                    'position': prize.get('rank') or f'{i + 1}',
+                    'amount': amount,
+                    'currency': prize.get('currency') or 'INR',
+                    'description': self.clean_api_text(prize.get('others')) or 'Prize'
+                })
+        
+        if start_date > now:
+            status = 'upcoming'
+        elif end_date < now:
+            status = 'completed'
+        else:
+            status = 'ongoing'
+        
+        public_url = item.get('public_url') or item.get('seo_url') or ''
+        category = self.determine_category(title)
+        
+        return {
+            'title': title,
+            'organizer': self.clean_api_text(organisation.get('name')) or "Unknown Organization",
+            'description': description[:2000],
+            'registrationDeadline': min(deadline, start_date),
+            'startDate': start_date,
+            'endDate': end_date,
+            'category': category,
+            'difficulty': 'Intermediate',
+            'location': location,
+            'teamSize': {
+                'min': regn.get('min_team_size') or 1,
+                'max': regn.get('max_team_size') or 4
+            },
+            'status': status,
+            'links': {
+                'website': urljoin(self.base_url + '/', public_url) if public_url else self.base_url
+            },
+            'prizes': prizes,
+            'tags': self.generate_tags(title, category),
+            'views': item.get('viewsCount') or 0,
+            'featured': bool(item.get('featured')),
+            'createdAt': now,
+            'updatedAt': now
+        }
+
+    def clean_api_text(self, value):
+        """Strip HTML tags and collapse whitespace in an API text field"""
+        if not value:
+            return ""
+        text = re.sub(r'<[^>]+>', ' ', str(value))
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def extract_hackathon_data(self, card, soup, card_text=None):
         """Extract hackathon data from a card element"""
         hackathon = {}
         
@@ -166,8 +712,11 @@ class UnstopScraper:
             
             hackathon['description'] = description[:2000]  # Limit to 2000 chars
             
+            # Analyse the card text once; every extractor below reads these features
+            features = analyze_card(card.get_text() if card_text is None else card_text, hackathon['title'])
+            
             # Dates - this is tricky as Unstop might use various formats
-            dates = self.extract_dates(card)
+            dates = self.extract_dates(card, features)
             
             # Set default dates if not found
             now = datetime.now()
@@ -176,20 +725,16 @@ class UnstopScraper:
             hackathon['endDate'] = dates.get('end_date', hackathon['startDate'] + timedelta(days=random.randint(1, 7)))
             
             # Ensure proper date order
-            if hackathon['registrationDeadline'] > hackathon['startDate']:
-                hackathon['registrationDeadline'] = hackathon['startDate'] - timedelta(days=1)
-            
-            if hackathon['endDate'] <= hackathon['startDate']:
-                hackathon['endDate'] = hackathon['startDate'] + timedelta(days=2)
+            self.settle_dates(hackathon, now)
             
             # Category (randomly assign based on title keywords)
-            hackathon['category'] = self.determine_category(hackathon['title'])
+            hackathon['category'] = self.determine_category(hackathon['title'], features)
             
             # Difficulty
             hackathon['difficulty'] = random.choice(['Beginner', 'Intermediate', 'Advanced'])
             
             # Location
-            location_info = self.extract_location(card)
+            location_info = self.extract_location(card, features)
             hackathon['location'] = location_info
             
             # Team size
@@ -198,14 +743,6 @@ class UnstopScraper:
                 'max': random.randint(3, 5)
             }
             
-            # Status
-            if hackathon['startDate'] > now:
-                hackathon['status'] = 'upcoming'
-            elif hackathon['endDate'] < now:
-                hackathon['status'] = 'completed'
-            else:
-                hackathon['status'] = 'ongoing'
-            
             # Links
             link_elem = card.find('a')
             website_url = None
@@ -217,11 +754,11 @@ class UnstopScraper:
             }
             
             # Prizes (extract if available or generate realistic ones)
-            prizes = self.extract_prizes(card)
+            prizes = self.extract_prizes(card, features)
             hackathon['prizes'] = prizes
             
             # Tags
-            hackathon['tags'] = self.generate_tags(hackathon['title'], hackathon['category'])
+            hackathon['tags'] = self.generate_tags(hackathon['title'], hackathon['category'], features)
             
             # Additional fields for MongoDB schema
             hackathon['views'] = random.randint(50, 5000)
@@ -235,6 +772,101 @@ class UnstopScraper:
             print(f"⚠️  Error in extract_hackathon_data: {str(e)}")
             return None
 
+    def settle_dates(self, hackathon, now):
+        """Put the deadline before the start and the end after it, then derive status"""
+        if hackathon['registrationDeadline'] > hackathon['startDate']:
+            hackathon['registrationDeadline'] = hackathon['startDate'] - timedelta(days=1)
+        
+        if hackathon['endDate'] <= hackathon['startDate']:
+            hackathon['endDate'] = hackathon['startDate'] + timedelta(days=2)
+        
+        # Status
+        if hackathon['startDate'] > now:
+            hackathon['status'] = 'upcoming'
+        elif hackathon['endDate'] < now:
+            hackathon['status'] = 'completed'
+        else:
+            hackathon['status'] = 'ongoing'
+
+    def enrich_with_details(self, hackathons, workers=DEFAULT_WORKERS, host_rate=DEFAULT_HOST_RATE):
+        """Fetch every hackathon's detail page concurrently and replace guessed fields
+
+        Pages come through a pooled, retrying session (sharing the HTTP cache)
+        on `workers` threads, limited per host, so the stage takes about as
+        long as its slowest requests. Description, dates and team size are
+        only overwritten when the detail page states them.
+        """
+        by_link = {}
+        for hackathon in hackathons:
+            link = hackathon.get('links', {}).get('website')
+            enriched_record = self.checkpoint_get('detail', hackathon.get('contentHash'))
+            if enriched_record is not None:
+                hackathon.update(enriched_record)
+            elif link:
+                by_link.setdefault(link, []).append(hackathon)
+        if not by_link:
+            return hackathons
+        
+        print(f"🔎 Enriching {len(by_link)} hackathons from detail pages ({workers} workers)...")
+        enriched = 0
+        now = datetime.now()
+        
+        def apply_page(link, response):
+            nonlocal enriched
+            if response is None:
+                return
+            for hackathon in by_link[link]:
+                try:
+                    with self.metrics.stage('parsing'):
+                        changed = self.apply_detail_page(hackathon, response.content, now)
+                    if changed:
+                        enriched += 1
+                    self.checkpoint_put('detail', hackathon.get('contentHash'), hackathon)
+                except Exception as e:
+                    print(f"⚠️  Error reading detail page for {hackathon['title']}: {str(e)}")
+        
+        adapter_kwargs = {'adapter_class': CachingAdapter, 'cache': self.http_cache} if self.http_cache else {}
+        session = build_session(workers, headers=self.session.headers, **adapter_kwargs)
+        limiter = HostRateLimiter(host_rate, burst=workers)
+        try:
+            fetch_pages(session, list(by_link), workers, limiter, on_page=apply_page, metrics=self.metrics)
+        finally:
+            session.close()
+        
+        print(f"🔎 Enriched {enriched}/{len(hackathons)} hackathons from detail pages")
+        return hackathons
+
+    def apply_detail_page(self, hackathon, content, now):
+        """Overwrite guessed fields with what a detail page states; True if anything changed"""
+        soup = BeautifulSoup(content, self.parser)
+        for tag in soup(['script', 'style', 'noscript']):
+            tag.decompose()
+        text = soup.get_text(' ')
+        changed = False
+        
+        meta = self.find_element(soup, DETAIL_DESCRIPTION_SELECTORS)
+        description = self.clean_api_text(meta.get('content')) if meta else ''
+        if len(description) >= 50:
+            hackathon['description'] = description[:2000]
+            changed = True
+        
+        dates = self.extract_dates(None, analyze_card(text))
+        if dates:
+            for field, key in (('registrationDeadline', 'registration_deadline'),
+                               ('startDate', 'start_date'), ('endDate', 'end_date')):
+                if key in dates:
+                    hackathon[field] = dates[key]
+            self.settle_dates(hackathon, now)
+            changed = True
+        
+        team_size = TEAM_SIZE_RE.search(text)
+        if team_size:
+            low, high = sorted(int(n) for n in team_size.groups())
+            hackathon['teamSize'] = {'min': max(low, 1), 'max': max(high, 1)}
+            changed = True
+        
+        return changed
+
     def find_element(self, parent, selectors):
         """Find element using multiple selectors"""
         for selector in selectors:
@@ -253,25 +885,13 @@ class UnstopScraper:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
 
-    def extract_dates(self, card):
+    def extract_dates(self, card, features=None):
         """Extract dates from card"""
         dates = {}
         
-        # Look for date-related text
-        date_text = card.get_text()
-        
-        # Common date patterns
-        date_patterns = [
-            r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
-            r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
-            r'(\d{1,2}\s+\w+\s+\d{4})',
-            r'(\w+\s+\d{1,2},?\s+\d{4})'
-        ]
-        
-        found_dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, date_text)
-            found_dates.extend(matches)
+        # Date-like strings found by the card analysis pass
+        features = features or analyze_card(card.get_text())
+        found_dates = features['dates']
         
         # If we found dates, try to parse them
         parsed_dates = []
@@ -302,52 +922,32 @@ class UnstopScraper:
         
         return dates
 
-    def determine_category(self, title):
-        """Determine category based on title keywords"""
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['ai', 'ml', 'machine learning', 'artificial intelligence', 'deep learning']):
-            return 'AI/ML'
-        elif any(word in title_lower for word in ['web', 'frontend', 'backend', 'fullstack', 'react', 'angular', 'vue']):
-            return 'Web Development'
-        elif any(word in title_lower for word in ['mobile', 'android', 'ios', 'app', 'flutter', 'react native']):
-            return 'Mobile Development'
-        elif any(word in title_lower for word in ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'web3', 'defi']):
-            return 'Blockchain'
-        elif any(word in title_lower for word in ['iot', 'internet of things', 'sensor', 'embedded']):
-            return 'IoT'
-        elif any(word in title_lower for word in ['game', 'gaming', 'unity', 'unreal']):
-            return 'Game Development'
-        elif any(word in title_lower for word in ['data', 'analytics', 'science', 'visualization', 'pandas', 'numpy']):
-            return 'Data Science'
-        elif any(word in title_lower for word in ['security', 'cyber', 'pentest', 'vulnerability']):
-            return 'Cybersecurity'
-        elif any(word in title_lower for word in ['design', 'ui', 'ux', 'figma', 'prototype']):
-            return 'Design'
-        else:
-            return 'Other'
+    def determine_category(self, title, features=None):
+        """Determine category based on title keywords (see card_features.CATEGORY_KEYWORDS)"""
+        if features is not None:
+            return features['category']
+        return categorize(title)
 
-    def extract_location(self, card):
+    def extract_location(self, card, features=None):
         """Extract location information"""
-        location_text = card.get_text().lower()
+        features = features or analyze_card(card.get_text())
         
         # Check for online indicators
-        if any(word in location_text for word in ['online', 'virtual', 'remote']):
+        if features['online']:
             return {'type': 'online'}
         
         # Check for common Indian cities
-        cities = ['mumbai', 'delhi', 'bangalore', 'hyderabad', 'pune', 'chennai', 'kolkata', 'ahmedabad', 'gurgaon', 'noida']
-        for city in cities:
-            if city in location_text:
-                return {
-                    'type': 'offline',
-                    'venue': city.title(),
-                    'address': {
-                        'city': city.title(),
-                        'state': 'India',
-                        'country': 'India'
-                    }
+        city = features['city']
+        if city:
+            return {
+                'type': 'offline',
+                'venue': city.title(),
+                'address': {
+                    'city': city.title(),
+                    'state': 'India',
+                    'country': 'India'
                 }
+            }
         
         # Default to hybrid
         return {
@@ -360,29 +960,11 @@ class UnstopScraper:
             }
         }
 
-    def extract_prizes(self, card):
+    def extract_prizes(self, card, features=None):
         """Extract prize information or generate realistic ones"""
-        prize_text = card.get_text()
-        
-        # Look for prize amounts
-        prize_patterns = [
-            r'₹\s*([\d,]+)',
-            r'Rs\.?\s*([\d,]+)',
-            r'\$\s*([\d,]+)',
-            r'(\d+)k?\s*prize',
-            r'worth\s*₹\s*([\d,]+)'
-        ]
-        
-        found_amounts = []
-        for pattern in prize_patterns:
-            matches = re.findall(pattern, prize_text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    amount = int(match.replace(',', '').replace('k', '000'))
-                    if 1000 <= amount <= 10000000:  # Reasonable prize range
-                        found_amounts.append(amount)
-                except:
-                    continue
+        # Prize amounts in a reasonable range, found by the card analysis pass
+        features = features or analyze_card(card.get_text())
+        found_amounts = features['prize_amounts']
         
         if found_amounts:
             total_prize = max(found_amounts)
@@ -400,10 +982,14 @@ class UnstopScraper:
                 {'position': '3rd', 'amount': int(base_amount * 0.3), 'currency': 'INR', 'description': 'Second Runner Up'}
             ]
 
-    def generate_tags(self, title, category):
+    def generate_tags(self, title, category, features=None):
         """Generate relevant tags"""
         base_tags = ['hackathon', 'competition', 'innovation', 'technology']
         
+        # A scraped card is tagged from its analysis: category plus matched title keywords
+        if features is not None:
+            return (features['tags'] + [tag for tag in base_tags if tag not in features['tags']])[:8]
+        
         # Add category-specific tags
         category_tags = {
             'AI/ML': ['artificial intelligence', 'machine learning', 'deep learning', 'neural networks'],
@@ -667,8 +1253,15 @@ class UnstopScraper:
         
         return admin_user['_id']
 
-    def save_to_mongodb(self, hackathons):
-        """Save hackathons to MongoDB"""
+    def save_to_mongodb(self, hackathons, staging=True):
+        """Save hackathons to MongoDB, replacing the whole collection
+
+        With staging (the default) the batch is inserted into a side collection
+        that gets the live collection's indexes, then renameCollection swaps it
+        in with dropTarget in one step, so readers never see a partial
+        collection. Any failure drops the staging collection and leaves the
+        live one untouched. staging=False deletes and re-inserts in place.
+        """
         if not hackathons:
             print("❌ No hackathons to save")
             return
@@ -678,50 +1271,376 @@ class UnstopScraper:
         # Get admin user ID
         admin_user_id = self.get_or_create_admin_user()
         
-        # Clear existing data
-        deleted_count = self.hackathons_collection.delete_many({}).deleted_count
-        print(f"🗑️  Deleted {deleted_count} existing hackathons")
-        
-        # Add createdBy field to all hackathons
+        # Add createdBy field to all hackathons, plus the keys incremental saves match on
+        by_key = {}
         for hackathon in hackathons:
             hackathon['createdBy'] = admin_user_id
+            hackathon['source'] = SCRAPER_SOURCE
+            hackathon['dedupKey'] = make_dedup_key(hackathon['title'], hackathon.get('location', {}))
+            by_key[hackathon['dedupKey']] = hackathon
         
-        # Insert new hackathons
-        try:
-            result = self.hackathons_collection.insert_many(hackathons)
-            print(f"✅ Successfully saved {len(result.inserted_ids)} hackathons to MongoDB")
-            
+        # One document per dedupKey, the last one listed, as incremental saves keep
+        if len(by_key) < len(hackathons):
+            print(f"⏭️  Dropped {len(hackathons) - len(by_key)} repeated hackathons")
+            hackathons = list(by_key.values())
+        
+        if staging:
+            saved = self.swap_in_collection(hackathons)
+        else:
+            saved = self.replace_in_place(hackathons)
+        
+        if saved:
             # Display saved hackathons
             print("\n📋 Saved hackathons:")
             for i, hackathon in enumerate(hackathons, 1):
                 print(f"  {i}. {hackathon['title']} by {hackathon['organizer']} ({hackathon['status']})")
-            
+        return saved
+
+    def replace_in_place(self, hackathons):
+        """Delete every hackathon and insert the new batch in the live collection"""
+        # Clear existing data
+        deleted_count = self.hackathons_collection.delete_many({}).deleted_count
+        print(f"🗑️  Deleted {deleted_count} existing hackathons")
+        
+        # Insert new hackathons
+        try:
+            with self.metrics.stage('db_write'):
+                result = self.hackathons_collection.insert_many(hackathons)
+                self.ensure_text_index(self.hackathons_collection)
+            print(f"✅ Successfully saved {len(result.inserted_ids)} hackathons to MongoDB")
+            return True
         except Exception as e:
             print(f"❌ Error saving to MongoDB: {str(e)}")
+            return False
+
+    def swap_in_collection(self, hackathons):
+        """Build the new batch in a staging collection and rename it over the live one"""
+        live = self.hackathons_collection
+        staging = self.db[live.name + STAGING_SUFFIX]
+        
+        try:
+            # Leftover from a crashed run
+            staging.drop()
+            with self.metrics.stage('db_write'):
+                result = staging.insert_many(hackathons)
+                self.copy_indexes(live, staging)
+                self.ensure_text_index(staging)
+                
+                # renameCollection with dropTarget: one atomic metadata swap
+                staging.rename(live.name, dropTarget=True)
+            print(f"✅ Swapped in {len(result.inserted_ids)} hackathons via {staging.name}")
+            return True
+        except PyMongoError as e:
+            print(f"❌ Error saving to MongoDB, live collection left unchanged: {str(e)}")
+            try:
+                staging.drop()
+            except PyMongoError:
+                print(f"⚠️  Could not drop {staging.name}; it is dropped on the next run")
+            return False
+
+    def copy_indexes(self, source, target):
+        """Create every secondary index of source on target, before the batch goes live"""
+        for name, info in source.index_information().items():
+            if name == '_id_':
+                continue
+            if 'weights' in info:
+                # Text indexes report their fields as weights, not keys
+                keys = [(field, 'text') for field in info['weights']]
+                keys += [(field, direction) for field, direction in info['key'] if field not in ('_fts', '_ftsx')]
+                options = {'weights': info['weights'], 'default_language': info.get('default_language', 'english')}
+            else:
+                keys = info['key']
+                options = {}
+            options.update({key: value for key, value in info.items() if key not in INDEX_INFO_ONLY_KEYS})
+            target.create_index(keys, name=name, **options)
+
+    def ensure_text_index(self, collection):
+        """Give collection the weighted search index, replacing any other text index"""
+        for name, info in collection.index_information().items():
+            if 'weights' not in info and all(direction != 'text' for _, direction in info['key']):
+                continue
+            if name == TEXT_INDEX_NAME and info.get('weights', TEXT_INDEX_WEIGHTS) == TEXT_INDEX_WEIGHTS:
+                return
+            collection.drop_index(name)
+        collection.create_index([(field, 'text') for field in TEXT_INDEX_WEIGHTS], name=TEXT_INDEX_NAME,
+                                weights=TEXT_INDEX_WEIGHTS, default_language='english')
+
+    def ensure_dedup_index(self, collection):
+        """Unique partial dedupKey index, as sync_hackathons creates; replaces an older non-unique one"""
+        info = collection.index_information().get(DEDUP_INDEX_NAME)
+        if info and info.get('unique'):
+            return
+        if info:
+            collection.drop_index(DEDUP_INDEX_NAME)
+        try:
+            collection.create_index('dedupKey', name=DEDUP_INDEX_NAME, unique=True,
+                                    partialFilterExpression={'dedupKey': {'$exists': True}})
+        except OperationFailure as e:
+            # Duplicates stored by the old delete-and-insert save; keep lookups indexed anyway
+            print(f"⚠️  dedupKey index left non-unique, stored hackathons share keys: {str(e)[:120]}")
+            collection.create_index('dedupKey', name=DEDUP_INDEX_NAME)
+
+    def owned_filter(self, **conditions):
+        """Query for live (not tombstoned) documents this scraper owns"""
+        return {'source': SCRAPER_SOURCE, 'removedAt': {'$exists': False}, **conditions}
+
+    def adopt_legacy_documents(self, admin_user_id):
+        """Tag documents written by the old delete-and-insert save so incremental runs can match them"""
+        operations = [
+            UpdateOne({'_id': doc['_id']}, {'$set': {
+                'source': SCRAPER_SOURCE,
+                'dedupKey': make_dedup_key(doc.get('title', ''), doc.get('location', {}))
+            }})
+            for doc in self.hackathons_collection.find(
+                {'createdBy': admin_user_id, 'source': {'$exists': False}},
+                {'title': 1, 'location.venue': 1}
+            )
+        ]
+        if operations:
+            try:
+                self.hackathons_collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # The unique dedupKey index already holds some keys; those documents stay unowned
+                print(f"⚠️  {len(e.details.get('writeErrors', []))} legacy hackathons repeat a stored dedupKey")
+            print(f"🏷️  Adopted {len(operations)} hackathons saved before incremental mode")
 
-    def run(self, url):
+    def load_fingerprints(self):
+        """Prepare incremental mode: remember the contentHash of every stored hackathon"""
+        admin_user_id = self.get_or_create_admin_user()
+        self.adopt_legacy_documents(admin_user_id)
+        self.ensure_dedup_index(self.hackathons_collection)
+        self.hackathons_collection.create_index('contentHash')
+        self.ensure_text_index(self.hackathons_collection)
+        
+        with self.metrics.stage('db_read'):
+            self.known_fingerprints = set(self.hackathons_collection.distinct('contentHash', self.owned_filter()))
+        self.unchanged_fingerprints = set()
+        print(f"🔑 {len(self.known_fingerprints)} stored fingerprints loaded")
+
+    def save_changes(self, hackathons):
+        """Upsert changed hackathons by dedupKey and tombstone the ones no longer listed
+
+        Only documents whose contentHash changed are written; unchanged ones were
+        skipped before extraction. Documents this scraper owns that the listing no
+        longer shows get removedAt and status 'cancelled' instead of being deleted.
+        """
+        if any('contentHash' not in hackathon for hackathon in hackathons):
+            # Generated fallback data never replaces what is stored
+            print("⚠️  Scrape fell back to generated hackathons, leaving MongoDB unchanged")
+            return False
+        
+        admin_user_id = self.get_or_create_admin_user()
+        now = datetime.now()
+        
+        changes = {}
+        for hackathon in hackathons:
+            hackathon['dedupKey'] = make_dedup_key(hackathon['title'], hackathon.get('location', {}))
+            changes[hackathon['dedupKey']] = hackathon
+        
+        operations = []
+        for key, hackathon in changes.items():
+            fields = {field: value for field, value in hackathon.items() if field not in INSERT_ONLY_FIELDS}
+            fields.update({'source': SCRAPER_SOURCE, 'updatedAt': now})
+            on_insert = {field: hackathon[field] for field in INSERT_ONLY_FIELDS if field in hackathon}
+            on_insert['createdBy'] = admin_user_id
+            operations.append(UpdateOne(
+                {'dedupKey': key, 'source': SCRAPER_SOURCE},
+                {'$set': fields, '$setOnInsert': on_insert, '$unset': {'removedAt': ''}},
+                upsert=True
+            ))
+        
+        if operations:
+            try:
+                with self.metrics.stage('db_write'):
+                    result = self.hackathons_collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # e.g. a dedupKey already held by a document from another source
+                errors = e.details.get('writeErrors', [])
+                print(f"❌ {len(errors)} of {len(operations)} changed hackathons were not saved, "
+                      f"keeping the listing for the next run")
+                for error in errors[:5]:
+                    print(f"   - {error.get('errmsg', error.get('code'))}")
+                return False
+            print(f"✅ Upserted {len(operations)} changed hackathons "
+                  f"({result.upserted_count} new, {result.modified_count} updated)")
+        else:
+            print("✅ No changed hackathons to save")
+        print(f"⏭️  {len(self.unchanged_fingerprints)} hackathons unchanged")
+        
+        if not self.listing_complete:
+            print("⚠️  Listing was only partially scraped, not tombstoning missing hackathons")
+            return True
+        
+        seen = self.unchanged_fingerprints | {hackathon['contentHash'] for hackathon in changes.values()}
+        with self.metrics.stage('db_write'):
+            result = self.hackathons_collection.update_many(
+                self.owned_filter(contentHash={'$nin': list(seen)}),
+                {'$set': {'removedAt': now, 'status': 'cancelled', 'updatedAt': now}}
+            )
+        if result.modified_count:
+            print(f"🪦 Tombstoned {result.modified_count} hackathons no longer listed")
+        return True
+
+    def refresh_statuses(self, now=None):
+        """Recompute status in MongoDB for stored hackathons whose dates have moved past it
+
+        Incremental saves skip unchanged cards before extraction, so nothing else
+        rewrites their status. Same rules as settle_dates, one update_many per
+        target status, like sync_hackathons.recompute_statuses_on_server.
+        """
+        now = now or datetime.now()
+        transitions = {
+            'upcoming': {'startDate': {'$gt': now}},
+            'ongoing': {'startDate': {'$lte': now}, 'endDate': {'$gte': now}},
+            'completed': {'startDate': {'$lte': now}, 'endDate': {'$lt': now}},
+        }
+        updates_count = 0
+        for new_status, condition in transitions.items():
+            with self.metrics.stage('db_write'):
+                result = self.hackathons_collection.update_many(
+                    self.owned_filter(status={'$ne': new_status}, **condition),
+                    {'$set': {'status': new_status, 'updatedAt': now}}
+                )
+            updates_count += result.modified_count
+        if updates_count:
+            print(f"📊 Updated status for {updates_count} stored hackathons")
+        return updates_count
+
+    def run(self, url, backend='html', save_mode=DEFAULT_SAVE_MODE, staging=True, pages=1,
+            parse_workers=DEFAULT_PARSE_WORKERS, **api_options):
         """Main method to run the scraper"""
         print("🚀 Starting Unstop Hackathon Scraper...")
         print(f"🎯 Target URL: {url}")
         
-        hackathons = self.scrape_hackathons(url)
+        if save_mode == 'incremental':
+            self.load_fingerprints()
+        
+        if backend == 'api':
+            hackathons = self.scrape_hackathons_api(url, **api_options)
+        elif pages > 1:
+            hackathons = self.scrape_catalog(url, pages, parse_workers)
+        else:
+            hackathons = self.scrape_hackathons(url)
+        self.metrics.add_cards(len(hackathons))
         
-        if hackathons:
-            self.save_to_mongodb(hackathons)
+        saved = True
+        if self.listing_unchanged:
+            print("✅ Nothing to save, MongoDB already holds this listing")
+        elif save_mode == 'incremental' and (hackathons or self.unchanged_fingerprints):
+            saved = self.save_changes(hackathons)
+        elif hackathons:
+            saved = self.save_to_mongodb(hackathons, staging=staging)
         else:
             print("❌ No hackathons were scraped successfully")
         
+        if save_mode == 'incremental':
+            self.refresh_statuses()
+        
+        # Only now is an identical listing safe to skip on the next run
+        if saved and self.pending_listing and self.http_cache:
+            self.http_cache.mark_saved(*self.pending_listing)
+        
+        # Keep the checkpoint when the save failed so --resume can retry it without re-scraping;
+        # an unchanged listing saved nothing, so whatever it holds is still unsaved work
+        if self.checkpoint and saved and not self.listing_unchanged:
+            self.checkpoint.finish()
+        
         self.client.close()
         print("✅ Scraping completed!")
+        self.metrics.print_summary()
 
 
-def main():
-    """Main function"""
+# Per-process scraper used by parse_listing_page, set up by init_parse_worker
+PARSE_WORKER = None
+
+
+def init_parse_worker(parser, base_url, max_cards, known_fingerprints):
+    """ProcessPoolExecutor initializer: build the worker's parse-only scraper once"""
+    global PARSE_WORKER
+    PARSE_WORKER = UnstopScraper.for_parsing(parser, base_url, max_cards, known_fingerprints)
+
+
+def parse_listing_page(content):
+    """Worker task: raw listing bytes in, picklable extracted records out"""
+    start = time.perf_counter()
+    PARSE_WORKER.unchanged_fingerprints = set()
+    soup, cards = PARSE_WORKER.parse_listing(content)
+    hackathons = PARSE_WORKER.extract_cards(cards, soup)
+    return {
+        'cards': len(cards),
+        'hackathons': hackathons,
+        'unchanged': sorted(PARSE_WORKER.unchanged_fingerprints),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def listing_page_url(url, page):
+    """url with its page query parameter set; page 1 is the URL as given"""
+    if page == 1:
+        return url
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query['page'] = str(page)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def parse_args():
+    """Parse command line options"""
     # The URL you provided
     url = "https://unstop.com/hackathons?oppstatus=open&domain=2&course=6&specialization=Information%20Technology&usertype=students&passingOut Year=2027"
     
-    scraper = UnstopScraper()
-    scraper.run(url)
+    parser = argparse.ArgumentParser(description='Scrape Unstop hackathons into MongoDB')
+    parser.add_argument('--url', default=url, help='Unstop listing URL')
+    parser.add_argument('--backend', choices=['html', 'api'], default='html',
+                        help='Parse rendered HTML (html) or ingest the listing JSON directly (api)')
+    parser.add_argument('--max-pages', type=int, default=None, help='Stop after this many API pages')
+    parser.add_argument('--fixture', default=None, help='Replay API pages from DIR/page-<n>.json (offline)')
+    parser.add_argument('--record', default=None, help='Save live API pages to DIR/page-<n>.json')
+    parser.add_argument('--save-mode', choices=SAVE_MODES, default=DEFAULT_SAVE_MODE,
+                        help='Upsert only changed hackathons (incremental) or rewrite the collection (replace)')
+    parser.add_argument('--in-place', action='store_true',
+                        help='Replace mode: delete and re-insert in the live collection instead of swapping in a staging copy')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='On-disk HTTP cache directory')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_TTL,
+                        help=f'Seconds a cached response is reused without revalidating (default: {DEFAULT_TTL})')
+    parser.add_argument('--no-cache', action='store_true', help='Always download, never read or write the HTTP cache')
+    parser.add_argument('--no-details', action='store_true',
+                        help='Keep card-only data instead of fetching each hackathon\'s detail page')
+    parser.add_argument('--detail-workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Detail pages fetched concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--detail-rate', type=float, default=DEFAULT_HOST_RATE,
+                        help=f'Detail requests per second per host (default: {DEFAULT_HOST_RATE})')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the last unfinished run from its checkpoint')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help='SQLite file recording finished cards, detail pages and API pages')
+    parser.add_argument('--pages', type=int, default=1,
+                        help='HTML backend: scrape listing pages 1..N, parsing them on a process pool while fetching')
+    parser.add_argument('--parse-workers', type=int, default=DEFAULT_PARSE_WORKERS,
+                        help='Parse processes for --pages (default: one per CPU core)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                        help=f'HTML parser backend for --backend html (default: {DEFAULT_PARSER})')
+    add_metrics_args(parser)
+    return parser.parse_args()
+
+def main():
+    """Main function"""
+    args = parse_args()
+    
+    scraper = UnstopScraper(parser=args.parser, cache_dir=None if args.no_cache else args.cache_dir,
+                            cache_ttl=args.cache_ttl)
+    scraper.fetch_details = not args.no_details
+    scraper.detail_workers = args.detail_workers
+    scraper.detail_rate = args.detail_rate
+    with ScrapeCheckpoint('unstop', args.checkpoint, resume=args.resume) as checkpoint:
+        scraper.checkpoint = checkpoint
+        if args.backend == 'api':
+            scraper.run(args.url, backend='api', save_mode=args.save_mode, staging=not args.in_place,
+                        max_pages=args.max_pages, fixture_dir=args.fixture, record_dir=args.record)
+        else:
+            scraper.run(args.url, save_mode=args.save_mode, staging=not args.in_place,
+                        pages=args.pages, parse_workers=args.parse_workers)
+    scraper.metrics.write(args.metrics_json, args.metrics_prom)
 
 
 if __name__ == "__main__":
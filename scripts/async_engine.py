@@ -0,0 +1,140 @@
+import asyncio
+from contextlib import asynccontextmanager
+from itertools import product
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from playwright.async_api import async_playwright
+
+from browser_pool import CARD_FIELDS_JS, PagePool, card_fields_args, to_card_tuples, wait_for_listing_async
+from rate_limit import AsyncTokenBucket
+from scrape_metrics import timed
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 2.0  # page loads per second across all pages
+
+
+def with_query(url, **params):
+    """Return url with the given query parameters set or replaced"""
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({key: str(value) for key, value in params.items()})
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def build_filter_urls(base_url, filters):
+    """Expand {'domain': [2, 3], 'passingOutYear': [2026, 2027]} into one listing URL per combination"""
+    filters = {key: values for key, values in filters.items() if values}
+    if not filters:
+        return [base_url]
+    keys = list(filters)
+    return [with_query(base_url, **dict(zip(keys, combo))) for combo in product(*filters.values())]
+
+
+@asynccontextmanager
+async def launch_pool(size, headless=True, resource_filter=None, metrics=None):
+    """Start one Chromium and yield a PagePool of `size` pages in a single context"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        context = await browser.new_context()
+        if resource_filter:
+            await resource_filter.install_async(context)
+        if metrics:
+            metrics.watch(context)
+        try:
+            async with PagePool(context, size) as pool:
+                yield pool
+        finally:
+            await context.close()
+            await browser.close()
+
+
+@asynccontextmanager
+async def launch_persistent_pool(size, user_data_dir, headless=True, resource_filter=None, metrics=None):
+    """launch_pool in a persistent context, so HTTP cache and cookies live on in user_data_dir"""
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(user_data_dir, headless=headless)
+        if resource_filter:
+            await resource_filter.install_async(context)
+        if metrics:
+            metrics.watch(context)
+        try:
+            async with PagePool(context, size) as pool:
+                yield pool
+        finally:
+            await context.close()
+
+
+async def extract_cards(page, card_selectors, fallback_selector, title_selectors, limit=None, metrics=None):
+    """Return (title, link, card_text) for the cards on an already loaded listing page, in one evaluate_all call"""
+    with timed(metrics, 'selector_wait'):
+        selector = await wait_for_listing_async(page, card_selectors)
+        cards = page.locator(selector or fallback_selector)
+        count = await cards.count()
+
+    if count == 0:
+        return []
+
+    with timed(metrics, 'extraction'):
+        raw_cards = await cards.evaluate_all(CARD_FIELDS_JS, card_fields_args(title_selectors, limit))
+    return to_card_tuples(raw_cards)
+
+
+async def scrape_urls(pool, limiter, urls, extract_page, metrics=None):
+    """Load every url on the pool and return [(url, extract_page(page, url) result)] in input order"""
+    async def scrape_one(url):
+        async with pool.page() as page:
+            await limiter.acquire()
+            try:
+                with timed(metrics, 'navigation'):
+                    await page.goto(url, wait_until="domcontentloaded")
+                return url, await extract_page(page, url)
+            except Exception as e:
+                print(f"⚠️ Error scraping {url}: {str(e)}")
+                return url, []
+
+    return await asyncio.gather(*(scrape_one(url) for url in urls))
+
+
+async def run_listing_scrape(urls, extract_page, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                             resource_filter=None, metrics=None):
+    """Scrape many listing URLs in parallel with one browser and bounded concurrency"""
+    limiter = AsyncTokenBucket(rate, burst=concurrency)
+    async with launch_pool(concurrency, resource_filter=resource_filter, metrics=metrics) as pool:
+        return await scrape_urls(pool, limiter, urls, extract_page, metrics)
+
+
+async def run_checkpointed_scrape(urls, extract_page, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                                  resource_filter=None, checkpoint=None, metrics=None):
+    """run_listing_scrape that records each finished URL and skips the ones a resumed run already has"""
+    if checkpoint is None:
+        return await run_listing_scrape(urls, extract_page, concurrency, rate, resource_filter, metrics)
+
+    done = {url: checkpoint.get('listing', url) for url in urls}
+    remaining = [url for url in urls if done[url] is None]
+    if len(remaining) < len(urls):
+        print(f"♻️ {len(urls) - len(remaining)} listings restored from checkpoint")
+
+    async def extract_and_record(page, url):
+        cards = await extract_page(page, url)
+        checkpoint.put('listing', url, cards)
+        return cards
+
+    scraped = {}
+    if remaining:
+        scraped = dict(await run_listing_scrape(remaining, extract_and_record, concurrency, rate, resource_filter,
+                                                metrics))
+    return [(url, done[url] if done[url] is not None else scraped.get(url, [])) for url in urls]
+
+
+def dedupe_cards(results):
+    """Flatten per-URL card lists, dropping repeats of the same link across filters"""
+    seen_links = set()
+    cards = []
+    for _, page_cards in results:
+        for card in page_cards:
+            link = card[1]
+            if link != "N/A" and link in seen_links:
+                continue
+            seen_links.add(link)
+            cards.append(card)
+    return cards
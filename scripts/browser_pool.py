@@ -0,0 +1,233 @@
+import asyncio
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+
+# How long to wait for listing cards to render before giving up
+LISTING_TIMEOUT_MS = 15000
+# Upper bound on waiting for network idle when no card selector has matched
+NETWORK_IDLE_TIMEOUT_MS = 5000
+
+
+def first_present_selector(page, selectors):
+    """Sync API: first selector with at least one match on the page"""
+    for selector in selectors:
+        if page.locator(selector).count() > 0:
+            return selector
+    return None
+
+
+def wait_for_listing(page, selectors, timeout=LISTING_TIMEOUT_MS):
+    """Sync API: return as soon as any card selector renders, instead of sleeping a fixed time"""
+    try:
+        page.wait_for_selector(', '.join(selectors), timeout=timeout)
+    except Exception:
+        # Nothing matched in time; let pending requests settle once before the caller falls back
+        try:
+            page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT_MS)
+        except Exception:
+            pass
+    return first_present_selector(page, selectors)
+
+
+async def first_present_selector_async(page, selectors):
+    """Async API: first selector with at least one match on the page"""
+    for selector in selectors:
+        if await page.locator(selector).count() > 0:
+            return selector
+    return None
+
+
+async def wait_for_listing_async(page, selectors, timeout=LISTING_TIMEOUT_MS):
+    """Async API counterpart of wait_for_listing"""
+    try:
+        await page.wait_for_selector(', '.join(selectors), timeout=timeout)
+    except Exception:
+        try:
+            await page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT_MS)
+        except Exception:
+            pass
+    return await first_present_selector_async(page, selectors)
+
+
+class PagePool:
+    """Fixed set of pages in one browser context, handed out to concurrent tasks"""
+
+    def __init__(self, context, size):
+        self.context = context
+        self.size = size
+        self.pages = []
+        self.available = asyncio.Queue()
+
+    async def open(self):
+        for _ in range(self.size):
+            page = await self.context.new_page()
+            self.pages.append(page)
+            self.available.put_nowait(page)
+        return self
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page for the duration of the block"""
+        page = await self.available.get()
+        try:
+            yield page
+        finally:
+            self.available.put_nowait(page)
+
+    async def close(self):
+        for page in self.pages:
+            await page.close()
+        self.pages = []
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+
+# Runs inside the page: one structured record per card element, so a whole
+# listing costs a single IPC round trip instead of several per card
+CARD_FIELDS_JS = """
+(cards, args) => {
+    const visible = el => !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+    const limit = args.limit === null ? cards.length : args.limit;
+    return cards.slice(0, limit).map(card => {
+        let title = null;
+        for (const selector of args.titleSelectors) {
+            const el = card.querySelector(selector);
+            if (visible(el)) {
+                const text = (el.textContent || '').trim();
+                if (text.length > 3) {
+                    title = text;
+                    break;
+                }
+            }
+        }
+        const link = card.querySelector('a');
+        return {
+            title: title,
+            href: link ? link.getAttribute('href') : null,
+            text: card.textContent || ''
+        };
+    });
+}
+"""
+
+
+def card_fields_args(title_selectors, limit=None):
+    """Argument object passed to CARD_FIELDS_JS"""
+    return {'titleSelectors': list(title_selectors), 'limit': limit}
+
+
+def to_card_tuples(raw_cards):
+    """Turn CARD_FIELDS_JS output into (title, link, card_text) tuples"""
+    results = []
+    for raw in raw_cards:
+        title = raw.get('title') or "Unknown Hackathon"
+        href = raw.get('href')
+        link = "N/A"
+        if href:
+            link = f'https://unstop.com{href}' if href.startswith('/') else href
+        results.append((title, link, raw.get('text') or ""))
+    return results
+
+
+def extract_card_fields(cards, title_selectors, limit=None):
+    """Sync API: (title, link, card_text) for every card in one evaluate_all call"""
+    return to_card_tuples(cards.evaluate_all(CARD_FIELDS_JS, card_fields_args(title_selectors, limit)))
+
+
+# Resource types the scrapers never need to read card text
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+# Third-party analytics / ad hosts aborted on every page
+TRACKER_HOSTS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'clarity.ms',
+    'mixpanel.com',
+    'segment.io',
+    'amplitude.com',
+    'moengage.com',
+    'webengage.com',
+    'branch.io',
+]
+
+# Rough average transfer size per blocked request, used to estimate bandwidth saved
+ESTIMATED_BYTES = {
+    'image': 45_000,
+    'media': 500_000,
+    'font': 35_000,
+    'tracker': 30_000,
+}
+
+
+class ResourceFilter:
+    """Abort images, media, fonts and tracker requests through Playwright request routing"""
+
+    def __init__(self, block_types=None, tracker_hosts=None):
+        self.block_types = set(BLOCKED_RESOURCE_TYPES if block_types is None else block_types)
+        self.tracker_hosts = list(TRACKER_HOSTS if tracker_hosts is None else tracker_hosts)
+        self.allowed = 0
+        self.blocked = {}
+
+    def block_reason(self, request):
+        """Return why a request should be aborted, or None to let it through"""
+        host = urlparse(request.url).hostname or ''
+        if any(host == tracker or host.endswith('.' + tracker) for tracker in self.tracker_hosts):
+            return 'tracker'
+        if request.resource_type in self.block_types:
+            return request.resource_type
+        return None
+
+    def _record(self, reason):
+        if reason:
+            self.blocked[reason] = self.blocked.get(reason, 0) + 1
+        else:
+            self.allowed += 1
+
+    def install(self, target):
+        """Sync API: route every request of a page or context through the filter"""
+        def handle(route):
+            reason = self.block_reason(route.request)
+            self._record(reason)
+            if reason:
+                route.abort()
+            else:
+                route.continue_()
+        target.route('**/*', handle)
+
+    async def install_async(self, target):
+        """Async API counterpart of install"""
+        async def handle(route):
+            reason = self.block_reason(route.request)
+            self._record(reason)
+            if reason:
+                await route.abort()
+            else:
+                await route.continue_()
+        await target.route('**/*', handle)
+
+    def stats(self):
+        blocked_total = sum(self.blocked.values())
+        return {
+            'allowed_requests': self.allowed,
+            'blocked_requests': blocked_total,
+            'blocked_by_type': dict(self.blocked),
+            'estimated_bytes_saved': sum(ESTIMATED_BYTES.get(reason, 0) * count
+                                         for reason, count in self.blocked.items()),
+        }
+
+    def print_summary(self):
+        stats = self.stats()
+        print(f"🚫 Blocked {stats['blocked_requests']} of {stats['blocked_requests'] + stats['allowed_requests']} requests "
+              f"(~{stats['estimated_bytes_saved'] / 1024:.0f} KB saved) {stats['blocked_by_type']}")
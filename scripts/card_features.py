@@ -0,0 +1,172 @@
+import re
+from bisect import bisect_right
+
+# Category keywords in priority order: the first category with a hit wins
+CATEGORY_KEYWORDS = [
+    ('AI/ML', ['ai', 'ml', 'machine learning', 'artificial intelligence', 'deep learning']),
+    ('Web Development', ['web', 'frontend', 'backend', 'fullstack', 'react', 'angular', 'vue']),
+    ('Mobile Development', ['mobile', 'android', 'ios', 'app', 'flutter', 'react native']),
+    ('Blockchain', ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'web3', 'defi']),
+    ('IoT', ['iot', 'internet of things', 'sensor', 'embedded']),
+    ('Game Development', ['game', 'gaming', 'unity', 'unreal']),
+    ('Data Science', ['data', 'analytics', 'science', 'visualization', 'pandas', 'numpy']),
+    ('Cybersecurity', ['security', 'cyber', 'pentest', 'vulnerability']),
+    ('Design', ['design', 'ui', 'ux', 'figma', 'prototype']),
+]
+DEFAULT_CATEGORY = 'Other'
+CATEGORIES = [label for label, _ in CATEGORY_KEYWORDS] + [DEFAULT_CATEGORY]
+
+ONLINE_WORDS = ['online', 'virtual', 'remote']
+CITIES = ['mumbai', 'delhi', 'bangalore', 'hyderabad', 'pune', 'chennai', 'kolkata', 'ahmedabad', 'gurgaon', 'noida']
+
+# Date patterns in priority order: extract_dates keeps the first few strings found,
+# so every match of one pattern comes before any match of the next
+DATE_PATTERNS = [
+    re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{4}'),
+    re.compile(r'\d{4}[-/]\d{1,2}[-/]\d{1,2}'),
+    re.compile(r'\d{1,2}\s+\w+\s+\d{4}'),
+    re.compile(r'\w+\s+\d{1,2},?\s+\d{4}'),
+]
+# Every prize pattern the extractors used to run one by one, as one alternation
+PRIZE_RE = re.compile(
+    r'worth\s*₹\s*([\d,]+)'
+    r'|₹\s*([\d,]+)'
+    r'|Rs\.?\s*([\d,]+)'
+    r'|\$\s*([\d,]+)'
+    r'|(\d+)k?\s*prize',
+    re.IGNORECASE
+)
+MIN_PRIZE = 1000
+MAX_PRIZE = 10000000
+
+
+class KeywordMatcher:
+    """Find which labelled keyword groups occur as substrings of a text in one scan
+
+    All keywords are compiled into a single lookahead alternation, longest
+    first, so finditer reports the longest keyword starting at every position.
+    Shorter keywords that are a prefix of the one found are implied, which keeps
+    the same hits as checking `word in text` for every word separately.
+    """
+
+    # Joins batch texts; no keyword contains it, so no match can span two texts
+    BATCH_SEPARATOR = '\x00'
+
+    def __init__(self, groups):
+        self.labels = [label for label, _ in groups]
+        self.labels_by_word = {}
+        for label, words in groups:
+            for word in words:
+                self.labels_by_word.setdefault(word, set()).add(label)
+
+        words = sorted(self.labels_by_word, key=len, reverse=True)
+        self.implied_words = {word: frozenset(w for w in words if word.startswith(w)) for word in words}
+        self.implied = {
+            word: frozenset().union(*(self.labels_by_word[w] for w in prefixes))
+            for word, prefixes in self.implied_words.items()
+        }
+        self.pattern = re.compile('(?=(' + '|'.join(re.escape(w) for w in words) + '))')
+
+    def labels_in(self, text):
+        """Set of labels with at least one keyword in (already lowercased) text"""
+        found = set()
+        for match in self.pattern.finditer(text):
+            found |= self.implied[match.group(1)]
+        return found
+
+    def words_in_batch(self, texts):
+        """Keywords present in each of texts (already lowercased), from one scan of the whole batch"""
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+
+        found = [set() for _ in texts]
+        for match in self.pattern.finditer(self.BATCH_SEPARATOR.join(texts)):
+            found[bisect_right(starts, match.start()) - 1] |= self.implied_words[match.group(1)]
+        return found
+
+    def first_label(self, text, default=None):
+        """Highest-priority label present in text"""
+        return self.first_of(self.labels_in(text), default)
+
+    def first_of(self, found, default=None):
+        """Highest-priority label out of a set of labels"""
+        for label in self.labels:
+            if label in found:
+                return label
+        return default
+
+    def labels_for(self, words):
+        """Labels of a set of keywords"""
+        return set().union(*(self.labels_by_word[word] for word in words))
+
+
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+LOCATION_MATCHER = KeywordMatcher([('online', ONLINE_WORDS)] + [(city, [city]) for city in CITIES])
+
+
+def categorize(title):
+    """Category for a title, by CATEGORY_KEYWORDS priority"""
+    return CATEGORY_MATCHER.first_label(title.lower(), DEFAULT_CATEGORY)
+
+
+def classify_batch(texts, default=DEFAULT_CATEGORY):
+    """Category and tags for every title in texts, matched in a single regex scan
+
+    Tags are the category followed by the keywords that matched, so
+    "Flutter App Jam" gives ['mobile development', 'app', 'flutter'].
+    """
+    results = []
+    for words in CATEGORY_MATCHER.words_in_batch([text.lower() for text in texts]):
+        category = CATEGORY_MATCHER.first_of(CATEGORY_MATCHER.labels_for(words), default)
+        results.append((category, category_tags(category, words)))
+    return results
+
+
+def category_tags(category, words):
+    """The category as a tag, then the keywords that matched"""
+    tag = category.lower()
+    return [tag] + sorted(set(words) - {tag})
+
+
+def find_dates(text):
+    """Date-like strings in text, grouped by DATE_PATTERNS priority"""
+    return [match for pattern in DATE_PATTERNS for match in pattern.findall(text)]
+
+
+def prize_amounts(text):
+    """Prize amounts in the plausible range mentioned in text"""
+    amounts = []
+    for match in PRIZE_RE.finditer(text):
+        value = next(group for group in match.groups() if group is not None)
+        try:
+            amount = int(value.replace(',', ''))
+        except ValueError:
+            continue
+        if MIN_PRIZE <= amount <= MAX_PRIZE:
+            amounts.append(amount)
+    return amounts
+
+
+def analyze_card(card_text, title=''):
+    """Compute everything the extractors need from a card's text in one pass
+
+    Returns a dict with the raw date strings, prize amounts, whether the card
+    looks online, the first known city mentioned, and the title's category
+    and tags (as classify_batch derives them).
+    """
+    lowered = card_text.lower()
+    places = LOCATION_MATCHER.labels_in(lowered)
+    words = CATEGORY_MATCHER.words_in_batch([title.lower()])[0] if title else set()
+    category = CATEGORY_MATCHER.first_of(CATEGORY_MATCHER.labels_for(words), DEFAULT_CATEGORY)
+    return {
+        'text': card_text,
+        'dates': find_dates(card_text),
+        'prize_amounts': prize_amounts(card_text),
+        'online': 'online' in places,
+        'city': next((city for city in CITIES if city in places), None),
+        'category': category,
+        'tags': category_tags(category, words),
+    }
@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limit import TokenBucket
+from scrape_metrics import timed
+
+# Detail pages fetched at once; also the connection pool size per host
+DEFAULT_WORKERS = 8
+# Requests per second allowed against any single host
+DEFAULT_HOST_RATE = 4.0
+DEFAULT_RETRIES = 3
+# Retry sleeps grow as backoff * 2 ** (attempt - 1): 0.5s, 1s, 2s
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+DETAIL_TIMEOUT = 20
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use"""
+
+    def __init__(self, rate=DEFAULT_HOST_RATE, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        """Block until a request to url's host is allowed"""
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
+
+
+def build_session(workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                  headers=None, adapter_class=HTTPAdapter, **adapter_kwargs):
+    """Session whose keep-alive pool fits `workers` threads, retrying transient failures with backoff"""
+    retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=RETRY_STATUSES,
+                  allowed_methods=['GET', 'HEAD'], respect_retry_after_header=True,
+                  raise_on_status=False)
+    adapter = adapter_class(pool_connections=workers, pool_maxsize=workers, max_retries=retry,
+                            **adapter_kwargs)
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def fetch_pages(session, urls, workers=DEFAULT_WORKERS, limiter=None, timeout=DETAIL_TIMEOUT,
+                on_page=None, metrics=None):
+    """Fetch every URL on a bounded thread pool; returns {url: response or None}
+
+    Duplicate URLs are fetched once. Failures (after the session's retries)
+    are printed and map to None so one bad page never sinks the batch.
+    on_page(url, response) runs on the calling thread as each page completes.
+    With metrics, each request is timed as 'navigation' and its body counted.
+    """
+    def fetch(url):
+        if limiter:
+            limiter.acquire(url)
+        try:
+            with timed(metrics, 'navigation'):
+                response = session.get(url, timeout=timeout)
+            response.raise_for_status()
+            if metrics:
+                metrics.add_bytes(len(response.content))
+            return response
+        except requests.RequestException as e:
+            print(f"⚠️  Detail page failed: {url} ({str(e)})")
+            return None
+
+    pages = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch, url): url for url in dict.fromkeys(urls)}
+        for future in as_completed(futures):
+            url = futures[future]
+            pages[url] = future.result()
+            if on_page:
+                on_page(url, pages[url])
+    return pages
@@ -1,13 +1,38 @@
 from playwright.sync_api import sync_playwright
-import json
-import time
-import os
+import argparse
+import asyncio
+import functools
 import re
 from datetime import datetime, timedelta
+from async_engine import (DEFAULT_CONCURRENCY, build_filter_urls, dedupe_cards, extract_cards,
+                          launch_pool, run_checkpointed_scrape, with_query)
+from browser_pool import ResourceFilter, extract_card_fields, wait_for_listing
+from card_features import DEFAULT_CATEGORY, classify_batch
+from rate_limit import AsyncTokenBucket
+from scrape_checkpoint import DEFAULT_CHECKPOINT_PATH, ScrapeCheckpoint
+from scrape_daemon import DaemonClient, add_daemon_args
+from scrape_metrics import ScrapeMetrics, add_metrics_args, timed
+from scrape_output import HackathonStreamWriter
 
 # Target URL for hackathons
 TARGET_URL = 'https://unstop.com/hackathons?oppstatus=open&domain=2&course=6&specialization=Information%20Technology&usertype=students&passingOutYear=2027'
 
+# Card selectors tried in order before falling back to FALLBACK_CARD_SELECTOR
+CARD_SELECTORS = [
+    'div.single_profile',
+    '.hackathon-card',
+    '.competition-card',
+    '[data-testid="hackathon-card"]',
+    '.card'
+]
+FALLBACK_CARD_SELECTOR = 'div:has(h3), div:has(h4), .card, [class*="hack"], [class*="competition"]'
+TITLE_SELECTORS = ['h2', 'h3', 'h4', '.title', '.card-title']
+
+# Pooled mode defaults
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_PAGES = 20
+DEFAULT_RATE = 2.0  # page loads per second across the whole pool
+
 def extract_date_from_text(text):
     """Extract date from text containing 'days left' or similar patterns"""
     try:
@@ -71,170 +96,157 @@ def determine_hackathon_status(deadline_date, start_date=None):
             return 'upcoming'
     return 'upcoming'
 
-def scrape_hackathons():
+def build_hackathon_info(index, title, link, card_text, detail_text="", category=DEFAULT_CATEGORY, tags=None):
+    """Build a hackathon record from the raw text scraped for one card"""
+    # Parse different fields from card text, falling back to the detail page
+    prize = extract_prize_from_text(card_text) or extract_prize_from_text(detail_text)
+    deadline_date = extract_date_from_text(card_text) or extract_date_from_text(detail_text)
+    location = extract_location_from_text(card_text)
+
+    # Determine status
+    status = determine_hackathon_status(deadline_date)
+
+    # Extract organizer (usually the institution name)
+    organizer = location if location else "Unstop"
+
+    # Create proper dates
+    start_date = None
+    end_date = None
+    if deadline_date:
+        # Assume hackathon starts 7 days after registration closes
+        deadline_dt = datetime.strptime(deadline_date, '%Y-%m-%d')
+        start_date = (deadline_dt + timedelta(days=7)).strftime('%Y-%m-%d')
+        end_date = (deadline_dt + timedelta(days=14)).strftime('%Y-%m-%d')
+
+    hackathon_info = {
+        "id": index,
+        "title": title,
+        "description": f"Hackathon organized by {organizer}. {title} - Exciting opportunity for developers and innovators.",
+        "startDate": start_date or "2024-12-01",  # Fallback date
+        "endDate": end_date or "2024-12-15",
+        "registrationDeadline": deadline_date or "2024-11-30",
+        "location": {
+            "type": "online",  # Most Unstop hackathons are online
+            "venue": location or "Online",
+            "address": {
+                "city": location or "Online",
+                "country": "India"
+            }
+        },
+        "organizer": organizer,
+        "prize": prize or "To be announced",
+        "url": link,
+        "status": status,
+        "category": category,
+        "tags": tags or [category.lower()],
+        "difficulty": "Intermediate",
+        "teamSize": {
+            "min": 1,
+            "max": 4
+        },
+        "source": "Unstop",
+        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "featured": False,
+        "isRegistrationOpen": status == 'upcoming',
+        "raw_text": card_text[:200]  # Keep some raw text for debugging
+    }
+
+    return hackathon_info
+
+def load_listing_cards(resource_filter=None, metrics=None):
+    """
+    Open the listing in Chromium and return raw (title, link, card_text) for every card
+    """
+    with sync_playwright() as p:
+        # Launch browser
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        if resource_filter:
+            resource_filter.install(page)
+        if metrics:
+            metrics.watch(page)
+
+        print(f"Navigating to Unstop...")
+        with timed(metrics, 'navigation'):
+            page.goto(TARGET_URL, wait_until="domcontentloaded")
+
+        # Wait until cards render (or the network settles) instead of a fixed sleep
+        with timed(metrics, 'selector_wait'):
+            selector = wait_for_listing(page, CARD_SELECTORS)
+        cards_found = selector is not None
+        if cards_found:
+            cards = page.locator(selector)
+            count = cards.count()
+            print(f"Found {count} cards using selector: {selector}")
+
+        if not cards_found:
+            print("⚠️ No cards found with standard selectors, trying alternative approach...")
+            cards = page.locator(FALLBACK_CARD_SELECTOR)
+            count = cards.count()
+            print(f"Found {count} potential cards with fallback selector")
+
+        if count == 0:
+            browser.close()
+            return []
+
+        # Process all cards (not limited to 8)
+        print(f"Processing {count} hackathon cards...")
+
+        # Title, link and text for every card in a single round trip
+        with timed(metrics, 'extraction'):
+            raw_cards = extract_card_fields(cards, TITLE_SELECTORS)
+        browser.close()
+        return raw_cards
+
+def scrape_hackathons(writer=None, block_resources=True, checkpoint=None, metrics=None, daemon=None):
     """
     Scrape hackathon data from Unstop with improved parsing
     """
     hackathon_data = []
+    # The daemon's browser has its own resource blocking setting
+    resource_filter = ResourceFilter() if block_resources and not daemon else None
 
     print("Starting improved hackathon scraper...")
 
     try:
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            print(f"Navigating to Unstop...")
-            page.goto(TARGET_URL, wait_until="domcontentloaded")
+        # A resumed run reuses the cards it already pulled off the listing
+        raw_cards = checkpoint.get('listing', TARGET_URL) if checkpoint else None
+        if raw_cards is None:
+            if daemon:
+                raw_cards = daemon.scrape('enhanced_scraper', [TARGET_URL], metrics=metrics)[0][1]
+            else:
+                raw_cards = load_listing_cards(resource_filter, metrics)
+            if checkpoint and raw_cards:
+                checkpoint.put('listing', TARGET_URL, raw_cards)
+            if resource_filter:
+                resource_filter.print_summary()
+        else:
+            print(f"Restored {len(raw_cards)} cards from checkpoint")
 
-            # Wait for page to load
-            time.sleep(3)
+        if not raw_cards:
+            print("No hackathon cards found on the page")
+            return []
 
-            # Try to find hackathon cards
-            card_selectors = [
-                'div.single_profile',
-                '.hackathon-card',
-                '.competition-card',
-                '[data-testid="hackathon-card"]',
-                '.card'
-            ]
+        # Categories and tags for every title in one pass
+        with timed(metrics, 'parsing'):
+            classified = classify_batch([title for title, _, _ in raw_cards])
 
-            cards_found = False
-            cards = None
+        for i, ((title, link, card_text), (category, tags)) in enumerate(zip(raw_cards, classified)):
+            try:
+                with timed(metrics, 'parsing'):
+                    hackathon_info = build_hackathon_info(i + 1, title, link, card_text,
+                                                          category=category, tags=tags)
+                status = hackathon_info['status']
+                prize = hackathon_info['prize']
 
-            for selector in card_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=5000)
-                    cards = page.locator(selector)
-                    count = cards.count()
-                    if count > 0:
-                        print(f"Found {count} cards using selector: {selector}")
-                        cards_found = True
-                        break
-                except:
-                    continue
-
-            if not cards_found:
-                print("⚠️ No cards found with standard selectors, trying alternative approach...")
-                cards = page.locator('div:has(h3), div:has(h4), .card, [class*="hack"], [class*="competition"]')
-                count = cards.count()
-                print(f"Found {count} potential cards with fallback selector")
-
-            if count == 0:
-                print("No hackathon cards found on the page")
-                browser.close()
-                return []
-
-            # Process all cards (not limited to 8)
-            print(f"Processing {count} hackathon cards...")
-
-            for i in range(count):
-                try:
-                    card = cards.nth(i)
-
-                    # Extract title from h2 element
-                    title = "Unknown Hackathon"
-                    try:
-                        title_elem = card.locator('h2').first
-                        if title_elem.is_visible():
-                            title_text = title_elem.text_content().strip()
-                            if title_text and len(title_text) > 3:
-                                title = title_text
-                    except:
-                        # Fallback to other selectors
-                        title_selectors = ['h3', 'h4', '.title', '.card-title']
-                        for title_sel in title_selectors:
-                            try:
-                                title_elem = card.locator(title_sel).first
-                                if title_elem.is_visible():
-                                    title_text = title_elem.text_content().strip()
-                                    if title_text and len(title_text) > 3:
-                                        title = title_text
-                                        break
-                            except:
-                                continue
-
-                    # Extract link
-                    link = "N/A"
-                    try:
-                        link_elem = card.locator('a').first
-                        href = link_elem.get_attribute('href')
-                        if href:
-                            link = f'https://unstop.com{href}' if href.startswith('/') else href
-                    except:
-                        pass
-
-                    # Get full card text for parsing
-                    card_text = ""
-                    try:
-                        card_text = card.text_content()
-                    except:
-                        pass
-
-                    # Parse different fields from card text
-                    prize = extract_prize_from_text(card_text)
-                    deadline_date = extract_date_from_text(card_text)
-                    location = extract_location_from_text(card_text)
-
-                    # Determine status
-                    status = determine_hackathon_status(deadline_date)
-
-                    # Extract organizer (usually the institution name)
-                    organizer = location if location else "Unstop"
-
-                    # Create proper dates
-                    start_date = None
-                    end_date = None
-                    if deadline_date:
-                        # Assume hackathon starts 7 days after registration closes
-                        deadline_dt = datetime.strptime(deadline_date, '%Y-%m-%d')
-                        start_date = (deadline_dt + timedelta(days=7)).strftime('%Y-%m-%d')
-                        end_date = (deadline_dt + timedelta(days=14)).strftime('%Y-%m-%d')
-
-                    hackathon_info = {
-                        "id": i + 1,
-                        "title": title,
-                        "description": f"Hackathon organized by {organizer}. {title} - Exciting opportunity for developers and innovators.",
-                        "startDate": start_date or "2024-12-01",  # Fallback date
-                        "endDate": end_date or "2024-12-15",
-                        "registrationDeadline": deadline_date or "2024-11-30",
-                        "location": {
-                            "type": "online",  # Most Unstop hackathons are online
-                            "venue": location or "Online",
-                            "address": {
-                                "city": location or "Online",
-                                "country": "India"
-                            }
-                        },
-                        "organizer": organizer,
-                        "prize": prize or "To be announced",
-                        "url": link,
-                        "status": status,
-                        "category": "Technology",
-                        "difficulty": "Intermediate",
-                        "teamSize": {
-                            "min": 1,
-                            "max": 4
-                        },
-                        "source": "Unstop",
-                        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "featured": False,
-                        "isRegistrationOpen": status == 'upcoming',
-                        "raw_text": card_text[:200]  # Keep some raw text for debugging
-                    }
-
-                    hackathon_data.append(hackathon_info)
-                    print(f"{i+1}. {title[:50]}... | Status: {status} | Prize: {prize}")
-
-                    # Small delay between cards
-                    time.sleep(0.5)
+                hackathon_data.append(hackathon_info)
+                if writer:
+                    writer.write(hackathon_info)
+                print(f"{i+1}. {title[:50]}... | Status: {status} | Prize: {prize}")
 
-                except Exception as e:
-                    print(f"Error processing card {i+1}: {str(e)}")
-                    continue
-
-            browser.close()
+            except Exception as e:
+                print(f"Error processing card {i+1}: {str(e)}")
+                continue
 
         print(f"Successfully scraped {len(hackathon_data)} hackathons!")
         return hackathon_data
@@ -243,19 +255,162 @@ def scrape_hackathons():
         print(f"Fatal error during scraping: {str(e)}")
         return []
 
-def save_hackathons(data):
-    """Save hackathon data to JSON file"""
+async def extract_page_cards(page, url, metrics=None):
+    """Async extraction step: raw (title, link, card_text) for every card on a listing page"""
+    return await extract_cards(page, CARD_SELECTORS, FALLBACK_CARD_SELECTOR, TITLE_SELECTORS, metrics=metrics)
+
+def card_key(card):
+    """What makes a listing card repeat one already seen: its link, or its title when it has none"""
+    title, link, _ = card
+    return ('title', title) if link == "N/A" else ('link', link)
+
+async def scrape_hackathons_pooled_async(pool_size, max_pages, rate, fetch_details, resource_filter=None,
+                                        checkpoint=None, metrics=None, writer=None):
+    """Scrape paginated listings and detail pages concurrently over a pool of pages
+
+    Listing pages go out in waves of pool_size, so the first page that loads
+    but adds nothing new stops the run without loading the pages after its
+    wave. A listing page that fails to load raises instead, so a truncated
+    catalog never passes for a finished one. Each listing page's records are
+    written as soon as its detail pages are in.
+    """
+    limiter = AsyncTokenBucket(rate, burst=pool_size)
+    hackathon_data = []
+
+    async with launch_pool(pool_size, resource_filter=resource_filter, metrics=metrics) as pool:
+        async def scrape_listing(page_number):
+            url = with_query(TARGET_URL, page=page_number)
+            cards = checkpoint.get('listing', url) if checkpoint else None
+            if cards is not None:
+                print(f"Listing page {page_number}: {len(cards)} cards (checkpoint)")
+                return cards
+            async with pool.page() as page:
+                await limiter.acquire()
+                try:
+                    with timed(metrics, 'navigation'):
+                        await page.goto(url, wait_until="domcontentloaded")
+                    cards = await extract_page_cards(page, url, metrics)
+                    if checkpoint:
+                        checkpoint.put('listing', url, cards)
+                except Exception as e:
+                    print(f"Error loading listing page {page_number}: {str(e)}")
+                    return None
+            print(f"Listing page {page_number}: {len(cards)} cards")
+            return cards
+
+        async def scrape_detail(link):
+            if not fetch_details or link == "N/A":
+                return ""
+            detail_text = checkpoint.get('detail', link) if checkpoint else None
+            if detail_text is not None:
+                return detail_text
+            async with pool.page() as page:
+                await limiter.acquire()
+                try:
+                    with timed(metrics, 'navigation'):
+                        await page.goto(link, wait_until="domcontentloaded")
+                    with timed(metrics, 'extraction'):
+                        detail_text = await page.locator('body').inner_text()
+                except Exception as e:
+                    print(f"Error loading detail page {link}: {str(e)}")
+                    return ""
+            if checkpoint:
+                checkpoint.put('detail', link, detail_text)
+            return detail_text
+
+        # Keep pages in order and stop at the first page that adds nothing new
+        seen_cards = set()
+        for first_page in range(1, max_pages + 1, pool_size):
+            wave = range(first_page, min(first_page + pool_size, max_pages + 1))
+            listing_pages = await asyncio.gather(*(scrape_listing(n) for n in wave))
+
+            for page_number, page_cards in zip(wave, listing_pages):
+                if page_cards is None:
+                    # The pages before it are written; the checkpoint keeps everything for --resume
+                    raise RuntimeError(f"Listing page {page_number} failed to load")
+                cards = [card for card in page_cards if card_key(card) not in seen_cards]
+                if not cards:
+                    return hackathon_data
+                seen_cards.update(card_key(card) for card in cards)
+
+                detail_texts = await asyncio.gather(*(scrape_detail(link) for _, link, _ in cards))
+                with timed(metrics, 'parsing'):
+                    classified = classify_batch([title for title, _, _ in cards])
+                    page_data = [
+                        build_hackathon_info(len(hackathon_data) + i + 1, title, link, card_text, detail_text,
+                                             category, tags)
+                        for i, ((title, link, card_text), detail_text, (category, tags))
+                        in enumerate(zip(cards, detail_texts, classified))
+                    ]
+                hackathon_data.extend(page_data)
+                if writer:
+                    for hackathon_info in page_data:
+                        writer.write(hackathon_info)
+
+    return hackathon_data
+
+def scrape_hackathons_pooled(writer=None, pool_size=DEFAULT_POOL_SIZE, max_pages=DEFAULT_MAX_PAGES,
+                             rate=DEFAULT_RATE, fetch_details=True, block_resources=True, checkpoint=None,
+                             metrics=None):
+    """
+    Scrape every open listing page plus detail pages with a pool of pages in one Chromium
+    """
+    print(f"Starting pooled hackathon scraper ({pool_size} pages, up to {max_pages} listing pages)...")
+
+    resource_filter = ResourceFilter() if block_resources else None
     try:
-        os.makedirs('data', exist_ok=True)
+        hackathon_data = asyncio.run(
+            scrape_hackathons_pooled_async(pool_size, max_pages, rate, fetch_details, resource_filter, checkpoint,
+                                           metrics, writer)
+        )
+    except Exception as e:
+        print(f"Fatal error during scraping: {str(e)}")
+        return []
+
+    if resource_filter:
+        resource_filter.print_summary()
+
+    for hackathon_info in hackathon_data:
+        print(f"{hackathon_info['id']}. {hackathon_info['title'][:50]}... | Status: {hackathon_info['status']} | Prize: {hackathon_info['prize']}")
 
-        # Save detailed data
-        with open('data/hackathons_dynamic.json', 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"Successfully scraped {len(hackathon_data)} hackathons!")
+    return hackathon_data
 
-        print(f"Data saved to data/hackathons_dynamic.json ({len(data)} items)")
+def scrape_hackathons_async(urls, writer=None, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                            block_resources=True, checkpoint=None, metrics=None, daemon=None):
+    """
+    Scrape several listing URLs (e.g. one per domain / passing-out year filter) in parallel
+    """
+    print(f"Starting async hackathon scraper ({len(urls)} listings, {concurrency} concurrent pages)...")
 
+    try:
+        if daemon:
+            results = daemon.scrape('enhanced_scraper', urls, checkpoint, metrics)
+        else:
+            resource_filter = ResourceFilter() if block_resources else None
+            extract_page = functools.partial(extract_page_cards, metrics=metrics)
+            results = asyncio.run(run_checkpointed_scrape(urls, extract_page, concurrency, rate,
+                                                          resource_filter, checkpoint, metrics))
+            if resource_filter:
+                resource_filter.print_summary()
     except Exception as e:
-        print(f"❌ Error saving data: {e}")
+        print(f"Fatal error during scraping: {str(e)}")
+        return []
+
+    hackathon_data = []
+    cards = dedupe_cards(results)
+    with timed(metrics, 'parsing'):
+        classified = classify_batch([title for title, _, _ in cards])
+    for i, ((title, link, card_text), (category, tags)) in enumerate(zip(cards, classified)):
+        with timed(metrics, 'parsing'):
+            hackathon_info = build_hackathon_info(i + 1, title, link, card_text, category=category, tags=tags)
+        hackathon_data.append(hackathon_info)
+        if writer:
+            writer.write(hackathon_info)
+        print(f"{i+1}. {title[:50]}... | Status: {hackathon_info['status']} | Prize: {hackathon_info['prize']}")
+
+    print(f"Successfully scraped {len(hackathon_data)} hackathons!")
+    return hackathon_data
 
 def display_summary(data):
     """Display a summary of scraped data"""
@@ -285,13 +440,64 @@ def display_summary(data):
     if len(data) > 3:
         print(f"   ... and {len(data) - 3} more hackathons")
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Scrape hackathons from Unstop')
+    parser.add_argument('--pool-size', type=int, default=0,
+                        help=f'Scrape with a pool of this many pages (e.g. {DEFAULT_POOL_SIZE}); 0 uses the single-page scraper')
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES,
+                        help='Maximum listing pages to visit in pooled mode')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='Page loads per second across the pool')
+    parser.add_argument('--no-details', action='store_true',
+                        help='Skip per-hackathon detail pages in pooled mode')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Scrape every --domain / --passing-out-year listing in parallel')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Concurrent pages in async mode')
+    parser.add_argument('--domain', action='append', default=[],
+                        help='Unstop domain filter (repeatable, async mode)')
+    parser.add_argument('--passing-out-year', action='append', default=[],
+                        help='passingOutYear filter (repeatable, async mode)')
+    parser.add_argument('--no-block', action='store_true',
+                        help='Load images, media, fonts and trackers instead of aborting them')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the last unfinished run from its checkpoint')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help='SQLite file recording finished listing and detail pages')
+    add_metrics_args(parser)
+    add_daemon_args(parser)
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    # Run the scraper
-    hackathons = scrape_hackathons()
+    args = parse_args()
+
+    # Run the scraper, streaming each card to disk as it is scraped
+    writer = HackathonStreamWriter('data')
+    checkpoint = ScrapeCheckpoint('enhanced_scraper', args.checkpoint, resume=args.resume)
+    metrics = ScrapeMetrics('enhanced_scraper')
+    daemon = DaemonClient(args.daemon_port) if args.daemon else None
+    try:
+        if args.use_async:
+            urls = build_filter_urls(TARGET_URL, {'domain': args.domain, 'passingOutYear': args.passing_out_year})
+            hackathons = scrape_hackathons_async(urls, writer, args.concurrency, args.rate, not args.no_block,
+                                                 checkpoint, metrics, daemon)
+        elif args.pool_size > 0:
+            if daemon:
+                print("⚠️ --daemon is ignored in pooled mode, which launches its own browser for detail pages")
+            hackathons = scrape_hackathons_pooled(writer, args.pool_size, args.max_pages, args.rate,
+                                                  not args.no_details, not args.no_block, checkpoint, metrics)
+        else:
+            hackathons = scrape_hackathons(writer, not args.no_block, checkpoint, metrics, daemon)
+    except BaseException:
+        writer.abort()
+        checkpoint.close()
+        raise
 
     if hackathons:
-        # Save data to files
-        save_hackathons(hackathons)
+        # Finish the stream and derive the JSON files
+        writer.close()
+        checkpoint.finish()
 
         # Display summary
         display_summary(hackathons)
@@ -299,4 +505,10 @@ if __name__ == "__main__":
         print(f"Scraper completed successfully!")
         print(f"Check the 'data/' folder for JSON files")
     else:
-        print("\n❌ No hackathons were scraped. Check your internet connection and try again.")
\ No newline at end of file
+        writer.abort()
+        print("\n❌ No hackathons were scraped. Check your internet connection and try again.")
+
+    metrics.add_cards(len(hackathons))
+    metrics.print_summary()
+    metrics.write(args.metrics_json, args.metrics_prom)
+    checkpoint.close()
@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+# Separates hashed parts so ('ab', 'c') and ('a', 'bc') differ
+PART_SEPARATOR = '\x1f'
+
+
+def normalize_key_part(value):
+    """Casefold and collapse whitespace so cosmetic differences don't break matching"""
+    return ' '.join(str(value or '').casefold().split())
+
+
+def make_dedup_key(title, location):
+    """Stable hash of normalized title + venue, stored as dedupKey for indexed duplicate lookups"""
+    venue = location.get('venue', '') if isinstance(location, dict) else location
+    # Documents are stored with venue 'Online' when the scraper gave none
+    normalized = f"{normalize_key_part(title)}{PART_SEPARATOR}{normalize_key_part(venue) or 'online'}"
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def content_fingerprint(*parts):
+    """Hash of normalized text parts, stored as contentHash to detect changed cards"""
+    normalized = PART_SEPARATOR.join(normalize_key_part(part) for part in parts)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def record_fingerprint(record):
+    """Hash of a JSON-like record, independent of key order"""
+    normalized = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
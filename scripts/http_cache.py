@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Responses younger than this are served without touching the network
+DEFAULT_TTL = 600
+# Least recently used entries are evicted once bodies exceed this many bytes
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Describe the original encoded body, not the decoded bytes we store
+DROPPED_HEADERS = ['content-encoding', 'content-length', 'transfer-encoding']
+
+
+class HTTPCache:
+    """On-disk store of GET responses keyed by URL
+
+    Each entry is <sha1(url)>.json (status, headers, validators, stored_at)
+    plus <sha1(url)>.body with the decoded body. Entries older than ttl are
+    revalidated with If-None-Match / If-Modified-Since; eviction drops the
+    least recently used bodies once the cache grows past max_bytes.
+    <sha1(url)>.saved holds the digest of the last body whose results the
+    caller committed (mark_saved), which is what "unchanged" is judged by.
+    """
+
+    def __init__(self, cache_dir, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def paths(self, url):
+        """(metadata path, body path) for a URL"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def get(self, url):
+        """Cached entry for url as (metadata, body), or None"""
+        meta_path, body_path = self.paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        # Access time drives LRU eviction
+        os.utime(body_path)
+        return meta, body
+
+    def saved_path(self, url):
+        """Path of the last-saved digest for a URL"""
+        return self.paths(url)[0][:-len('.json')] + '.saved'
+
+    def mark_saved(self, url, body):
+        """Record body as the last response for url whose results were saved"""
+        path = self.saved_path(url)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(hashlib.sha1(body).hexdigest())
+        os.replace(path + '.tmp', path)
+
+    def is_saved(self, url, body):
+        """True when body is the response mark_saved last recorded for url"""
+        try:
+            with open(self.saved_path(url), 'r', encoding='utf-8') as f:
+                return f.read() == hashlib.sha1(body).hexdigest()
+        except OSError:
+            return False
+
+    def is_fresh(self, meta):
+        """True while an entry is younger than the TTL"""
+        return time.time() - meta['stored_at'] < self.ttl
+
+    def store(self, url, response):
+        """Save a 200 response, replacing any older entry atomically"""
+        meta_path, body_path = self.paths(url)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS}
+        meta = {
+            'url': url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'stored_at': time.time(),
+        }
+        for path, data, mode in ((body_path, response.content, 'wb'),
+                                 (meta_path, json.dumps(meta), 'w')):
+            tmp_path = path + '.tmp'
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self.evict()
+
+    def refresh(self, url, meta, response):
+        """Restart an entry's TTL after a 304, taking any updated validators"""
+        for header in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires'):
+            if header in response.headers:
+                meta['headers'][header] = response.headers[header]
+        meta['stored_at'] = time.time()
+        meta_path, _ = self.paths(url)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def evict(self):
+        """Drop least recently used entries until bodies fit in max_bytes"""
+        bodies = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.body'):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    # Evicted by another thread meanwhile
+                    continue
+                bodies.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in bodies)
+        for _, size, name in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            base = os.path.join(self.cache_dir, name[:-len('.body')])
+            for path in (base + '.body', base + '.json', base + '.saved'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+    def clear(self):
+        """Remove every entry"""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(('.body', '.json', '.saved')):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that answers GETs from an HTTPCache and revalidates stale entries
+
+    Every response gets a cache_status attribute: 'fresh' (served from disk
+    inside the TTL), 'revalidated' (server said 304, cached body returned),
+    'stored' (new 200 saved) or 'bypass'. Both cache hits mean the body is
+    byte-for-byte what an earlier request already fetched, not that its
+    results were saved; see HTTPCache.is_saved.
+    """
+
+    def __init__(self, cache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            response = super().send(request, **kwargs)
+            response.cache_status = 'bypass'
+            return response
+
+        entry = self.cache.get(request.url)
+        if entry:
+            meta, body = entry
+            if self.cache.is_fresh(meta):
+                return self.cached_response(request, meta, body, 'fresh')
+            etag = CaseInsensitiveDict(meta['headers']).get('ETag')
+            last_modified = CaseInsensitiveDict(meta['headers']).get('Last-Modified')
+            if etag:
+                request.headers['If-None-Match'] = etag
+            if last_modified:
+                request.headers['If-Modified-Since'] = last_modified
+
+        response = super().send(request, **kwargs)
+
+        if entry and response.status_code == 304:
+            response.close()
+            self.cache.refresh(request.url, meta, response)
+            return self.cached_response(request, meta, body, 'revalidated')
+
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if response.status_code == 200 and 'no-store' not in cache_control:
+            self.cache.store(request.url, response)
+            response.cache_status = 'stored'
+        else:
+            response.cache_status = 'bypass'
+        return response
+
+    def cached_response(self, request, meta, body, cache_status):
+        """Build a Response from a cache entry without touching the network"""
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta.get('reason') or 'OK'
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response._content = body
+        response.cache_status = cache_status
+        return response
+
+
+def install_cache(session, cache_dir, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+    """Mount a CachingAdapter on session for http and https; returns the HTTPCache"""
+    cache = HTTPCache(cache_dir, ttl, max_bytes)
+    adapter = CachingAdapter(cache)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return cache
+
+
+def is_cache_hit(response):
+    """True when a response is a body an earlier request already fetched"""
+    return getattr(response, 'cache_status', None) in ('fresh', 'revalidated')
@@ -1,229 +1,241 @@
 from playwright.sync_api import sync_playwright
-import json
+import argparse
+import asyncio
+import functools
 import time
-import os
+from async_engine import (DEFAULT_CONCURRENCY, DEFAULT_RATE, build_filter_urls, dedupe_cards,
+                          extract_cards, run_checkpointed_scrape)
+from browser_pool import ResourceFilter, extract_card_fields, wait_for_listing
+from card_features import DEFAULT_CATEGORY, classify_batch
+from scrape_checkpoint import DEFAULT_CHECKPOINT_PATH, ScrapeCheckpoint
+from scrape_daemon import DaemonClient, add_daemon_args
+from scrape_metrics import ScrapeMetrics, add_metrics_args, timed
+from scrape_output import HackathonStreamWriter, SIMPLE_FIELDS
 
 # Target URL for hackathons
 TARGET_URL = 'https://unstop.com/hackathons?oppstatus=open&domain=2&course=6&specialization=Information%20Technology&usertype=students&passingOutYear=2027'
 
-def scrape_hackathons():
+# Selectors shared by the sync and async paths
+CARD_SELECTORS = [
+    'div.single_profile',
+    '.hackathon-card',
+    '.competition-card',
+    '[data-testid="hackathon-card"]',
+    '.card'
+]
+FALLBACK_CARD_SELECTOR = 'div:has(h3), div:has(h4), .card, [class*="hack"], [class*="competition"]'
+TITLE_SELECTORS = ['h2', 'h3', 'h4', '.title', '.card-title', 'a[href*="/competition/"]', 'strong']
+
+# Limit to first 8 cards for demo
+CARD_LIMIT = 8
+
+def build_hackathon_info(index, title, link, card_text, category=DEFAULT_CATEGORY, tags=None):
+    """Build a hackathon record from the raw text scraped for one card"""
+    # Extract additional info from the same card container
+    prize = "N/A"
+    deadline = "N/A"
+    location = "N/A"
+    organizer = "N/A"
+    
+    # Since title, location, deadline are in same class, extract from card content
+    lines = card_text.split('\n')
+    
+    # Look for prize information (₹ symbol)
+    if "₹" in card_text:
+        # Find text around ₹ symbol
+        for line in lines:
+            if "₹" in line:
+                prize = line.strip()
+                break
+    
+    # Look for deadline (days left pattern)
+    for line in lines:
+        line = line.strip()
+        if "days left" in line.lower() or "day left" in line.lower():
+            deadline = line
+            break
+        elif "deadline" in line.lower():
+            deadline = line
+            break
+    
+    # Look for location/organizer (usually contains university, institute, or city names)
+    for line in lines:
+        line = line.strip()
+        if any(word in line.lower() for word in ['university', 'institute', 'iit', 'nit', 'college', 'mumbai', 'delhi', 'bangalore', 'chennai', 'pune']):
+            location = line
+            break
+    
+    # Try to find organizer info
+    for line in lines:
+        line = line.strip()
+        if len(line) > 10 and len(line) < 100 and not any(x in line.lower() for x in ['days left', '₹', 'registered', 'impressions']):
+            if location == "N/A" or line != location:
+                organizer = line
+                break
+    
+    return {
+        "id": index,
+        "title": title,
+        "description": f"{organizer} - {title}" if organizer != "N/A" else f"Hackathon opportunity: {title}",
+        "startDate": "2024-11-01",  # Placeholder dates
+        "endDate": "2024-11-30", 
+        "location": location if location != "N/A" else "Online/Hybrid",
+        "organizer": organizer,
+        "prize": prize,
+        "deadline": deadline,
+        "url": link,
+        "status": "Open",
+        "category": category,
+        "tags": tags or [category.lower()],
+        "difficulty": "Intermediate",
+        "teamSize": "1-4 members",
+        "source": "Unstop",
+        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "featured": False,
+        "registrationOpen": True
+    }
+
+async def extract_page_cards(page, url, metrics=None):
+    """Async extraction step: raw (title, link, card_text) for the first CARD_LIMIT cards on a listing page"""
+    return await extract_cards(page, CARD_SELECTORS, FALLBACK_CARD_SELECTOR, TITLE_SELECTORS, limit=CARD_LIMIT,
+                               metrics=metrics)
+
+def scrape_hackathons_async(urls, writer=None, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                            block_resources=True, checkpoint=None, metrics=None, daemon=None):
     """
-    Scrape hackathon data from Unstop with improved error handling
+    Scrape several listing URLs (e.g. one per domain / passing-out year filter) in parallel
     """
-    hackathon_data = []
-    
-    print("🚀 Starting hackathon scraper...")
+    print(f"🚀 Starting async hackathon scraper ({len(urls)} listings, {concurrency} concurrent pages)...")
     
     try:
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            print(f"📡 Navigating to Unstop...")
-            page.goto(TARGET_URL, wait_until="domcontentloaded")
-            
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Try to find hackathon cards with multiple selectors
-            card_selectors = [
-                'div.single_profile',
-                '.hackathon-card',
-                '.competition-card',
-                '[data-testid="hackathon-card"]',
-                '.card'
-            ]
-            
-            cards_found = False
-            for selector in card_selectors:
-                try:
-                    page.wait_for_selector(selector, timeout=5000)
-                    cards = page.locator(selector)
-                    count = cards.count()
-                    if count > 0:
-                        print(f"✅ Found {count} cards using selector: {selector}")
-                        cards_found = True
-                        break
-                except:
-                    continue
-            
-            if not cards_found:
-                print("⚠️ No cards found with standard selectors, trying alternative approach...")
-                # Try to get any links or divs that might be hackathon cards
-                cards = page.locator('div:has(h3), div:has(h4), .card, [class*="hack"], [class*="competition"]')
-                count = cards.count()
-                print(f"Found {count} potential cards with fallback selector")
-            
-            if count == 0:
-                print("❌ No hackathon cards found on the page")
-                browser.close()
-                return []
-            
-            # Limit to first 8 cards for demo
-            limit = min(8, count)
-            print(f"📊 Processing {limit} hackathon cards...")
-            
-            for i in range(limit):
-                try:
-                    card = cards.nth(i)
-                    
-                    # Extract title from h2 element (based on your feedback)
-                    title = "Unknown Hackathon"
-                    try:
-                        # First try h2 in the card (as you mentioned)
-                        title_elem = card.locator('h2').first
-                        if title_elem.is_visible():
-                            title_text = title_elem.text_content().strip()
-                            if title_text and len(title_text) > 3:
-                                title = title_text
-                        else:
-                            # Fallback to other selectors
-                            title_selectors = ['h3', 'h4', '.title', '.card-title', 'a[href*="/competition/"]', 'strong']
-                            for title_sel in title_selectors:
-                                try:
-                                    title_elem = card.locator(title_sel).first
-                                    if title_elem.is_visible():
-                                        title_text = title_elem.text_content().strip()
-                                        if title_text and len(title_text) > 3:
-                                            title = title_text
-                                            break
-                                except:
-                                    continue
-                    except Exception as e:
-                        print(f"Error extracting title from card {i+1}: {e}")
-                    
-                    # Extract link
-                    link = "N/A"
-                    try:
-                        link_elem = card.locator('a').first
-                        href = link_elem.get_attribute('href')
-                        if href:
-                            link = f'https://unstop.com{href}' if href.startswith('/') else href
-                    except:
-                        pass
-                    
-                    # Extract additional info from the same card container
-                    prize = "N/A"
-                    deadline = "N/A"
-                    location = "N/A"
-                    organizer = "N/A"
-                    
-                    # Since title, location, deadline are in same class, extract from card content
-                    try:
-                        # Get all text content from the card
-                        card_text = card.text_content()
-                        
-                        # Look for prize information (₹ symbol)
-                        if "₹" in card_text:
-                            # Find text around ₹ symbol
-                            lines = card_text.split('\n')
-                            for line in lines:
-                                if "₹" in line:
-                                    prize = line.strip()
-                                    break
-                        
-                        # Look for deadline (days left pattern)
-                        for line in card_text.split('\n'):
-                            line = line.strip()
-                            if "days left" in line.lower() or "day left" in line.lower():
-                                deadline = line
-                                break
-                            elif "deadline" in line.lower():
-                                deadline = line
-                                break
-                        
-                        # Look for location/organizer (usually contains university, institute, or city names)
-                        for line in card_text.split('\n'):
-                            line = line.strip()
-                            if any(word in line.lower() for word in ['university', 'institute', 'iit', 'nit', 'college', 'mumbai', 'delhi', 'bangalore', 'chennai', 'pune']):
-                                location = line
-                                break
-                        
-                        # Try to find organizer info
-                        for line in card_text.split('\n'):
-                            line = line.strip()
-                            if len(line) > 10 and len(line) < 100 and not any(x in line.lower() for x in ['days left', '₹', 'registered', 'impressions']):
-                                if location == "N/A" or line != location:
-                                    organizer = line
-                                    break
-                                    
-                    except Exception as e:
-                        print(f"Error extracting additional info from card {i+1}: {e}")
-                        pass
-                    
-                    hackathon_info = {
-                        "id": i + 1,
-                        "title": title,
-                        "description": f"{organizer} - {title}" if organizer != "N/A" else f"Hackathon opportunity: {title}",
-                        "startDate": "2024-11-01",  # Placeholder dates
-                        "endDate": "2024-11-30", 
-                        "location": location if location != "N/A" else "Online/Hybrid",
-                        "organizer": organizer,
-                        "prize": prize,
-                        "deadline": deadline,
-                        "url": link,
-                        "status": "Open",
-                        "category": "Technology", 
-                        "difficulty": "Intermediate",
-                        "teamSize": "1-4 members",
-                        "source": "Unstop",
-                        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                        "featured": False,
-                        "registrationOpen": True
-                    }
-                    
-                    hackathon_data.append(hackathon_info)
-                    print(f"✅ {i+1}. {title[:60]}...")
-                    
-                    # Small delay between cards
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"⚠️ Error processing card {i+1}: {str(e)}")
-                    continue
-            
-            browser.close()
-            
-        print(f"\n🎉 Successfully scraped {len(hackathon_data)} hackathons!")
-        return hackathon_data
-        
+        if daemon:
+            results = daemon.scrape('improved_scraper', urls, checkpoint, metrics)
+        else:
+            resource_filter = ResourceFilter() if block_resources else None
+            extract_page = functools.partial(extract_page_cards, metrics=metrics)
+            results = asyncio.run(run_checkpointed_scrape(urls, extract_page, concurrency, rate,
+                                                          resource_filter, checkpoint, metrics))
+            if resource_filter:
+                resource_filter.print_summary()
     except Exception as e:
         print(f"❌ Fatal error during scraping: {str(e)}")
         return []
+    
+    hackathon_data = []
+    cards = dedupe_cards(results)
+    with timed(metrics, 'parsing'):
+        classified = classify_batch([title for title, _, _ in cards])
+    for i, ((title, link, card_text), (category, tags)) in enumerate(zip(cards, classified)):
+        with timed(metrics, 'parsing'):
+            hackathon_info = build_hackathon_info(i + 1, title, link, card_text, category, tags)
+        hackathon_data.append(hackathon_info)
+        if writer:
+            writer.write(hackathon_info)
+        print(f"✅ {i+1}. {title[:60]}...")
+    
+    print(f"\n🎉 Successfully scraped {len(hackathon_data)} hackathons!")
+    return hackathon_data
 
-def save_hackathons(data):
-    """Save hackathon data to JSON file"""
+def load_listing_cards(resource_filter=None, metrics=None):
+    """
+    Open the listing in Chromium and return raw (title, link, card_text) for the first CARD_LIMIT cards
+    """
+    with sync_playwright() as p:
+        # Launch browser
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        if resource_filter:
+            resource_filter.install(page)
+        if metrics:
+            metrics.watch(page)
+        
+        print(f"📡 Navigating to Unstop...")
+        with timed(metrics, 'navigation'):
+            page.goto(TARGET_URL, wait_until="domcontentloaded")
+        
+        # Wait until cards render (or the network settles) instead of a fixed sleep
+        with timed(metrics, 'selector_wait'):
+            selector = wait_for_listing(page, CARD_SELECTORS)
+        cards_found = selector is not None
+        if cards_found:
+            cards = page.locator(selector)
+            count = cards.count()
+            print(f"✅ Found {count} cards using selector: {selector}")
+        
+        if not cards_found:
+            print("⚠️ No cards found with standard selectors, trying alternative approach...")
+            # Try to get any links or divs that might be hackathon cards
+            cards = page.locator(FALLBACK_CARD_SELECTOR)
+            count = cards.count()
+            print(f"Found {count} potential cards with fallback selector")
+        
+        if count == 0:
+            browser.close()
+            return []
+        
+        # Limit to first 8 cards for demo
+        limit = min(CARD_LIMIT, count)
+        print(f"📊 Processing {limit} hackathon cards...")
+        
+        # Title, link and text for every card in a single round trip
+        with timed(metrics, 'extraction'):
+            raw_cards = extract_card_fields(cards, TITLE_SELECTORS, limit=limit)
+        browser.close()
+        return raw_cards
+
+def scrape_hackathons(writer=None, block_resources=True, checkpoint=None, metrics=None, daemon=None):
+    """
+    Scrape hackathon data from Unstop with improved error handling
+    """
+    hackathon_data = []
+    # The daemon's browser has its own resource blocking setting
+    resource_filter = ResourceFilter() if block_resources and not daemon else None
+    
+    print("🚀 Starting hackathon scraper...")
+    
     try:
-        os.makedirs('data', exist_ok=True)
+        # A resumed run reuses the cards it already pulled off the listing
+        raw_cards = checkpoint.get('listing', TARGET_URL) if checkpoint else None
+        if raw_cards is None:
+            if daemon:
+                raw_cards = daemon.scrape('improved_scraper', [TARGET_URL], metrics=metrics)[0][1]
+            else:
+                raw_cards = load_listing_cards(resource_filter, metrics)
+            if checkpoint and raw_cards:
+                checkpoint.put('listing', TARGET_URL, raw_cards)
+            if resource_filter:
+                resource_filter.print_summary()
+        else:
+            print(f"♻️ {len(raw_cards)} cards restored from checkpoint")
         
-        # Save detailed data
-        with open('data/hackathons_dynamic.json', 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if not raw_cards:
+            print("❌ No hackathon cards found on the page")
+            return []
         
-        # Also create a simplified version for quick API use
-        simplified_data = []
-        for item in data:
-            simplified_data.append({
-                "id": item["id"],
-                "title": item["title"],
-                "description": item["description"],
-                "startDate": item["startDate"],
-                "endDate": item["endDate"],
-                "location": item["location"],
-                "url": item["url"],
-                "status": item["status"]
-            })
+        # Categories and tags for every title in one pass
+        with timed(metrics, 'parsing'):
+            classified = classify_batch([title for title, _, _ in raw_cards])
         
-        with open('data/hackathons_simple.json', 'w', encoding='utf-8') as f:
-            json.dump(simplified_data, f, ensure_ascii=False, indent=2)
-            
-        print(f"💾 Data saved to:")
-        print(f"   - data/hackathons_dynamic.json ({len(data)} items)")
-        print(f"   - data/hackathons_simple.json (simplified)")
+        for i, ((title, link, card_text), (category, tags)) in enumerate(zip(raw_cards, classified)):
+            try:
+                with timed(metrics, 'parsing'):
+                    hackathon_info = build_hackathon_info(i + 1, title, link, card_text, category, tags)
+                
+                hackathon_data.append(hackathon_info)
+                if writer:
+                    writer.write(hackathon_info)
+                print(f"✅ {i+1}. {title[:60]}...")
+                
+            except Exception as e:
+                print(f"⚠️ Error processing card {i+1}: {str(e)}")
+                continue
+        
+        print(f"\n🎉 Successfully scraped {len(hackathon_data)} hackathons!")
+        return hackathon_data
         
     except Exception as e:
-        print(f"❌ Error saving data: {e}")
+        print(f"❌ Fatal error during scraping: {str(e)}")
+        return []
 
 def display_summary(data):
     """Display a summary of scraped data"""
@@ -244,13 +256,53 @@ def display_summary(data):
     if len(data) > 3:
         print(f"   ... and {len(data) - 3} more hackathons")
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Scrape hackathons from Unstop')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Scrape every --domain / --passing-out-year listing in parallel')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Concurrent pages in async mode')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='Page loads per second across all pages in async mode')
+    parser.add_argument('--domain', action='append', default=[],
+                        help='Unstop domain filter (repeatable, async mode)')
+    parser.add_argument('--passing-out-year', action='append', default=[],
+                        help='passingOutYear filter (repeatable, async mode)')
+    parser.add_argument('--no-block', action='store_true',
+                        help='Load images, media, fonts and trackers instead of aborting them')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue the last unfinished run from its checkpoint')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help='SQLite file recording finished listings')
+    add_metrics_args(parser)
+    add_daemon_args(parser)
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    # Run the scraper
-    hackathons = scrape_hackathons()
+    args = parse_args()
+    
+    # Run the scraper, streaming each card to disk as it is scraped
+    writer = HackathonStreamWriter('data', simple_fields=SIMPLE_FIELDS)
+    checkpoint = ScrapeCheckpoint('improved_scraper', args.checkpoint, resume=args.resume)
+    metrics = ScrapeMetrics('improved_scraper')
+    daemon = DaemonClient(args.daemon_port) if args.daemon else None
+    try:
+        if args.use_async:
+            urls = build_filter_urls(TARGET_URL, {'domain': args.domain, 'passingOutYear': args.passing_out_year})
+            hackathons = scrape_hackathons_async(urls, writer, args.concurrency, args.rate, not args.no_block,
+                                                 checkpoint, metrics, daemon)
+        else:
+            hackathons = scrape_hackathons(writer, not args.no_block, checkpoint, metrics, daemon)
+    except BaseException:
+        writer.abort()
+        checkpoint.close()
+        raise
     
     if hackathons:
-        # Save data to files
-        save_hackathons(hackathons)
+        # Finish the stream and derive the JSON files
+        writer.close()
+        checkpoint.finish()
         
         # Display summary
         display_summary(hackathons)
@@ -258,4 +310,10 @@ if __name__ == "__main__":
         print(f"\n✅ Scraper completed successfully!")
         print(f"📁 Check the 'data/' folder for JSON files")
     else:
-        print("\n❌ No hackathons were scraped. Check your internet connection and try again.")
\ No newline at end of file
+        writer.abort()
+        print("\n❌ No hackathons were scraped. Check your internet connection and try again.")
+    
+    metrics.add_cards(len(hackathons))
+    metrics.print_summary()
+    metrics.write(args.metrics_json, args.metrics_prom)
+    checkpoint.close()
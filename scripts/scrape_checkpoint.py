@@ -0,0 +1,121 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'scrape_checkpoints.sqlite3')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    scraper TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS items (
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (run_id, kind, key)
+);
+"""
+
+
+def encode_value(value):
+    """JSON default hook: datetimes survive the round trip as {'$date': iso}"""
+    if isinstance(value, datetime):
+        return {'$date': value.isoformat()}
+    return str(value)
+
+
+def decode_object(obj):
+    """JSON object hook undoing encode_value"""
+    if len(obj) == 1 and '$date' in obj:
+        return datetime.fromisoformat(obj['$date'])
+    return obj
+
+
+class ScrapeCheckpoint:
+    """SQLite record of what a scrape run has finished, so a crashed run can resume
+
+    Each finished unit of work is stored as (kind, key) -> JSON value, e.g.
+    ('listing', url) -> raw cards or ('card', fingerprint) -> record, and
+    committed immediately. resume=True reopens the scraper's latest unfinished
+    run; otherwise a new run starts. finish() drops the run's items once its
+    output is safely written.
+    """
+
+    def __init__(self, scraper, path=DEFAULT_CHECKPOINT_PATH, resume=False):
+        self.scraper = scraper
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+        row = None
+        if resume:
+            row = self.conn.execute(
+                'SELECT run_id FROM runs WHERE scraper = ? AND finished_at IS NULL ORDER BY started_at DESC LIMIT 1',
+                (scraper,)
+            ).fetchone()
+        if row:
+            self.run_id = row[0]
+            self.seq = self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM items WHERE run_id = ?',
+                                         (self.run_id,)).fetchone()[0]
+            print(f"♻️  Resuming {scraper} run {self.run_id} ({self.count()} checkpointed items)")
+        else:
+            self.run_id = uuid.uuid4().hex
+            self.seq = 0
+            with self.conn:
+                self.conn.execute('INSERT INTO runs (run_id, scraper, started_at) VALUES (?, ?, ?)',
+                                  (self.run_id, scraper, time.time()))
+
+    def get(self, kind, key):
+        """Checkpointed value for (kind, key), or None"""
+        row = self.conn.execute('SELECT value FROM items WHERE run_id = ? AND kind = ? AND key = ?',
+                                (self.run_id, kind, str(key))).fetchone()
+        return json.loads(row[0], object_hook=decode_object) if row else None
+
+    def put(self, kind, key, value):
+        """Record (kind, key) as finished and commit straight away"""
+        self.seq += 1
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO items (run_id, kind, key, value, seq) VALUES (?, ?, ?, ?, ?)',
+                (self.run_id, kind, str(key), json.dumps(value, ensure_ascii=False, default=encode_value), self.seq)
+            )
+
+    def items(self, kind):
+        """(key, value) pairs of one kind in the order they were checkpointed"""
+        rows = self.conn.execute('SELECT key, value FROM items WHERE run_id = ? AND kind = ? ORDER BY seq',
+                                 (self.run_id, kind)).fetchall()
+        return [(key, json.loads(value, object_hook=decode_object)) for key, value in rows]
+
+    def count(self, kind=None):
+        """Number of checkpointed items, optionally of one kind"""
+        if kind is None:
+            query, params = 'SELECT COUNT(*) FROM items WHERE run_id = ?', (self.run_id,)
+        else:
+            query, params = 'SELECT COUNT(*) FROM items WHERE run_id = ? AND kind = ?', (self.run_id, kind)
+        return self.conn.execute(query, params).fetchone()[0]
+
+    def finish(self):
+        """Mark the run complete and drop its items; a later resume starts fresh"""
+        with self.conn:
+            self.conn.execute('UPDATE runs SET finished_at = ? WHERE run_id = ?', (time.time(), self.run_id))
+            self.conn.execute('DELETE FROM items WHERE run_id = ?', (self.run_id,))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,238 @@
+"""Long-lived scrape daemon: one warm Chromium serving listing jobs to the scrapers
+
+Start it once, then pass --daemon to improved_scraper.py or enhanced_scraper.py:
+
+    python scrape_daemon.py [--port 8765] [--pool-size 4]
+    python improved_scraper.py --daemon
+    python scrape_daemon.py --stop
+
+The browser runs in a persistent context under --profile-dir, so repeat
+scrapes skip Chromium startup and reuse its HTTP cache and cookies, even
+across daemon restarts. Clients send one JSON line per connection and get
+one JSON line back; the daemon only listens on localhost.
+"""
+import argparse
+import asyncio
+import functools
+import importlib
+import json
+import os
+import socket
+import time
+from urllib.parse import urlparse
+
+from async_engine import DEFAULT_CONCURRENCY, DEFAULT_RATE, launch_persistent_pool, scrape_urls
+from browser_pool import ResourceFilter
+from rate_limit import AsyncTokenBucket
+from scrape_metrics import ScrapeMetrics
+
+DEFAULT_DAEMON_HOST = '127.0.0.1'
+DEFAULT_DAEMON_PORT = 8765
+DEFAULT_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'browser_profile')
+
+# Modules whose extract_page_cards(page, url, metrics) a job may name
+SCRAPERS = ['improved_scraper', 'enhanced_scraper']
+
+# Upper bound on one request line; a job lists its URLs inline
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# How long a client waits for a job before giving up
+JOB_TIMEOUT = 600
+
+
+class JobMetrics(ScrapeMetrics):
+    """ScrapeMetrics that also keeps each observation, to replay into the client's metrics"""
+
+    def __init__(self, scraper):
+        super().__init__(scraper)
+        self.observations = []
+
+    def observe(self, name, seconds):
+        super().observe(name, seconds)
+        with self.lock:
+            self.observations.append((name, seconds))
+
+
+class ScrapeDaemon:
+    """Keeps one persistent browser context open and runs listing jobs on its page pool
+
+    Jobs from several clients share the pool and one rate limiter, so running
+    scrapers side by side never exceeds pool_size pages or `rate` loads/sec.
+    Request routing disables Chromium's HTTP cache, so resource blocking is
+    off unless asked for.
+    """
+
+    def __init__(self, pool_size=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, profile_dir=DEFAULT_PROFILE_DIR,
+                 block_resources=False, headless=True):
+        self.pool_size = pool_size
+        self.rate = rate
+        self.profile_dir = profile_dir
+        self.resource_filter = ResourceFilter() if block_resources else None
+        self.headless = headless
+        self.metrics = ScrapeMetrics('scrape_daemon')
+        self.pool = None
+        self.limiter = None
+        self.stopped = None
+        self.jobs = 0
+
+    async def serve(self, host=DEFAULT_DAEMON_HOST, port=DEFAULT_DAEMON_PORT):
+        """Launch the browser, then answer clients until a shutdown request"""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self.stopped = asyncio.Event()
+        self.limiter = AsyncTokenBucket(self.rate, burst=self.pool_size)
+        print(f"🚀 Launching Chromium with profile {self.profile_dir}...")
+        async with launch_persistent_pool(self.pool_size, self.profile_dir, self.headless, self.resource_filter,
+                                          self.metrics) as pool:
+            self.pool = pool
+            server = await asyncio.start_server(self.handle, host, port, limit=MAX_MESSAGE_BYTES)
+            print(f"🟢 Scrape daemon listening on {host}:{port} ({self.pool_size} pages, {self.rate} loads/sec)")
+            async with server:
+                await self.stopped.wait()
+        print(f"🛑 Scrape daemon stopped after {self.jobs} jobs")
+        if self.resource_filter:
+            self.resource_filter.print_summary()
+        self.metrics.print_summary()
+
+    async def handle(self, reader, writer):
+        """One request line in, one reply line out"""
+        try:
+            reply = await self.dispatch(json.loads(await reader.readline()))
+        except Exception as e:
+            reply = {'ok': False, 'error': str(e)}
+        try:
+            writer.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            # Client gave up waiting
+            pass
+
+    async def dispatch(self, message):
+        action = message.get('action')
+        if action == 'ping':
+            return {'ok': True, 'jobs': self.jobs, 'pool_size': self.pool_size, 'profile_dir': self.profile_dir}
+        if action == 'shutdown':
+            self.stopped.set()
+            return {'ok': True}
+        if action == 'scrape':
+            return await self.run_job(message.get('scraper'), message.get('urls') or [])
+        raise ValueError(f'Unknown action: {action}')
+
+    async def run_job(self, scraper, urls):
+        """Load urls with scraper's extract_page_cards; returns [(url, cards)] and stage timings"""
+        if scraper not in SCRAPERS:
+            raise ValueError(f'Unknown scraper: {scraper}')
+        bad_urls = [url for url in urls if urlparse(url).scheme not in ('http', 'https')]
+        if bad_urls:
+            raise ValueError(f'Not an http(s) URL: {bad_urls[0]}')
+
+        job_metrics = JobMetrics(scraper)
+        extract_page = functools.partial(importlib.import_module(scraper).extract_page_cards, metrics=job_metrics)
+        start = time.perf_counter()
+        results = await scrape_urls(self.pool, self.limiter, urls, extract_page, job_metrics)
+        for name, seconds in job_metrics.observations:
+            self.metrics.observe(name, seconds)
+        cards = sum(len(page_cards) for _, page_cards in results)
+        self.metrics.add_cards(cards)
+        self.jobs += 1
+        print(f"✅ Job {self.jobs} ({scraper}): {len(urls)} listings, {cards} cards "
+              f"in {time.perf_counter() - start:.2f}s")
+        return {'ok': True, 'results': results, 'observations': job_metrics.observations}
+
+
+class DaemonClient:
+    """Sends listing jobs to a running ScrapeDaemon"""
+
+    def __init__(self, port=DEFAULT_DAEMON_PORT, host=DEFAULT_DAEMON_HOST, timeout=JOB_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def request(self, message):
+        """Send one message and return the daemon's reply, raising on errors"""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+                sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+                with sock.makefile('rb') as stream:
+                    line = stream.readline()
+        except ConnectionRefusedError:
+            raise ConnectionError(f'No scrape daemon on {self.host}:{self.port}; start one with '
+                                  f'python scrape_daemon.py --port {self.port}') from None
+        if not line:
+            raise ConnectionError('Scrape daemon closed the connection without replying')
+        reply = json.loads(line)
+        if not reply.get('ok'):
+            raise RuntimeError(f"Scrape daemon error: {reply.get('error')}")
+        return reply
+
+    def ping(self):
+        return self.request({'action': 'ping'})
+
+    def shutdown(self):
+        return self.request({'action': 'shutdown'})
+
+    def scrape(self, scraper, urls, checkpoint=None, metrics=None):
+        """[(url, cards)] in input order, like run_checkpointed_scrape, loaded by the daemon's browser"""
+        done = {url: checkpoint.get('listing', url) if checkpoint else None for url in urls}
+        remaining = [url for url in urls if done[url] is None]
+        if len(remaining) < len(urls):
+            print(f"♻️ {len(urls) - len(remaining)} listings restored from checkpoint")
+
+        if remaining:
+            reply = self.request({'action': 'scrape', 'scraper': scraper, 'urls': remaining})
+            if metrics:
+                for name, seconds in reply['observations']:
+                    metrics.observe(name, seconds)
+            for url, cards in reply['results']:
+                done[url] = [tuple(card) for card in cards]
+                # Failed loads come back empty; leave them for a resumed run to retry
+                if checkpoint and done[url]:
+                    checkpoint.put('listing', url, done[url])
+        return [(url, done[url] or []) for url in urls]
+
+
+def add_daemon_args(parser):
+    """Add --daemon / --daemon-port to a scraper's argument parser"""
+    parser.add_argument('--daemon', action='store_true',
+                        help='Load listings in a running scrape_daemon.py (warm browser and HTTP cache) '
+                             'instead of launching Chromium')
+    parser.add_argument('--daemon-port', type=int, default=DEFAULT_DAEMON_PORT,
+                        help='Port of the scrape daemon')
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Keep a browser warm and serve scrape jobs over a local socket')
+    parser.add_argument('--host', default=DEFAULT_DAEMON_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_DAEMON_PORT)
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Pages kept open and shared by all jobs')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='Page loads per second across all jobs')
+    parser.add_argument('--profile-dir', default=DEFAULT_PROFILE_DIR,
+                        help='Persistent browser profile holding the HTTP cache and cookies')
+    parser.add_argument('--block-resources', action='store_true',
+                        help='Abort images, media, fonts and trackers (disables the HTTP cache)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--status', action='store_true', help='Ping a running daemon and exit')
+    parser.add_argument('--stop', action='store_true', help='Shut down a running daemon and exit')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    client = DaemonClient(args.port, args.host)
+    if args.status:
+        status = client.ping()
+        print(f"🟢 Scrape daemon on {args.host}:{args.port}: {status['jobs']} jobs, "
+              f"{status['pool_size']} pages, profile {status['profile_dir']}")
+    elif args.stop:
+        client.shutdown()
+        print(f"🛑 Scrape daemon on {args.host}:{args.port} is shutting down")
+    else:
+        daemon = ScrapeDaemon(args.pool_size, args.rate, args.profile_dir, args.block_resources, not args.headed)
+        try:
+            asyncio.run(daemon.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            print("🛑 Scrape daemon interrupted")
@@ -0,0 +1,158 @@
+import json
+import os
+import re
+import shutil
+import time
+
+EXPORT_DIRNAME = 'hackathons_export'
+MANIFEST_FILENAME = 'manifest.json'
+SEARCH_INDEX_FILENAME = 'search_index.json'
+EXPORT_VERSION = 1
+
+# Matches the scraped API's default ?limit, so a default request reads one page file
+DEFAULT_PAGE_SIZE = 10
+
+# Fields the scraped API filters on by exact (lowercased) value, one partition each
+PARTITION_FIELDS = ['status', 'category', 'location']
+
+# Fields the scraped API's ?search matches against
+SEARCH_FIELDS = ['title', 'description', 'organizer']
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def partition_value(record, field):
+    """Lowercased value a record is filed under, or None; dict locations use their venue"""
+    value = record.get(field)
+    if isinstance(value, dict):
+        value = value.get('venue')
+    if value is None or value == '':
+        return None
+    return str(value).strip().lower()
+
+
+def slugify(value):
+    """File-system safe name for a partition value"""
+    slug = re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-')
+    return slug or 'blank'
+
+
+def search_words(record):
+    """Set of lowercased words in a record's search fields"""
+    words = set()
+    for field in SEARCH_FIELDS:
+        value = record.get(field)
+        if value:
+            words.update(TOKEN_PATTERN.findall(str(value).lower()))
+    return words
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+class PageWriter:
+    """Writes records to directory/page-<n>.json as each page of page_size fills up"""
+
+    def __init__(self, directory, page_size):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.page_size = page_size
+        self.buffer = []
+        self.count = 0
+        self.pages = 0
+
+    def write(self, record):
+        self.buffer.append(record)
+        self.count += 1
+        if len(self.buffer) == self.page_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records as the next page"""
+        if not self.buffer:
+            return
+        self.pages += 1
+        write_json(os.path.join(self.directory, f'page-{self.pages}.json'), self.buffer)
+        self.buffer = []
+
+
+def write_export_bundle(records, output_dir, page_size=DEFAULT_PAGE_SIZE):
+    """Write records as a paged, partitioned bundle under output_dir/hackathons_export
+
+    Layout: all/page-<n>.json holds every record in feed order; <field>/<slug>/
+    page-<n>.json holds the records whose status / category / location equals
+    one value. manifest.json lists every partition's value, slug, count and
+    page count, so a reader can serve any single-filter page by opening one
+    small file. search_index.json maps words to positions in all/ (position p
+    is on page p // pageSize + 1), so a search only opens the pages of its
+    candidate records. records is read once: each page is written as soon as
+    it fills, so at most one unfinished page per partition and the search
+    postings are held in memory. The bundle is built next to the live one and
+    renamed into place; the previous bundle is removed afterwards.
+    """
+    export_dir = os.path.join(output_dir, EXPORT_DIRNAME)
+    build_dir = f'{export_dir}.tmp-{os.getpid()}'
+    shutil.rmtree(build_dir, ignore_errors=True)
+
+    feed = PageWriter(os.path.join(build_dir, 'all'), page_size)
+    partitions = {field: {} for field in PARTITION_FIELDS}
+    used_slugs = {field: set() for field in PARTITION_FIELDS}
+    postings = {}
+    last_updated = None
+    for position, record in enumerate(records):
+        if position == 0:
+            last_updated = record.get('scraped_at')
+        feed.write(record)
+        for field in PARTITION_FIELDS:
+            value = partition_value(record, field)
+            if value is None:
+                continue
+            if value not in partitions[field]:
+                slug = base = slugify(value)
+                # 'AI/ML' and 'AI ML' would share a slug
+                suffix = 1
+                while slug in used_slugs[field]:
+                    suffix += 1
+                    slug = f'{base}-{suffix}'
+                used_slugs[field].add(slug)
+                partitions[field][value] = PageWriter(os.path.join(build_dir, field, slug), page_size)
+            partitions[field][value].write(record)
+        for word in search_words(record):
+            postings.setdefault(word, []).append(position)
+
+    feed.flush()
+    manifest = {
+        'version': EXPORT_VERSION,
+        'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'lastUpdated': last_updated,
+        'pageSize': page_size,
+        'total': feed.count,
+        'pages': feed.pages,
+        'partitions': {},
+        'searchIndex': SEARCH_INDEX_FILENAME,
+        'tokenCount': len(postings),
+    }
+    for field, writers in partitions.items():
+        entries = manifest['partitions'][field] = {}
+        for value, writer in sorted(writers.items()):
+            writer.flush()
+            entries[value] = {
+                'slug': os.path.basename(writer.directory),
+                'count': writer.count,
+                'pages': writer.pages,
+            }
+
+    write_json(os.path.join(build_dir, SEARCH_INDEX_FILENAME),
+               {'version': EXPORT_VERSION, 'fields': SEARCH_FIELDS, 'tokens': dict(sorted(postings.items()))})
+    write_json(os.path.join(build_dir, MANIFEST_FILENAME), manifest)
+
+    old_dir = f'{export_dir}.old-{os.getpid()}'
+    if os.path.exists(export_dir):
+        os.replace(export_dir, old_dir)
+    os.replace(build_dir, export_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    print(f"   - {export_dir}/ ({manifest['pages']} pages, "
+          f"{sum(len(entries) for entries in manifest['partitions'].values())} partitions, "
+          f"{manifest['tokenCount']} search tokens)")
+    return manifest
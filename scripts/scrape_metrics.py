@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+
+# Stages every scraper and the sync script report, in pipeline order
+STAGES = ['navigation', 'selector_wait', 'extraction', 'parsing', 'db_read', 'db_write']
+
+# Histogram bucket upper bounds in seconds, Prometheus style
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+DEFAULT_REPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'metrics')
+
+METRIC_PREFIX = 'hackathon_scrape'
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with sum, count, min and max"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        # One slot per bucket plus the +Inf overflow
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def cumulative(self):
+        """(upper bound, observations <= bound) pairs ending with +Inf"""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets + [float('inf')], self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile, capped at the observed max"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, running in self.cumulative():
+            if running >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'buckets': {('+Inf' if bound == float('inf') else str(bound)): running
+                        for bound, running in self.cumulative()},
+        }
+
+
+class ScrapeMetrics:
+    """Per-stage timings and throughput counters for one scrape or sync run
+
+    Stages are timed with `with metrics.stage('navigation'):` (also fine
+    around awaits) and land in one Histogram each. Cards and bytes fetched are
+    plain counters; report() turns them into cards/sec over the run's wall
+    time. Safe to share between threads.
+    """
+
+    def __init__(self, scraper, buckets=DEFAULT_BUCKETS):
+        self.scraper = scraper
+        self.histograms = {stage: Histogram(buckets) for stage in STAGES}
+        self.cards = 0
+        self.bytes_fetched = 0
+        self.pages = 0
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block and record it under stage `name`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name, seconds):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.histograms[STAGES[0]].buckets)
+            histogram.observe(seconds)
+
+    def add_cards(self, count):
+        with self.lock:
+            self.cards += count
+
+    def add_bytes(self, count, pages=1):
+        """Count a fetched body of `count` bytes"""
+        with self.lock:
+            self.bytes_fetched += count
+            self.pages += pages
+
+    def watch(self, target):
+        """Count response bytes of a Playwright page or context (sync or async API)
+
+        Uses the Content-Length header, so chunked responses without one are
+        not counted.
+        """
+        def on_response(response):
+            try:
+                self.add_bytes(int(response.headers.get('content-length', 0)))
+            except (TypeError, ValueError):
+                pass
+        target.on('response', on_response)
+
+    def report(self):
+        """JSON-ready summary of the run so far"""
+        elapsed = time.monotonic() - self.started
+        with self.lock:
+            return {
+                'scraper': self.scraper,
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+                'duration_seconds': round(elapsed, 3),
+                'cards': self.cards,
+                'cards_per_second': round(self.cards / elapsed, 3) if elapsed > 0 else None,
+                'pages_fetched': self.pages,
+                'bytes_fetched': self.bytes_fetched,
+                'stages': {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            }
+
+    def to_prometheus(self):
+        """Report in the Prometheus text exposition format"""
+        report = self.report()
+        label = f'scraper="{self.scraper}"'
+        lines = [
+            f'# HELP {METRIC_PREFIX}_stage_seconds Time spent per scrape stage',
+            f'# TYPE {METRIC_PREFIX}_stage_seconds histogram',
+        ]
+        with self.lock:
+            for name, histogram in self.histograms.items():
+                stage_label = f'{label},stage="{name}"'
+                for bound, running in histogram.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(float(bound))
+                    lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{{stage_label},le="{le}"}} {running}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{{stage_label}}} {histogram.sum}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{{stage_label}}} {histogram.count}')
+
+        for name, kind, help_text, value in (
+            ('cards_total', 'counter', 'Cards or records processed', report['cards']),
+            ('pages_fetched_total', 'counter', 'Pages or files fetched', report['pages_fetched']),
+            ('bytes_fetched_total', 'counter', 'Response bytes fetched', report['bytes_fetched']),
+            ('duration_seconds', 'gauge', 'Wall time of the run', report['duration_seconds']),
+            ('cards_per_second', 'gauge', 'Cards processed per second of wall time', report['cards_per_second'] or 0),
+        ):
+            lines.append(f'# HELP {METRIC_PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {METRIC_PREFIX}_{name} {kind}')
+            lines.append(f'{METRIC_PREFIX}_{name}{{{label}}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, json_path=None, prometheus_path=None):
+        """Write the JSON report (default scripts/data/metrics/<scraper>.json) and optionally Prometheus text"""
+        json_path = json_path or os.path.join(DEFAULT_REPORT_DIR, f'{self.scraper}.json')
+        for path, content in ((json_path, json.dumps(self.report(), indent=2)),
+                              (prometheus_path, self.to_prometheus() if prometheus_path else None)):
+            if not path:
+                continue
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        print(f"📈 Metrics written to {json_path}" + (f" and {prometheus_path}" if prometheus_path else ""))
+
+    def print_summary(self):
+        """One line per stage that saw any work"""
+        report = self.report()
+        print(f"📈 {report['cards']} cards in {report['duration_seconds']}s "
+              f"({report['cards_per_second']} cards/s, {report['bytes_fetched'] / 1024:.0f} KB fetched)")
+        for name, stats in report['stages'].items():
+            if stats['count']:
+                print(f"   ⏱️ {name}: {stats['count']}x, total {stats['sum']:.3f}s, "
+                      f"p50 {stats['p50']:.3f}s, p95 {stats['p95']:.3f}s")
+
+
+def timed(metrics, stage):
+    """metrics.stage(stage), or a no-op when metrics is None"""
+    return metrics.stage(stage) if metrics else nullcontext()
+
+
+def add_metrics_args(parser):
+    """Add the shared --metrics-json / --metrics-prom options to an argparse parser"""
+    parser.add_argument('--metrics-json', default=None,
+                        help='Write the timing report here (default: scripts/data/metrics/<scraper>.json)')
+    parser.add_argument('--metrics-prom', default=None,
+                        help='Also write the report in Prometheus text format to this file')
+    return parser
@@ -0,0 +1,114 @@
+import json
+import os
+
+from scrape_export import write_export_bundle
+
+# fsync the in-progress NDJSON file after this many records
+DEFAULT_FSYNC_EVERY = 25
+
+DYNAMIC_FILENAME = 'hackathons_dynamic'
+SIMPLE_FILENAME = 'hackathons_simple'
+
+# Fields kept in hackathons_simple.json for quick API use
+SIMPLE_FIELDS = ['id', 'title', 'description', 'startDate', 'endDate', 'location', 'url', 'status']
+
+
+def iter_ndjson_file(path):
+    """Yield one record per non-empty line of an NDJSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def write_json_array(path, records):
+    """Atomically write records as a JSON array with one compact record per line"""
+    tmp_path = path + '.tmp'
+    count = 0
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for record in records:
+            f.write(',\n' if count else '\n')
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+            count += 1
+        f.write('\n]\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+class HackathonStreamWriter:
+    """Append scraped hackathons to disk as NDJSON while the scrape runs
+
+    Records go to data/hackathons_dynamic.ndjson.part as they are scraped, so a
+    crash keeps everything written so far. close() renames the part file into
+    place and derives hackathons_dynamic.json (and optionally the simplified
+    file) by re-reading the stream, never holding a second copy in memory.
+    With export_bundle it also writes the paged, partitioned
+    hackathons_export/ bundle (see scrape_export) for the scraped-data API.
+    """
+
+    def __init__(self, output_dir='data', simple_fields=None, fsync_every=DEFAULT_FSYNC_EVERY,
+                 export_bundle=True):
+        self.output_dir = output_dir
+        self.simple_fields = simple_fields
+        self.export_bundle = export_bundle
+        self.fsync_every = fsync_every
+        self.count = 0
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.ndjson_path = os.path.join(output_dir, f'{DYNAMIC_FILENAME}.ndjson')
+        self.part_path = self.ndjson_path + '.part'
+        self.file = open(self.part_path, 'w', encoding='utf-8')
+
+    def write(self, record):
+        """Append one record as a compact JSON line"""
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.file.flush()
+        self.count += 1
+        if self.count % self.fsync_every == 0:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        """Finish the stream: fsync, rename into place and derive the JSON files"""
+        if self.file.closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.part_path, self.ndjson_path)
+
+        dynamic_path = os.path.join(self.output_dir, f'{DYNAMIC_FILENAME}.json')
+        write_json_array(dynamic_path, iter_ndjson_file(self.ndjson_path))
+        print(f"💾 Data saved to:")
+        print(f"   - {dynamic_path} ({self.count} items)")
+
+        if self.simple_fields:
+            simple_path = os.path.join(self.output_dir, f'{SIMPLE_FILENAME}.json')
+            write_json_array(simple_path, (
+                {field: record.get(field) for field in self.simple_fields}
+                for record in iter_ndjson_file(self.ndjson_path)
+            ))
+            print(f"   - {simple_path} (simplified)")
+
+        if self.export_bundle:
+            write_export_bundle(iter_ndjson_file(self.ndjson_path), self.output_dir)
+
+    def abort(self):
+        """Stop writing but leave the .part file for inspection or resume"""
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
@@ -1,10 +1,15 @@
+import argparse
 import json
 import os
+import re
 import sys
 from datetime import datetime, timedelta
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo import MongoClient, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, OperationFailure
 import logging
+from card_features import CATEGORIES, DEFAULT_CATEGORY, classify_batch
+from fingerprints import make_dedup_key
+from scrape_metrics import ScrapeMetrics, add_metrics_args
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,18 +21,101 @@ DB_NAME = 'hackathon_calendar'
 COLLECTION_NAME = 'hackathons'
 TRASH_COLLECTION_NAME = 'hackathons_trash'
 
+SCRAPED_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'hackathons_dynamic.json')
+
+# Bytes read per chunk when streaming a JSON array
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Characters that may follow a complete array item
+JSON_DELIMITERS = frozenset(' \t\n\r,]')
+
+# Number of scraped hackathons resolved per prefetch query / bulk_write call in batched mode
+DEFAULT_BATCH_SIZE = 500
+
+# 'server' recomputes statuses with update_many in MongoDB, 'python' loads every document
+STATUS_MODES = ('server', 'python')
+DEFAULT_STATUS_MODE = 'server'
+
+# Counters reported by print_sync_summary; the first three count scraped items
+SYNC_STATS = ('new_hackathons', 'updated_hackathons', 'duplicates_skipped', 'status_updates')
+
+# Categories a person or the keyword classifier chose; anything else is re-derived by --backfill-categories
+SPECIFIC_CATEGORIES = [category for category in CATEGORIES if category != DEFAULT_CATEGORY]
+
+def iter_json_array(f, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield the items of a top-level JSON array one at a time without loading the whole file"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    started = False
+
+    def fill(buffer, pos):
+        chunk = f.read(chunk_size)
+        return buffer[pos:] + chunk, 0, not chunk
+
+    while True:
+        # Skip whitespace and separators until the next value
+        while pos < len(buffer) and (buffer[pos].isspace() or (started and buffer[pos] == ',')):
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise json.JSONDecodeError('Unterminated array', buffer, pos)
+            buffer, pos, eof = fill(buffer, pos)
+            continue
+
+        if not started:
+            if buffer[pos] != '[':
+                raise json.JSONDecodeError('Expected a JSON array', buffer, pos)
+            started = True
+            pos += 1
+            continue
+
+        if buffer[pos] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            buffer, pos, eof = fill(buffer, pos)
+            continue
+
+        if not eof and (end == len(buffer) or buffer[end] not in JSON_DELIMITERS):
+            # A bare number may continue in the next chunk ("6." decodes as 6 before "5" arrives)
+            buffer, pos, eof = fill(buffer, pos)
+            continue
+
+        yield item
+        pos = end
+
+def new_sync_stats():
+    """Zeroed sync counters"""
+    return dict.fromkeys(SYNC_STATS, 0)
+
+def iter_ndjson(f):
+    """Yield one JSON document per non-empty line"""
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
 class HackathonSyncManager:
-    def __init__(self):
-        self.client = None
+    def __init__(self, client=None):
+        # An injected client (local mongod, mongomock) skips MONGODB_URI
+        self.client = client
         self.db = None
         self.hackathons_collection = None
         self.trash_collection = None
+        self.metrics = ScrapeMetrics('sync')
         self.connect_to_mongodb()
 
     def connect_to_mongodb(self):
         """Connect to MongoDB"""
         try:
-            self.client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
+            if self.client is None:
+                self.client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000)
             # Test the connection
             self.client.admin.command('ping')
             self.db = self.client[DB_NAME]
@@ -36,6 +124,10 @@ class HackathonSyncManager:
 
             # Create indexes for better performance
             self.hackathons_collection.create_index([('title', 1), ('location.venue', 1)], unique=False)
+            self.hackathons_collection.create_index(
+                'dedupKey', unique=True,
+                partialFilterExpression={'dedupKey': {'$exists': True}}
+            )
             self.hackathons_collection.create_index('status')
             self.hackathons_collection.create_index('registrationDeadline')
             self.trash_collection.create_index('deletedAt')
@@ -45,12 +137,12 @@ class HackathonSyncManager:
             logger.error("❌ Failed to connect to MongoDB")
             sys.exit(1)
 
-    def load_scraped_data(self):
+    def load_scraped_data(self, data_path=SCRAPED_DATA_PATH):
         """Load scraped hackathon data from JSON file"""
         try:
-            data_path = os.path.join(os.path.dirname(__file__), 'data', 'hackathons_dynamic.json')
-            with open(data_path, 'r', encoding='utf-8') as f:
+            with self.metrics.stage('parsing'), open(data_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+            self.metrics.add_bytes(os.path.getsize(data_path))
             logger.info(f"📁 Loaded {len(data)} hackathons from scraped data")
             return data
         except FileNotFoundError:
@@ -60,10 +152,49 @@ class HackathonSyncManager:
             logger.error("❌ Invalid JSON in scraped data file")
             return []
 
+    def iter_scraped_data(self, data_path=SCRAPED_DATA_PATH):
+        """Stream scraped hackathons item by item from a JSON array or NDJSON file
+
+        A missing file or invalid JSON is logged and re-raised, so a sync that
+        stops partway never goes on to recompute statuses or report success.
+        """
+        count = 0
+        try:
+            with open(data_path, 'r', encoding='utf-8') as f:
+                # NDJSON files start with an object, JSON arrays with '['
+                first = ''
+                while not first:
+                    char = f.read(1)
+                    if not char:
+                        break
+                    if not char.isspace():
+                        first = char
+                f.seek(0)
+
+                items = iter_json_array(f) if first == '[' else iter_ndjson(f)
+                for item in items:
+                    count += 1
+                    yield item
+            self.metrics.add_bytes(os.path.getsize(data_path))
+            logger.info(f"📁 Streamed {count} hackathons from scraped data")
+        except FileNotFoundError:
+            logger.error("❌ Scraped data file not found. Run the scraper first.")
+            raise
+        except json.JSONDecodeError:
+            logger.error(f"❌ Invalid JSON in scraped data file after {count} hackathons")
+            raise
+
     def filter_expired_hackathons(self, hackathons):
         """Filter out expired hackathons, only keep ongoing/upcoming"""
+        counts = {'kept': 0, 'expired': 0}
+        filtered = list(self.iter_unexpired_hackathons(hackathons, counts))
+
+        logger.info(f"🎯 Filtered to {counts['kept']} ongoing/upcoming hackathons (removed {counts['expired']} expired)")
+        return filtered
+
+    def iter_unexpired_hackathons(self, hackathons, counts):
+        """Lazily yield ongoing/upcoming hackathons, tallying kept/expired into counts"""
         now = datetime.now()
-        filtered = []
 
         for hackathon in hackathons:
             try:
@@ -71,41 +202,122 @@ class HackathonSyncManager:
                 deadline_str = hackathon.get('registrationDeadline')
                 if deadline_str:
                     deadline = datetime.strptime(deadline_str, '%Y-%m-%d')
-                    if deadline > now:
-                        filtered.append(hackathon)
-                else:
-                    # If no deadline, assume it's upcoming
-                    filtered.append(hackathon)
+                    if deadline <= now:
+                        counts['expired'] += 1
+                        continue
+                # If no deadline, assume it's upcoming
             except (ValueError, TypeError):
                 # If date parsing fails, include it anyway
-                filtered.append(hackathon)
+                pass
 
-        logger.info(f"🎯 Filtered to {len(filtered)} ongoing/upcoming hackathons (removed {len(hackathons) - len(filtered)} expired)")
-        return filtered
+            counts['kept'] += 1
+            yield hackathon
 
     def find_duplicate_hackathon(self, title, location):
         """Check if hackathon already exists in database"""
-        # Normalize location for comparison
-        venue = location.get('venue', '') if isinstance(location, dict) else str(location)
-
-        # Find by title and location (case-insensitive)
-        existing = self.hackathons_collection.find_one({
-            'title': {'$regex': f'^{re.escape(title)}$', '$options': 'i'},
-            'location.venue': {'$regex': f'^{re.escape(venue)}$', '$options': 'i'},
-            'status': {'$ne': 'trashed'}  # Don't match trashed items
-        })
+        # Indexed point lookup on the normalized title + venue key.
+        # Documents stored before dedupKey existed need --backfill-dedup-keys once.
+        with self.metrics.stage('db_read'):
+            existing = self.hackathons_collection.find_one({
+                'dedupKey': make_dedup_key(title, location),
+                'status': {'$ne': 'trashed'}  # Don't match trashed items
+            })
 
         return existing
 
+    def backfill_dedup_keys(self, batch_size=DEFAULT_BATCH_SIZE):
+        """One-off: set dedupKey on documents stored before it existed"""
+        logger.info("🔑 Backfilling dedup keys...")
+
+        stats = {'backfilled': 0, 'conflicts': 0}
+        seen_keys = set()
+        operations = []
+
+        cursor = self.hackathons_collection.find(
+            {'dedupKey': {'$exists': False}, 'status': {'$ne': 'trashed'}},
+            {'title': 1, 'location.venue': 1}
+        )
+        for doc in cursor:
+            key = make_dedup_key(doc.get('title', ''), doc.get('location', {}))
+            if key in seen_keys:
+                # Older duplicate already claimed this key; leave it for manual review
+                stats['conflicts'] += 1
+                logger.warning(f"⚠️ Duplicate left without dedup key: {doc.get('title', 'Unknown')} ({doc['_id']})")
+                continue
+            seen_keys.add(key)
+            operations.append(UpdateOne(
+                {'_id': doc['_id'], 'dedupKey': {'$exists': False}},
+                {'$set': {'dedupKey': key}}
+            ))
+
+            if len(operations) >= batch_size:
+                self.flush_backfill(operations, stats)
+                operations = []
+
+        self.flush_backfill(operations, stats)
+        logger.info(f"🔑 Backfilled {stats['backfilled']} dedup keys ({stats['conflicts']} duplicates skipped)")
+        return stats
+
+    def flush_backfill(self, operations, stats):
+        """Write one chunk of dedupKey updates, counting unique-index conflicts"""
+        if not operations:
+            return
+        try:
+            result = self.hackathons_collection.bulk_write(operations, ordered=False)
+            stats['backfilled'] += result.modified_count
+        except BulkWriteError as e:
+            errors = e.details.get('writeErrors', [])
+            stats['backfilled'] += e.details.get('nModified', 0)
+            stats['conflicts'] += sum(1 for error in errors if error.get('code') == 11000)
+
+    def backfill_categories(self, batch_size=DEFAULT_BATCH_SIZE):
+        """One-off: classify documents stored with a placeholder or missing category"""
+        logger.info("🏷️ Backfilling categories...")
+
+        stats = {'scanned': 0, 'updated': 0}
+        cursor = self.hackathons_collection.find(
+            {'category': {'$nin': SPECIFIC_CATEGORIES}, 'status': {'$ne': 'trashed'}},
+            {'title': 1, 'category': 1}
+        ).batch_size(batch_size)
+
+        batch = []
+        for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                self.flush_categories(batch, stats)
+                batch = []
+        self.flush_categories(batch, stats)
+
+        logger.info(f"🏷️ Classified {stats['scanned']} documents, updated {stats['updated']} categories")
+        return stats
+
+    def flush_categories(self, docs, stats):
+        """Classify one chunk of titles in a single pass and write the changed categories"""
+        if not docs:
+            return
+        stats['scanned'] += len(docs)
+        classified = classify_batch([doc.get('title', '') for doc in docs])
+        operations = [
+            UpdateOne({'_id': doc['_id']}, {
+                '$set': {'category': category, 'updatedAt': datetime.now()},
+                '$addToSet': {'tags': {'$each': tags}}
+            })
+            for doc, (category, tags) in zip(docs, classified)
+            if category != doc.get('category')
+        ]
+        if operations:
+            result = self.hackathons_collection.bulk_write(operations, ordered=False)
+            stats['updated'] += result.modified_count
+
     def update_hackathon_status(self, hackathon):
         """Update hackathon status based on current date"""
         now = datetime.now()
 
         try:
-            # Parse dates
-            start_date = datetime.strptime(hackathon['startDate'], '%Y-%m-%d')
-            end_date = datetime.strptime(hackathon['endDate'], '%Y-%m-%d')
-            reg_deadline = datetime.strptime(hackathon.get('registrationDeadline', hackathon['startDate']), '%Y-%m-%d')
+            # Parse dates (stored documents already hold datetimes)
+            start_date = self.as_datetime(hackathon['startDate'])
+            end_date = self.as_datetime(hackathon['endDate'])
+            reg_deadline = self.as_datetime(hackathon.get('registrationDeadline', hackathon['startDate']))
 
             # Determine status
             if now > reg_deadline:
@@ -122,33 +334,65 @@ class HackathonSyncManager:
                 logger.info(f"📊 Status update: {hackathon['title']} -> {new_status}")
                 return new_status
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             logger.warning(f"⚠️ Could not update status for {hackathon.get('title', 'Unknown')}: {e}")
 
         return hackathon.get('status', 'upcoming')
 
-    def sync_scraped_hackathons(self):
-        """Main sync function"""
+    def as_datetime(self, value):
+        """Return value as a datetime, parsing 'YYYY-MM-DD' strings"""
+        if isinstance(value, datetime):
+            return value
+        return datetime.strptime(value, '%Y-%m-%d')
+
+    def sync_scraped_hackathons(self, batch_size=None, status_mode=DEFAULT_STATUS_MODE,
+                                stream=False, data_path=SCRAPED_DATA_PATH):
+        """Main sync function
+
+        With batch_size set, existing matches are prefetched and writes are sent
+        through chunked bulk_write calls instead of one round trip per hackathon.
+        With stream set, the scraped file is read item by item and flows through
+        the expiry filter and sync loop as generators, so memory stays flat.
+        """
         logger.info("🚀 Starting hackathon sync process...")
 
-        # Load scraped data
-        scraped_data = self.load_scraped_data()
-        if not scraped_data:
-            return
+        if stream:
+            filter_counts = {'kept': 0, 'expired': 0}
+            active_hackathons = self.iter_unexpired_hackathons(self.iter_scraped_data(data_path), filter_counts)
+        else:
+            # Load scraped data
+            scraped_data = self.load_scraped_data(data_path)
+            if not scraped_data:
+                return
 
-        # Filter out expired hackathons
-        active_hackathons = self.filter_expired_hackathons(scraped_data)
+            # Filter out expired hackathons
+            active_hackathons = self.filter_expired_hackathons(scraped_data)
 
         # Stats tracking
-        stats = {
-            'new_hackathons': 0,
-            'updated_hackathons': 0,
-            'duplicates_skipped': 0,
-            'status_updates': 0
-        }
+        stats = new_sync_stats()
+
+        if batch_size:
+            self.sync_in_batches(active_hackathons, stats, batch_size)
+        else:
+            self.sync_one_by_one(active_hackathons, stats)
+
+        self.metrics.add_cards(stats['new_hackathons'] + stats['updated_hackathons'] + stats['duplicates_skipped'])
+
+        if stream:
+            logger.info(f"🎯 Synced {filter_counts['kept']} ongoing/upcoming hackathons (removed {filter_counts['expired']} expired)")
+
+        # Update status for all existing hackathons
+        self.update_all_hackathon_statuses(status_mode)
 
-        # Process each hackathon
-        for hackathon in active_hackathons:
+        # Clean up old trashed items
+        self.cleanup_old_trash()
+
+        # Print summary
+        self.print_sync_summary(stats)
+
+    def sync_one_by_one(self, hackathons, stats):
+        """Sync hackathons with one lookup and one write per item"""
+        for hackathon in hackathons:
             title = hackathon.get('title', '').strip()
             location = hackathon.get('location', {})
 
@@ -161,26 +405,14 @@ class HackathonSyncManager:
 
             if existing:
                 # Update existing hackathon
-                updates = {}
-
-                # Update status
-                new_status = self.update_hackathon_status(existing)
-                if new_status and new_status != existing.get('status'):
-                    updates['status'] = new_status
-                    stats['status_updates'] += 1
-
-                # Update other fields if they changed
-                fields_to_check = ['prize', 'registrationDeadline', 'url', 'organizer']
-                for field in fields_to_check:
-                    if field in hackathon and hackathon[field] != existing.get(field):
-                        updates[field] = hackathon[field]
+                updates = self.compute_updates(existing, hackathon, stats)
 
                 if updates:
-                    updates['updatedAt'] = datetime.now()
-                    self.hackathons_collection.update_one(
-                        {'_id': existing['_id']},
-                        {'$set': updates}
-                    )
+                    with self.metrics.stage('db_write'):
+                        self.hackathons_collection.update_one(
+                            {'_id': existing['_id']},
+                            {'$set': updates}
+                        )
                     stats['updated_hackathons'] += 1
                     logger.info(f"🔄 Updated: {title}")
                 else:
@@ -188,72 +420,248 @@ class HackathonSyncManager:
                     logger.debug(f"⏭️ Skipped duplicate: {title}")
 
             else:
-                # Add new hackathon
-                # Prepare document for MongoDB
-                mongo_doc = {
-                    'title': title,
-                    'description': hackathon.get('description', ''),
-                    'organizer': hackathon.get('organizer', 'Unstop'),
-                    'category': hackathon.get('category', 'Technology'),
-                    'difficulty': hackathon.get('difficulty', 'Intermediate'),
-                    'startDate': datetime.strptime(hackathon['startDate'], '%Y-%m-%d'),
-                    'endDate': datetime.strptime(hackathon['endDate'], '%Y-%m-%d'),
-                    'registrationDeadline': datetime.strptime(hackathon.get('registrationDeadline', hackathon['startDate']), '%Y-%m-%d'),
-                    'location': {
-                        'type': hackathon.get('location', {}).get('type', 'online'),
-                        'venue': hackathon.get('location', {}).get('venue', 'Online'),
-                        'address': hackathon.get('location', {}).get('address', {})
-                    },
-                    'prizes': [{
-                        'position': '1st',
-                        'amount': self.parse_prize_amount(hackathon.get('prize', '0')),
-                        'currency': 'INR'
-                    }] if hackathon.get('prize') else [],
-                    'maxParticipants': 100,  # Default
-                    'currentParticipants': 0,
-                    'teamSize': hackathon.get('teamSize', {'min': 1, 'max': 4}),
-                    'technologies': [],
-                    'requirements': [],
-                    'tags': [hackathon.get('category', 'Technology').lower()],
-                    'status': hackathon.get('status', 'upcoming'),
-                    'featured': hackathon.get('featured', False),
-                    'verified': False,
-                    'links': {
-                        'website': hackathon.get('url', ''),
-                        'registration': hackathon.get('url', '')
-                    },
-                    'contactInfo': {},
-                    'schedule': [],
-                    'faqs': [],
-                    'source': 'scraped',
-                    'scrapedAt': datetime.strptime(hackathon['scraped_at'], '%Y-%m-%d %H:%M:%S'),
-                    'createdAt': datetime.now(),
-                    'updatedAt': datetime.now()
-                }
-
                 # Insert new hackathon
-                result = self.hackathons_collection.insert_one(mongo_doc)
+                try:
+                    with self.metrics.stage('db_write'):
+                        self.hackathons_collection.insert_one(self.build_mongo_doc(title, hackathon))
+                except DuplicateKeyError:
+                    # A trashed or concurrently inserted document already holds the key
+                    stats['duplicates_skipped'] += 1
+                    logger.debug(f"⏭️ Skipped duplicate: {title}")
+                    continue
                 stats['new_hackathons'] += 1
                 logger.info(f"➕ Added new: {title}")
 
-        # Update status for all existing hackathons
-        self.update_all_hackathon_statuses()
+    def sync_in_batches(self, hackathons, stats, batch_size=DEFAULT_BATCH_SIZE):
+        """Sync hackathons in windows of batch_size: one prefetch query and one bulk_write per window"""
+        window = []
+        for hackathon in hackathons:
+            title = hackathon.get('title', '').strip()
+            if not title:
+                logger.warning("⚠️ Skipping hackathon with no title")
+                continue
 
-        # Clean up old trashed items
-        self.cleanup_old_trash()
+            window.append((title, hackathon))
+            if len(window) >= batch_size:
+                self.sync_window(window, stats)
+                window = []
+
+        if window:
+            self.sync_window(window, stats)
+
+    def sync_window(self, window, stats):
+        """Resolve one window of (title, hackathon) pairs against a single prefetch and flush it
+
+        Each write keeps the stats of the items behind it and only adds them
+        once MongoDB accepts it; a rejected write (e.g. a dedupKey held by a
+        trashed document) counts its items as skipped duplicates, exactly as
+        sync_one_by_one does.
+        """
+        existing_by_key = self.prefetch_existing(window)
+        inserts = {}
+        updates_by_id = {}
+        # Stats each pending write adds if it succeeds, keyed like inserts / updates_by_id
+        insert_stats = {}
+        update_stats = {}
+
+        for title, hackathon in window:
+            key = make_dedup_key(title, hackathon.get('location', {}))
+            existing = existing_by_key.get(key)
 
-        # Print summary
-        self.print_sync_summary(stats)
+            if existing:
+                if key in inserts:
+                    pending = insert_stats[key]
+                else:
+                    pending = update_stats.setdefault(existing['_id'], new_sync_stats())
+                updates = self.compute_updates(existing, hackathon, pending)
+
+                if updates:
+                    # Later duplicates in the same window must see these values,
+                    # exactly as they would after a sequential update_one
+                    existing.update(updates)
+                    if key not in inserts:
+                        updates_by_id.setdefault(existing['_id'], {}).update(updates)
+                    pending['updated_hackathons'] += 1
+                    logger.info(f"🔄 Updated: {title}")
+                else:
+                    pending['duplicates_skipped'] += 1
+                    logger.debug(f"⏭️ Skipped duplicate: {title}")
+
+            else:
+                mongo_doc = self.build_mongo_doc(title, hackathon)
+                inserts[key] = mongo_doc
+                existing_by_key[key] = mongo_doc
+                insert_stats[key] = dict(new_sync_stats(), new_hackathons=1)
+                logger.info(f"➕ Added new: {title}")
+
+        writes = [(InsertOne(doc), insert_stats[key]) for key, doc in inserts.items()]
+        for _id, pending in update_stats.items():
+            if _id in updates_by_id:
+                writes.append((UpdateOne({'_id': _id}, {'$set': updates_by_id[_id]}), pending))
+            else:
+                self.add_stats(stats, pending)
+
+        failed = self.apply_bulk([operation for operation, _ in writes])
+        for index, (_, pending) in enumerate(writes):
+            if index in failed:
+                stats['duplicates_skipped'] += sum(pending[field] for field in SYNC_STATS[:3])
+            else:
+                self.add_stats(stats, pending)
+
+    def add_stats(self, stats, pending):
+        """Fold one write's stats into the running totals"""
+        for field in SYNC_STATS:
+            stats[field] += pending[field]
+
+    def prefetch_existing(self, window):
+        """Fetch every stored hackathon that can match the window in one indexed query"""
+        keys = list({make_dedup_key(title, hackathon.get('location', {})) for title, hackathon in window})
+        with self.metrics.stage('db_read'):
+            cursor = self.hackathons_collection.find({
+                'dedupKey': {'$in': keys},
+                'status': {'$ne': 'trashed'}  # Don't match trashed items
+            })
+            return {doc['dedupKey']: doc for doc in cursor}
+
+    def apply_bulk(self, operations):
+        """Send operations to MongoDB with a single unordered bulk_write; returns the indexes that failed"""
+        if not operations:
+            return set()
+        try:
+            with self.metrics.stage('db_write'):
+                result = self.hackathons_collection.bulk_write(operations, ordered=False)
+            logger.info(f"📦 Bulk write: {result.inserted_count} inserted, {result.modified_count} updated")
+            return set()
+        except BulkWriteError as e:
+            errors = e.details.get('writeErrors', [])
+            logger.warning(f"⚠️ Bulk write: {e.details.get('nInserted', 0)} inserted, "
+                           f"{e.details.get('nModified', 0)} updated, {len(errors)} rejected")
+            return {error['index'] for error in errors}
+
+    def compute_updates(self, existing, hackathon, stats):
+        """Return the $set fields needed to bring an existing hackathon up to date"""
+        updates = {}
+
+        # Update status
+        new_status = self.update_hackathon_status(existing)
+        if new_status and new_status != existing.get('status'):
+            updates['status'] = new_status
+            stats['status_updates'] += 1
+
+        # Update other fields if they changed
+        fields_to_check = ['prize', 'registrationDeadline', 'url', 'organizer']
+        for field in fields_to_check:
+            if field in hackathon and hackathon[field] != existing.get(field):
+                updates[field] = hackathon[field]
+
+        if updates:
+            updates['updatedAt'] = datetime.now()
+        return updates
+
+    def build_mongo_doc(self, title, hackathon):
+        """Prepare a scraped hackathon as a new MongoDB document"""
+        return {
+            'title': title,
+            'dedupKey': make_dedup_key(title, hackathon.get('location', {})),
+            'description': hackathon.get('description', ''),
+            'organizer': hackathon.get('organizer', 'Unstop'),
+            'category': hackathon.get('category', 'Technology'),
+            'difficulty': hackathon.get('difficulty', 'Intermediate'),
+            'startDate': datetime.strptime(hackathon['startDate'], '%Y-%m-%d'),
+            'endDate': datetime.strptime(hackathon['endDate'], '%Y-%m-%d'),
+            'registrationDeadline': datetime.strptime(hackathon.get('registrationDeadline', hackathon['startDate']), '%Y-%m-%d'),
+            'location': {
+                'type': hackathon.get('location', {}).get('type', 'online'),
+                'venue': hackathon.get('location', {}).get('venue', 'Online'),
+                'address': hackathon.get('location', {}).get('address', {})
+            },
+            'prizes': [{
+                'position': '1st',
+                'amount': self.parse_prize_amount(hackathon.get('prize', '0')),
+                'currency': 'INR'
+            }] if hackathon.get('prize') else [],
+            'maxParticipants': 100,  # Default
+            'currentParticipants': 0,
+            'teamSize': hackathon.get('teamSize', {'min': 1, 'max': 4}),
+            'technologies': [],
+            'requirements': [],
+            'tags': hackathon.get('tags') or [hackathon.get('category', 'Technology').lower()],
+            'status': hackathon.get('status', 'upcoming'),
+            'featured': hackathon.get('featured', False),
+            'verified': False,
+            'links': {
+                'website': hackathon.get('url', ''),
+                'registration': hackathon.get('url', '')
+            },
+            'contactInfo': {},
+            'schedule': [],
+            'faqs': [],
+            'source': 'scraped',
+            'scrapedAt': datetime.strptime(hackathon['scraped_at'], '%Y-%m-%d %H:%M:%S'),
+            'createdAt': datetime.now(),
+            'updatedAt': datetime.now()
+        }
 
-    def update_all_hackathon_statuses(self):
+    def update_all_hackathon_statuses(self, status_mode=DEFAULT_STATUS_MODE):
         """Update status for all existing hackathons based on current dates"""
         logger.info("📊 Updating status for all existing hackathons...")
 
         now = datetime.now()
+
+        if status_mode == 'server':
+            try:
+                updates_count = self.recompute_statuses_on_server(now)
+                logger.info(f"📊 Updated status for {updates_count} hackathons")
+                return
+            except OperationFailure as e:
+                logger.warning(f"⚠️ Server-side status update failed ({e}), falling back to Python")
+
+        updates_count = self.recompute_statuses_in_python(now)
+        logger.info(f"📊 Updated status for {updates_count} hackathons")
+
+    def recompute_statuses_on_server(self, now):
+        """Apply status transitions as date-range update_many calls, one per target status"""
+        # Same precedence as recompute_statuses_in_python; registrationDeadline
+        # falls back to startDate when missing
+        deadline_passed = {'$or': [
+            {'registrationDeadline': {'$lt': now}},
+            {'registrationDeadline': {'$exists': False}, 'startDate': {'$lt': now}}
+        ]}
+        deadline_open = {'$or': [
+            {'registrationDeadline': {'$gte': now}},
+            {'registrationDeadline': {'$exists': False}, 'startDate': {'$gte': now}}
+        ]}
+        transitions = {
+            'registration_closed': [deadline_passed],
+            'ongoing': [deadline_open, {'startDate': {'$lte': now}, 'endDate': {'$gte': now}}],
+            'upcoming': [deadline_open, {'startDate': {'$gt': now}}],
+            'completed': [deadline_open, {'startDate': {'$lte': now}, 'endDate': {'$lt': now}}]
+        }
+
+        updates_count = 0
+        for new_status, conditions in transitions.items():
+            query = {'$and': [
+                # Only documents whose status actually changes; non-date fields are skipped like in Python
+                {'status': {'$nin': ['trashed', new_status]}},
+                {'startDate': {'$type': 'date'}, 'endDate': {'$type': 'date'}},
+                *conditions
+            ]}
+            with self.metrics.stage('db_write'):
+                result = self.hackathons_collection.update_many(
+                    query,
+                    {'$set': {'status': new_status, 'updatedAt': now}}
+                )
+            updates_count += result.modified_count
+
+        return updates_count
+
+    def recompute_statuses_in_python(self, now):
+        """Fallback: load every hackathon and update changed statuses one by one"""
         updates_count = 0
 
         # Find all non-trashed hackathons
-        hackathons = list(self.hackathons_collection.find({'status': {'$ne': 'trashed'}}))
+        with self.metrics.stage('db_read'):
+            hackathons = list(self.hackathons_collection.find({'status': {'$ne': 'trashed'}}))
 
         for hackathon in hackathons:
             try:
@@ -273,16 +681,17 @@ class HackathonSyncManager:
 
                 # Update if status changed
                 if hackathon.get('status') != new_status:
-                    self.hackathons_collection.update_one(
-                        {'_id': hackathon['_id']},
-                        {'$set': {'status': new_status, 'updatedAt': now}}
-                    )
+                    with self.metrics.stage('db_write'):
+                        self.hackathons_collection.update_one(
+                            {'_id': hackathon['_id']},
+                            {'$set': {'status': new_status, 'updatedAt': now}}
+                        )
                     updates_count += 1
 
             except (KeyError, TypeError) as e:
                 logger.warning(f"⚠️ Could not update status for {hackathon.get('title', 'Unknown')}: {e}")
 
-        logger.info(f"📊 Updated status for {updates_count} hackathons")
+        return updates_count
 
     def parse_prize_amount(self, prize_str):
         """Parse prize amount from string"""
@@ -328,9 +737,10 @@ class HackathonSyncManager:
         """Remove items from trash that are older than 7 days"""
         cutoff_date = datetime.now() - timedelta(days=7)
 
-        result = self.trash_collection.delete_many({
-            'autoDeleteAfter': {'$lt': datetime.now()}
-        })
+        with self.metrics.stage('db_write'):
+            result = self.trash_collection.delete_many({
+                'autoDeleteAfter': {'$lt': datetime.now()}
+            })
 
         if result.deleted_count > 0:
             logger.info(f"🧹 Cleaned up {result.deleted_count} old trashed items")
@@ -360,12 +770,42 @@ class HackathonSyncManager:
             print(f"   {status}: {count}")
         print("="*60)
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Sync scraped hackathons into MongoDB')
+    parser.add_argument('--batch-size', type=int, nargs='?', const=DEFAULT_BATCH_SIZE, default=None,
+                        help=f'Use batched prefetch + bulk_write sync (default batch size: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--backfill-dedup-keys', action='store_true',
+                        help='Set dedupKey on existing documents and exit')
+    parser.add_argument('--backfill-categories', action='store_true',
+                        help='Classify documents with a missing or placeholder category and exit')
+    parser.add_argument('--status-mode', choices=STATUS_MODES, default=DEFAULT_STATUS_MODE,
+                        help='Recompute statuses in MongoDB (server) or by loading documents (python)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the scraped file item by item instead of loading it whole')
+    parser.add_argument('--input', default=SCRAPED_DATA_PATH,
+                        help='Scraped data file: JSON array or NDJSON (default: scripts/data/hackathons_dynamic.json)')
+    add_metrics_args(parser)
+    return parser.parse_args()
+
 def main():
     """Main function"""
+    args = parse_args()
     try:
         sync_manager = HackathonSyncManager()
-        sync_manager.sync_scraped_hackathons()
+        if args.backfill_dedup_keys:
+            sync_manager.backfill_dedup_keys(batch_size=args.batch_size or DEFAULT_BATCH_SIZE)
+            print("\n✅ Dedup key backfill completed!")
+            return
+        if args.backfill_categories:
+            sync_manager.backfill_categories(batch_size=args.batch_size or DEFAULT_BATCH_SIZE)
+            print("\n✅ Category backfill completed!")
+            return
+        sync_manager.sync_scraped_hackathons(batch_size=args.batch_size, status_mode=args.status_mode,
+                                             stream=args.stream, data_path=args.input)
         print("\n✅ Sync completed successfully!")
+        sync_manager.metrics.print_summary()
+        sync_manager.metrics.write(args.metrics_json, args.metrics_prom)
     except KeyboardInterrupt:
         print("\n⚠️ Sync interrupted by user")
     except Exception as e:
@@ -373,5 +813,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    import re  # For regex in duplicate checking
     main()
\ No newline at end of file
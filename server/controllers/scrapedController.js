@@ -6,11 +6,161 @@ const {
     ErrorHandler
 } = require('../utils/errorHandler');
 
+// Paged, partitioned copy of the scraped feed written by the Python scrapers (scripts/scrape_export.py)
+const EXPORT_DIR = path.join(process.cwd(), '..', 'scripts', 'data', 'hackathons_export');
+
+const readJson = (filePath) => JSON.parse(fs.readFileSync(filePath, 'utf8'));
+
+// The scraped API's ?search predicate, shared by the bundle and the full-file paths
+const matchesSearch = (hackathon, query) =>
+    hackathon.title.toLowerCase().includes(query) ||
+    (hackathon.description && hackathon.description.toLowerCase().includes(query)) ||
+    (hackathon.organizer && hackathon.organizer.toLowerCase().includes(query));
+
+// Token -> feed positions from the bundle's search_index.json, reloaded when the bundle changes
+let searchIndexCache = null;
+
+const loadSearchIndex = (manifest) => {
+    if (!searchIndexCache || searchIndexCache.generatedAt !== manifest.generatedAt) {
+        const index = readJson(path.join(EXPORT_DIR, manifest.searchIndex));
+        searchIndexCache = { generatedAt: manifest.generatedAt, tokens: Object.entries(index.tokens) };
+    }
+    return searchIndexCache.tokens;
+};
+
+// Sorted feed positions that can contain every word of the lowercased query, or null
+// when the query has no words. A substring match of the query puts each of its words
+// inside one indexed token, so this is a superset of the matches; callers re-check.
+const searchCandidates = (tokens, query) => {
+    const terms = query.split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+    if (terms.length === 0) {
+        return null;
+    }
+
+    let candidates = null;
+    for (const term of terms) {
+        const positions = new Set();
+        for (const [token, postings] of tokens) {
+            if (token.includes(term)) {
+                postings.forEach(position => positions.add(position));
+            }
+        }
+        candidates = candidates ? new Set([...candidates].filter(position => positions.has(position))) : positions;
+    }
+    return [...candidates].sort((a, b) => a - b);
+};
+
+// Records matching query, reading only the all/ pages that hold index candidates
+const searchExportBundle = (manifest, query) => {
+    const positions = searchCandidates(loadSearchIndex(manifest), query);
+    if (!positions) {
+        return null;
+    }
+
+    const matches = [];
+    let loadedPage = 0;
+    let records = [];
+    for (const position of positions) {
+        const n = Math.floor(position / manifest.pageSize) + 1;
+        if (n !== loadedPage) {
+            records = readJson(path.join(EXPORT_DIR, 'all', `page-${n}.json`));
+            loadedPage = n;
+        }
+        const hackathon = records[position - (n - 1) * manifest.pageSize];
+        if (matchesSearch(hackathon, query)) {
+            matches.push(hackathon);
+        }
+    }
+    return matches;
+};
+
+// Answer a page from the export bundle by reading only the page files it covers.
+// Returns null when the bundle is missing or can't answer the query (search combined
+// with a filter, several filters), so the caller falls back to filtering the full JSON file.
+const getFromExportBundle = ({ page, limit, search, category, status, location }) => {
+    const pageNumber = parseInt(page);
+    const pageLimit = parseInt(limit);
+    const filters = Object.entries({ status, category, location }).filter(([, value]) => value);
+    if ((search && (typeof search !== 'string' || filters.length > 0)) || filters.length > 1 ||
+        !(pageNumber >= 1) || !(pageLimit >= 1)) {
+        return null;
+    }
+
+    try {
+        const manifest = readJson(path.join(EXPORT_DIR, 'manifest.json'));
+        const startIndex = (pageNumber - 1) * pageLimit;
+        const endIndex = startIndex + pageLimit;
+        let hackathons = [];
+        let count = manifest.total;
+
+        if (search) {
+            if (!manifest.searchIndex) {
+                return null;
+            }
+            const matches = searchExportBundle(manifest, search.toLowerCase());
+            if (!matches) {
+                return null;
+            }
+            hackathons = matches.slice(startIndex, endIndex);
+            count = matches.length;
+        } else {
+            let dir = path.join(EXPORT_DIR, 'all');
+
+            if (filters.length === 1) {
+                const [field, value] = filters[0];
+                const query = value.toLowerCase();
+                const partitions = manifest.partitions[field] || {};
+                // Status and category match exactly; location is a substring match, which one
+                // partition only answers when no other location contains the query too
+                const keys = field === 'location'
+                    ? Object.keys(partitions).filter(key => key.includes(query))
+                    : Object.keys(partitions).filter(key => key === query);
+                if (keys.length > 1) {
+                    return null;
+                }
+                if (keys.length === 1) {
+                    dir = path.join(EXPORT_DIR, field, partitions[keys[0]].slug);
+                    count = partitions[keys[0]].count;
+                } else {
+                    count = 0;
+                }
+            }
+
+            const firstPage = Math.floor(startIndex / manifest.pageSize) + 1;
+            const lastPage = Math.ceil(Math.min(endIndex, count) / manifest.pageSize);
+            for (let n = firstPage; n <= lastPage; n++) {
+                const offset = (n - 1) * manifest.pageSize;
+                const records = readJson(path.join(dir, `page-${n}.json`));
+                hackathons.push(...records.slice(Math.max(startIndex - offset, 0), endIndex - offset));
+            }
+        }
+
+        return {
+            hackathons,
+            totalCount: count,
+            currentPage: pageNumber,
+            totalPages: Math.ceil(count / pageLimit),
+            hasNextPage: endIndex < count,
+            hasPrevPage: startIndex > 0,
+            source: 'scraped',
+            lastUpdated: manifest.lastUpdated || new Date().toISOString()
+        };
+    } catch (error) {
+        // No bundle yet, or it was swapped out mid-read
+        return null;
+    }
+};
+
 // @desc    Get scraped hackathons from JSON file
 // @route   GET /api/hackathons/scraped
 // @access  Public
 const getScrapedHackathons = asyncHandler(async (req, res) => {
     try {
+        const fromBundle = getFromExportBundle({ page: 1, limit: 10, ...req.query });
+        if (fromBundle) {
+            return sendSuccessResponse(res, fromBundle, 'Scraped hackathons retrieved successfully');
+        }
+
         // Path to scraped data file
         const dataPath = path.join(process.cwd(), '..', 'scripts', 'data', 'hackathons_dynamic.json');
         const simplePath = path.join(process.cwd(), '..', 'data', 'hackathons_simple.json');
@@ -55,11 +205,8 @@ const getScrapedHackathons = asyncHandler(async (req, res) => {
 
         // Apply search filter
         if (search) {
-            filteredData = filteredData.filter(hackathon =>
-                hackathon.title.toLowerCase().includes(search.toLowerCase()) ||
-                (hackathon.description && hackathon.description.toLowerCase().includes(search.toLowerCase())) ||
-                (hackathon.organizer && hackathon.organizer.toLowerCase().includes(search.toLowerCase()))
-            );
+            const query = search.toLowerCase();
+            filteredData = filteredData.filter(hackathon => matchesSearch(hackathon, query));
         }
 
         // Apply category filter
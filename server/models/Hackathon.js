@@ -261,12 +261,16 @@ hackathonSchema.index({ tags: 1 });
 hackathonSchema.index({ 'location.type': 1 });
 hackathonSchema.index({ createdAt: -1 });
 
-// Text index for search functionality
+// Text index for search functionality; scrape_unstop.py creates the same index
+// (TEXT_INDEX_NAME / TEXT_INDEX_WEIGHTS) and MongoDB allows only one per collection
 hackathonSchema.index({
     title: 'text',
     description: 'text',
     organizer: 'text',
     tags: 'text'
+}, {
+    name: 'hackathon_text_search',
+    weights: { title: 10, tags: 5, organizer: 3, description: 1 }
 });
 
 // Pre-save middleware
@@ -0,0 +1,15 @@
+"""Shared fixtures: the scrapers import each other from scripts/, benchmarks/ has the corpus and mock server"""
+import os
+import sys
+
+import mongomock
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for path in ('benchmarks', 'scripts', ''):
+    sys.path.insert(0, os.path.join(ROOT, path))
+
+
+@pytest.fixture
+def mongo_client():
+    return mongomock.MongoClient()
@@ -0,0 +1,35 @@
+import json
+import re
+
+from corpus import build_scraped_records
+from scrape_export import write_export_bundle
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_bundle_is_written_from_a_single_pass(tmp_path):
+    records = build_scraped_records(23)
+    records[3]['category'] = 'AI ML'
+    records[5]['category'] = 'AI/ML'
+    manifest = write_export_bundle(iter(records), str(tmp_path), page_size=5)
+    bundle = tmp_path / 'hackathons_export'
+
+    assert manifest['total'] == 23 and manifest['pages'] == 5
+    assert [record for page in range(1, 6) for record in read(bundle / 'all' / f'page-{page}.json')] == records
+
+    categories = manifest['partitions']['category']
+    assert {categories['ai ml']['slug'], categories['ai/ml']['slug']} == {'ai-ml', 'ai-ml-2'}
+    for field, entries in manifest['partitions'].items():
+        for value, entry in entries.items():
+            pages = [read(bundle / field / entry['slug'] / f'page-{page}.json') for page in range(1, entry['pages'] + 1)]
+            assert sum(len(page) for page in pages) == entry['count']
+            assert all(len(page) == 5 for page in pages[:-1])
+
+    tokens = read(bundle / 'search_index.json')['tokens']
+    assert len(tokens) == manifest['tokenCount']
+    word = re.findall(r'\w+', records[7]['title'].lower())[0]
+    assert 7 in tokens[word]
+    assert tokens[word] == sorted(tokens[word])
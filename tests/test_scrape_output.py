@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from corpus import build_scraped_records
+from scrape_output import SIMPLE_FIELDS, HackathonStreamWriter, iter_ndjson_file
+
+
+def test_close_renames_the_part_file_and_derives_the_json_files(tmp_path):
+    records = build_scraped_records(25)
+    writer = HackathonStreamWriter(str(tmp_path), simple_fields=SIMPLE_FIELDS, fsync_every=10)
+    for record in records:
+        writer.write(record)
+
+    # Until close() only the in-progress stream exists
+    assert sorted(os.listdir(tmp_path)) == ['hackathons_dynamic.ndjson.part']
+    assert list(iter_ndjson_file(writer.part_path)) == records
+
+    writer.close()
+    writer.close()
+
+    assert not os.path.exists(writer.part_path)
+    assert list(iter_ndjson_file(writer.ndjson_path)) == records
+    with open(tmp_path / 'hackathons_dynamic.json', encoding='utf-8') as f:
+        assert json.load(f) == records
+    with open(tmp_path / 'hackathons_simple.json', encoding='utf-8') as f:
+        assert json.load(f) == [{field: record.get(field) for field in SIMPLE_FIELDS} for record in records]
+    with open(tmp_path / 'hackathons_export' / 'manifest.json', encoding='utf-8') as f:
+        assert json.load(f)['total'] == 25
+
+
+def test_a_failed_scrape_keeps_the_part_file_and_the_previous_output(tmp_path):
+    with HackathonStreamWriter(str(tmp_path), export_bundle=False) as writer:
+        writer.write({'id': 1, 'title': 'AI Hack'})
+
+    with pytest.raises(RuntimeError):
+        with HackathonStreamWriter(str(tmp_path), export_bundle=False) as writer:
+            writer.write({'id': 2, 'title': 'Web Jam'})
+            raise RuntimeError('scrape crashed')
+
+    assert list(iter_ndjson_file(writer.part_path)) == [{'id': 2, 'title': 'Web Jam'}]
+    with open(tmp_path / 'hackathons_dynamic.json', encoding='utf-8') as f:
+        assert json.load(f) == [{'id': 1, 'title': 'AI Hack'}]
@@ -0,0 +1,148 @@
+import pytest
+
+from corpus import build_listing_html
+from mock_server import serve_directory
+from scrape_checkpoint import ScrapeCheckpoint
+from scrape_unstop import UnstopScraper
+
+
+@pytest.fixture
+def site(tmp_path):
+    """Local listing server; write(cards) replaces the page it serves"""
+    directory = tmp_path / 'site'
+    directory.mkdir()
+
+    class Site:
+        def write(self, cards):
+            (directory / 'hackathons.html').write_bytes(build_listing_html(cards))
+
+    with serve_directory(directory) as base_url:
+        site = Site()
+        site.url = f'{base_url}/hackathons.html'
+        yield site
+
+
+def make_scraper(mongo_client, cache_dir=None, checkpoint=None):
+    scraper = UnstopScraper(requests_per_second=1000, cache_dir=cache_dir, client=mongo_client)
+    scraper.fetch_details = False
+    scraper.checkpoint = checkpoint
+    return scraper
+
+
+def stored(mongo_client, **query):
+    return mongo_client['hackathon-hub'].hackathons.count_documents(query)
+
+
+def test_save_changes_tombstones_hackathons_no_longer_listed(mongo_client, site):
+    site.write(20)
+    make_scraper(mongo_client).run(site.url, save_mode='incremental')
+    assert stored(mongo_client, source='unstop') == 20
+
+    # The first 15 cards are unchanged, the last 5 disappeared
+    site.write(15)
+    scraper = make_scraper(mongo_client)
+    scraper.run(site.url, save_mode='incremental')
+
+    assert len(scraper.unchanged_fingerprints) == 15
+    assert stored(mongo_client) == 20
+    assert stored(mongo_client, removedAt={'$exists': True}, status='cancelled') == 5
+
+    # Listed again, they come back to life
+    site.write(20)
+    make_scraper(mongo_client).run(site.url, save_mode='incremental')
+    assert stored(mongo_client, removedAt={'$exists': True}) == 0
+
+
+def test_save_changes_keeps_missing_hackathons_on_a_partial_listing(mongo_client, site):
+    site.write(20)
+    make_scraper(mongo_client).run(site.url, save_mode='incremental')
+
+    scraper = make_scraper(mongo_client)
+    scraper.max_cards = 10
+    scraper.run(site.url, save_mode='incremental')
+
+    assert not scraper.listing_complete
+    assert stored(mongo_client, removedAt={'$exists': True}) == 0
+
+
+def test_save_changes_refuses_generated_hackathons(mongo_client):
+    scraper = make_scraper(mongo_client)
+    scraper.load_fingerprints()
+    assert scraper.save_changes(scraper.generate_realistic_hackathons()) is False
+    assert stored(mongo_client) == 0
+
+
+def test_failed_save_is_retried_on_an_unchanged_listing(mongo_client, site, tmp_path):
+    site.write(20)
+    cache_dir = str(tmp_path / 'cache')
+    failing = make_scraper(mongo_client, cache_dir)
+    failing.save_changes = lambda hackathons: False
+    failing.run(site.url, save_mode='incremental')
+
+    retry = make_scraper(mongo_client, cache_dir)
+    retry.run(site.url, save_mode='incremental')
+    assert not retry.listing_unchanged
+    assert stored(mongo_client) == 20
+
+    skipped = make_scraper(mongo_client, cache_dir)
+    skipped.run(site.url, save_mode='incremental')
+    assert skipped.listing_unchanged
+
+
+def test_resume_saves_checkpointed_cards_of_an_unchanged_listing(mongo_client, site, tmp_path):
+    site.write(20)
+    cache_dir = str(tmp_path / 'cache')
+    checkpoint_path = str(tmp_path / 'checkpoints.sqlite3')
+    with ScrapeCheckpoint('unstop', checkpoint_path) as checkpoint:
+        make_scraper(mongo_client, cache_dir, checkpoint).run(site.url, save_mode='incremental')
+    mongo_client['hackathon-hub'].hackathons.delete_many({})
+
+    # A run parses the listing, checkpoints its cards and crashes before saving;
+    # the cached listing is still marked saved by the first run
+    with ScrapeCheckpoint('unstop', checkpoint_path) as checkpoint:
+        crashed = make_scraper(mongo_client, cache_dir, checkpoint)
+        crashed.load_fingerprints()
+        crashed.http_cache.is_saved = lambda url, body: False
+        assert len(crashed.scrape_hackathons(site.url)) == 20
+        assert checkpoint.count('card') == 20
+
+    with ScrapeCheckpoint('unstop', checkpoint_path, resume=True) as checkpoint:
+        resumed = make_scraper(mongo_client, cache_dir, checkpoint)
+        resumed.run(site.url, save_mode='incremental')
+        assert not resumed.listing_unchanged
+        assert stored(mongo_client) == 20
+        assert checkpoint.count() == 0
+
+
+def test_unchanged_listing_leaves_the_checkpoint_alone(mongo_client, site, tmp_path):
+    site.write(20)
+    cache_dir = str(tmp_path / 'cache')
+    checkpoint_path = str(tmp_path / 'checkpoints.sqlite3')
+    make_scraper(mongo_client, cache_dir).run(site.url, save_mode='incremental')
+
+    with ScrapeCheckpoint('unstop', checkpoint_path) as checkpoint:
+        checkpoint.put('detail', 'some-hash', {'title': 'AI Hack'})
+        scraper = make_scraper(mongo_client, cache_dir, checkpoint)
+        scraper.run(site.url, save_mode='incremental')
+        assert scraper.listing_unchanged
+        assert checkpoint.count() == 1
+
+
+def test_save_changes_reports_keys_held_by_another_source(mongo_client, site, tmp_path):
+    site.write(20)
+    cache_dir = str(tmp_path / 'cache')
+    make_scraper(mongo_client, cache_dir).run(site.url, save_mode='incremental')
+    hackathons = mongo_client['hackathon-hub'].hackathons
+    hackathons.update_one({}, {'$set': {'source': 'manual'}})
+
+    scraper = make_scraper(mongo_client, cache_dir)
+    scraper.http_cache.is_saved = lambda url, body: False
+    assert scraper.save_changes(scraper.scrape_hackathons(site.url)) is False
+    assert hackathons.count_documents({'source': 'manual'}) == 1
+
+    # run() survives the rejected upsert and leaves the listing to be retried
+    cache_dir = str(tmp_path / 'fresh-cache')
+    make_scraper(mongo_client, cache_dir).run(site.url, save_mode='incremental')
+    retry = make_scraper(mongo_client, cache_dir)
+    retry.run(site.url, save_mode='incremental')
+    assert not retry.listing_unchanged
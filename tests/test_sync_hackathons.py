@@ -0,0 +1,151 @@
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import InsertOne
+
+from fingerprints import make_dedup_key
+from sync_hackathons import HackathonSyncManager, iter_json_array
+
+
+def scraped(title, venue='Online', days=10, **fields):
+    start = datetime.now() + timedelta(days=days)
+    record = {
+        'title': title,
+        'location': {'type': 'online', 'venue': venue},
+        'startDate': start.strftime('%Y-%m-%d'),
+        'endDate': (start + timedelta(days=2)).strftime('%Y-%m-%d'),
+        'scraped_at': '2026-10-01 12:00:00',
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def manager(mongo_client):
+    return HackathonSyncManager(client=mongo_client)
+
+
+def new_stats():
+    return {'new_hackathons': 0, 'updated_hackathons': 0, 'duplicates_skipped': 0, 'status_updates': 0}
+
+
+def trash(manager, title, venue='Online'):
+    """Store a trashed document holding the dedupKey of (title, venue)"""
+    doc = manager.build_mongo_doc(title, scraped(title, venue=venue))
+    doc['status'] = 'trashed'
+    manager.hackathons_collection.insert_one(doc)
+
+
+def test_sync_in_batches_inserts_and_dedupes_within_a_window(manager):
+    stats = new_stats()
+    hackathons = [
+        scraped('AI Hack', prize='₹10,000'),
+        scraped('  AI Hack  ', prize='₹20,000'),
+        scraped('Web Jam', venue='Mumbai'),
+        scraped(''),
+    ]
+    manager.sync_in_batches(hackathons, stats, batch_size=10)
+
+    docs = {doc['dedupKey']: doc for doc in manager.hackathons_collection.find()}
+    assert len(docs) == 2
+    # The repeat updates the pending insert, as a sequential update_one would
+    assert docs[make_dedup_key('AI Hack', {'venue': 'Online'})]['prize'] == '₹20,000'
+    assert stats['new_hackathons'] == 2
+    assert stats['updated_hackathons'] == 1
+
+
+def test_sync_in_batches_updates_stored_hackathons_across_windows(manager):
+    manager.sync_in_batches([scraped('AI Hack', prize='₹10,000'), scraped('Web Jam')], new_stats(), batch_size=1)
+
+    stats = new_stats()
+    manager.sync_in_batches([scraped('AI Hack', prize='₹50,000'), scraped('Web Jam')], stats, batch_size=1)
+
+    assert manager.hackathons_collection.count_documents({}) == 2
+    assert manager.hackathons_collection.find_one({'title': 'AI Hack'})['prize'] == '₹50,000'
+    assert stats == {'new_hackathons': 0, 'updated_hackathons': 1, 'duplicates_skipped': 1, 'status_updates': 0}
+
+
+def test_sync_in_batches_counts_keys_held_by_trashed_documents_as_duplicates(manager):
+    trash(manager, 'AI Hack')
+    stats = new_stats()
+    manager.sync_in_batches([scraped('AI Hack', prize='₹1,000'), scraped('AI Hack', prize='₹2,000'), scraped('Web Jam')],
+                            stats, batch_size=10)
+
+    assert stats == {'new_hackathons': 1, 'updated_hackathons': 0, 'duplicates_skipped': 2, 'status_updates': 0}
+    assert manager.hackathons_collection.count_documents({'title': 'AI Hack'}) == 1
+
+
+def test_sync_in_batches_matches_one_by_one(mongo_client):
+    hackathons = [scraped(f'Hack {i % 7}', venue=['Online', 'Pune'][i % 2], prize=f'₹{i}000') for i in range(30)]
+    batched, sequential = HackathonSyncManager(client=mongo_client), HackathonSyncManager(client=type(mongo_client)())
+    for manager in (batched, sequential):
+        trash(manager, 'Hack 3', venue='Pune')
+        trash(manager, 'Hack 4')
+    batched_stats, sequential_stats = new_stats(), new_stats()
+
+    batched.sync_in_batches(hackathons, batched_stats, batch_size=4)
+    sequential.sync_one_by_one(hackathons, sequential_stats)
+
+    def stored(manager):
+        return sorted((doc['dedupKey'], doc.get('prize')) for doc in manager.hackathons_collection.find())
+    assert stored(batched) == stored(sequential)
+    assert batched_stats == sequential_stats
+
+
+def test_apply_bulk_skips_keys_already_stored(manager):
+    doc = manager.build_mongo_doc('AI Hack', scraped('AI Hack'))
+    manager.hackathons_collection.insert_one(dict(doc))
+
+    # The unique dedupKey index rejects the repeat; the other insert still lands
+    failed = manager.apply_bulk([InsertOne(dict(doc)), InsertOne(manager.build_mongo_doc('Web Jam', scraped('Web Jam')))])
+
+    assert failed == {0}
+    assert manager.apply_bulk([]) == set()
+
+    assert sorted(manager.hackathons_collection.distinct('title')) == ['AI Hack', 'Web Jam']
+
+
+def test_server_status_recompute_matches_python(mongo_client):
+    now = datetime(2026, 10, 17, 12)
+    day = timedelta(days=1)
+    cases = [
+        {'startDate': now + 5 * day, 'endDate': now + 7 * day, 'registrationDeadline': now + 3 * day},
+        {'startDate': now - day, 'endDate': now + day, 'registrationDeadline': now + day},
+        {'startDate': now - day, 'endDate': now + day, 'registrationDeadline': now - 2 * day},
+        {'startDate': now - 5 * day, 'endDate': now - 3 * day, 'registrationDeadline': now + day},
+        {'startDate': now + 2 * day, 'endDate': now + 4 * day},
+        {'startDate': now - 2 * day, 'endDate': now + 4 * day},
+        {'startDate': '2026-01-01', 'endDate': '2026-01-02'},
+        {'startDate': now - 9 * day, 'endDate': now - 8 * day, 'status': 'trashed'},
+    ]
+    statuses = {}
+    for mode in ('server', 'python'):
+        manager = HackathonSyncManager(client=type(mongo_client)())
+        manager.hackathons_collection.insert_many(
+            [dict(case, title=f'case {i}', status=case.get('status', 'upcoming')) for i, case in enumerate(cases)]
+        )
+        recompute = manager.recompute_statuses_on_server if mode == 'server' else manager.recompute_statuses_in_python
+        statuses[mode] = (recompute(now), {doc['title']: doc['status'] for doc in manager.hackathons_collection.find()})
+
+    assert statuses['server'] == statuses['python']
+    assert statuses['server'][1]['case 2'] == 'registration_closed'
+    assert statuses['server'][1]['case 7'] == 'trashed'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64 * 1024])
+def test_iter_json_array_across_chunk_boundaries(chunk_size):
+    items = [{'title': 'AI Hack', 'tags': ['ai', 'ml']}, 12345, 'a "quoted" ₹ string', [], None, 6.5, {}]
+    text = ' [\n' + ',\n  '.join(json.dumps(item, ensure_ascii=False) for item in items) + '\n] '
+    assert list(iter_json_array(io.StringIO(text), chunk_size)) == items
+
+
+def test_iter_json_array_keeps_numbers_split_across_chunks():
+    assert list(iter_json_array(io.StringIO('[1234567,89]'), chunk_size=3)) == [1234567, 89]
+
+
+@pytest.mark.parametrize('text', ['[{"a": 1},', '{"a": 1}', '[{"a": ]'])
+def test_iter_json_array_rejects_bad_input(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))